@@ -6,14 +6,16 @@ warnings.filterwarnings("ignore", category=Warning, module="urllib3")
 import typer
 import requests
 from rich.console import Console
+from rich.markup import escape
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 from zettelkasten.core.config import Config
 from zettelkasten.core.workflow import AddWorkflow, ImportWorkflow
 from zettelkasten.generators.index_generator import IndexGenerator
 from zettelkasten.generators.orphan_generator import OrphanNoteGenerator
 from zettelkasten.utils.orphan_finder import OrphanFinder
+from zettelkasten.utils.search_index import MATCH_END, MATCH_START, get_search_index
 
 app = typer.Typer(help="Zettelkasten CLI - Generate and manage your knowledge base")
 console = Console()
@@ -345,23 +347,92 @@ def seed(
 
 @app.command()
 def add(
-    url: str = typer.Argument(..., help="URL to process (YouTube, podcast, or article)"),
+    urls: Optional[List[str]] = typer.Argument(
+        None, help="URL(s) to process (YouTube, podcast, or article)"
+    ),
+    from_file: Optional[Path] = typer.Option(
+        None,
+        "--from-file",
+        "-i",
+        help="Read URLs from a file (one per line, # for comments)",
+    ),
     force: bool = typer.Option(
         False,
         "--force",
         "-f",
         help="Force reprocessing even if already exists",
     ),
+    resume: bool = typer.Option(
+        False,
+        "--resume",
+        "-r",
+        help="List and continue unfinished (failed or interrupted) adds",
+    ),
+    fetch_workers: int = typer.Option(
+        2, "--fetch-workers", help="Batch mode: concurrent downloads/extractions"
+    ),
+    transcribe_workers: Optional[int] = typer.Option(
+        None,
+        "--transcribe-workers",
+        help="Batch mode: concurrent transcriptions (default: TRANSCRIPTION_WORKERS)",
+    ),
+    llm_workers: int = typer.Option(
+        2, "--llm-workers", help="Batch mode: URLs in the Claude/note-writing stage at once"
+    ),
 ) -> None:
     """
     Add content from a URL to your Zettelkasten.
 
     Supports YouTube videos, podcast episodes (Apple/Spotify), and blog articles.
+
+    With several URLs (or --from-file), they are processed as a pipeline:
+    downloads, transcription and Claude calls for different URLs overlap.
+
+    Completed stages are checkpointed: re-adding a URL whose earlier run
+    failed resumes after the last completed stage.
+
+    Examples:
+        zk add https://youtube.com/watch?v=...
+        zk add URL1 URL2 URL3
+        zk add --from-file backlog.txt --llm-workers 3
+        zk add --resume
     """
     try:
         # Load configuration
         config = Config.from_env()
 
+        all_urls = []
+        if resume:
+            from zettelkasten.core.jobs import JobStore
+
+            jobs = JobStore(config).incomplete()
+            if not jobs and not urls and not from_file:
+                console.print("[green]No unfinished adds to resume[/green]")
+                return
+
+            if jobs:
+                console.print(f"\n[bold cyan]Resuming {len(jobs)} unfinished add(s):[/bold cyan]")
+                for job in jobs:
+                    console.print(f"  • {job.title or job.url}")
+                    console.print(f"    [dim]{job.url} — completed: {job.state}[/dim]")
+                    if job.error:
+                        console.print(f"    [red]Last error: {job.error.splitlines()[0][:100]}[/red]")
+                all_urls.extend(job.url for job in jobs)
+
+        all_urls.extend(urls or [])
+        if from_file:
+            for line in from_file.read_text().splitlines():
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    all_urls.append(line)
+        # Drop repeats (the same URL twice in one batch would be processed twice)
+        all_urls = list(dict.fromkeys(all_urls))
+
+        if not all_urls:
+            console.print("[bold red]Error:[/bold red] No URLs given")
+            console.print("Use: zk add <url> [<url> ...] or zk add --from-file urls.txt")
+            raise typer.Exit(1)
+
         # Validate API key
         if not config.anthropic_api_key or config.anthropic_api_key == "your_anthropic_api_key_here":
             console.print(
@@ -370,9 +441,13 @@ def add(
             console.print("Please add your Anthropic API key to the .env file")
             raise typer.Exit(1)
 
+        if len(all_urls) > 1:
+            _add_batch(config, all_urls, force, fetch_workers, transcribe_workers, llm_workers)
+            return
+
         # Create workflow and process URL
         workflow = AddWorkflow(config)
-        saved_paths = workflow.process_url(url, force=force)
+        saved_paths = workflow.process_url(all_urls[0], force=force)
 
         # Display results
         console.print("\n[bold green]Success![/bold green]")
@@ -384,6 +459,8 @@ def add(
         console.print(f"\n[dim]Staging location: {config.get_staging_path()}[/dim]")
         console.print("[yellow]Review and edit the notes, then run 'zk approve' to add them to your vault.[/yellow]")
 
+    except typer.Exit:
+        raise
     except ValueError as e:
         console.print(f"[bold red]Error:[/bold red] {e}")
         raise typer.Exit(1)
@@ -393,6 +470,49 @@ def add(
         raise typer.Exit(1)
 
 
+def _add_batch(
+    config: Config,
+    urls: List[str],
+    force: bool,
+    fetch_workers: int,
+    transcribe_workers: Optional[int],
+    llm_workers: int,
+) -> None:
+    """Run several URLs through the add pipeline and print a summary."""
+    import time
+    from zettelkasten.core.pipeline import AddPipeline
+
+    pipeline = AddPipeline(
+        config,
+        fetch_workers=fetch_workers,
+        text_workers=transcribe_workers or max(1, config.transcription_workers),
+        notes_workers=llm_workers,
+    )
+
+    console.print(f"\n[bold cyan]Processing {len(urls)} URLs[/bold cyan]\n")
+    started = time.monotonic()
+    items = pipeline.run(urls, force=force)
+    elapsed = time.monotonic() - started
+
+    succeeded = [item for item in items if item.ok]
+    failed = [item for item in items if not item.ok]
+    note_count = sum(len(item.saved_paths) for item in succeeded)
+
+    console.print(f"\n[bold green]Done in {elapsed:.0f}s[/bold green]")
+    console.print(f"  {len(succeeded)} URL(s) processed, {note_count} notes in staging")
+    if failed:
+        console.print(f"\n[bold red]{len(failed)} URL(s) failed:[/bold red]")
+        for item in failed:
+            console.print(f"  [red]✗[/red] {item.url}")
+            console.print(f"    [dim]{item.error.splitlines()[0] if item.error else ''}[/dim]")
+
+    console.print(f"\n[dim]Staging location: {config.get_staging_path()}[/dim]")
+    console.print("[yellow]Review and edit the notes, then run 'zk approve' to add them to your vault.[/yellow]")
+
+    if failed:
+        raise typer.Exit(1)
+
+
 @app.command()
 def new(
     title: str = typer.Argument(..., help="Title for the new note"),
@@ -716,6 +836,13 @@ def approve(
             except Exception as e:
                 console.print(f"[yellow]⚠[/yellow] Warning: Could not rebuild indices: {e}")
 
+        # Pick up moved and merged notes in the search index
+        if approved_count > 0 or deleted_count > 0:
+            try:
+                get_search_index(config.vault_path).refresh()
+            except Exception as e:
+                console.print(f"[yellow]⚠[/yellow] Warning: Could not update search index: {e}")
+
     except Exception as e:
         console.print(f"[bold red]Error:[/bold red] {e}")
         raise typer.Exit(1)
@@ -857,6 +984,113 @@ def index() -> None:
         raise typer.Exit(1)
 
 
+@app.command()
+def search(
+    query: List[str] = typer.Argument(
+        ...,
+        help='Search terms; "quoted phrase", prefix* and -excluded words are supported',
+    ),
+    limit: int = typer.Option(
+        20,
+        "--limit",
+        "-n",
+        help="Maximum number of results",
+    ),
+    folder: Optional[str] = typer.Option(
+        None,
+        "--folder",
+        "-f",
+        help="Only search one top-level vault folder (e.g. permanent-notes, sources)",
+    ),
+) -> None:
+    """
+    Full-text search over note titles, tags, bodies and transcripts.
+
+    The search index lives in the vault's cache directory and is updated
+    incrementally before each search (only changed files are re-read).
+
+    Examples:
+        zk search growth mindset
+        zk search '"growth mindset"'            # Exact phrase
+        zk search 'habit*' --folder permanent-notes
+        zk search -- compounding -finance       # Exclude a word
+    """
+    try:
+        config = Config.from_env()
+        search_index = get_search_index(config.vault_path)
+
+        with console.status("[dim]Updating search index...[/dim]"):
+            search_index.refresh()
+        results = search_index.search(" ".join(query), limit=limit, folder=folder)
+
+        if not results:
+            console.print("[yellow]No matches.[/yellow]")
+            return
+
+        for result in results:
+            snippet = " ".join(escape(result.snippet).split())
+            snippet = snippet.replace(MATCH_START, "[bold yellow]").replace(MATCH_END, "[/bold yellow]")
+            console.print(f"[bold]{escape(result.title)}[/bold]  [dim]{escape(result.path)}[/dim]")
+            console.print(f"  {snippet}\n")
+
+        console.print(f"[dim]{len(results)} result(s)[/dim]")
+
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        raise typer.Exit(1)
+
+
+@app.command()
+def semantic(
+    query: Optional[List[str]] = typer.Argument(
+        None,
+        help="Text to find similar concepts for (omit to just update the index)",
+    ),
+    limit: int = typer.Option(
+        10,
+        "--limit",
+        "-n",
+        help="Maximum number of results",
+    ),
+) -> None:
+    """
+    Update the local semantic index of permanent notes, or search it.
+
+    Notes are embedded on the CPU with EMBEDDING_MODEL (only new or changed
+    notes are embedded again). With SEMANTIC_INDEX=true, concept matching
+    and related-concept suggestions use this index and only ask Claude when
+    the answer isn't clear. Needs: pip install 'zettelkasten-cli[semantic]'
+
+    Examples:
+        zk semantic                         # build/update the index
+        zk semantic habit formation -n 5    # concepts closest in meaning
+    """
+    try:
+        from zettelkasten.utils.semantic_index import get_semantic_index
+
+        config = Config.from_env()
+        semantic_index = get_semantic_index(config)
+
+        with console.status("[dim]Updating semantic index...[/dim]"):
+            embedded = semantic_index.refresh()
+        console.print(
+            f"[green]✓[/green] {len(semantic_index)} note(s) indexed ({embedded} embedded now)"
+        )
+
+        if query:
+            matches = semantic_index.similar_to_text(" ".join(query), k=limit)
+            if not matches:
+                console.print("[yellow]No notes indexed.[/yellow]")
+                return
+            console.print()
+            for match in matches:
+                console.print(f"  [cyan]{match.score:.2f}[/cyan]  {escape(match.title)}  [dim]{escape(match.path)}[/dim]")
+
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        raise typer.Exit(1)
+
+
 @app.command()
 def process_inbox(
     delete: bool = typer.Option(
@@ -865,6 +1099,12 @@ def process_inbox(
         "-d",
         help="Delete processed files instead of archiving them",
     ),
+    workers: Optional[int] = typer.Option(
+        None,
+        "--workers",
+        "-w",
+        help="Files to import at once (default: IMPORT_WORKERS; 1 = one by one)",
+    ),
 ) -> None:
     """
     Process notes from the inbox folder into your Zettelkasten.
@@ -872,6 +1112,7 @@ def process_inbox(
     Analyzes each note, finds related concepts from your existing KB,
     adds proper formatting and links, then saves as a permanent note.
     Processed files are archived by default (or deleted with --delete).
+    Files are imported concurrently; a file that fails stays in the inbox.
     """
     try:
         # Load configuration
@@ -886,17 +1127,38 @@ def process_inbox(
             raise typer.Exit(1)
 
         # Create workflow and process inbox
+        import time
+
         workflow = ImportWorkflow(config)
-        results = workflow.process_inbox(archive=not delete)
+        started = time.monotonic()
+        results = workflow.process_inbox(
+            archive=not delete,
+            workers=workers if workers is not None else config.import_workers,
+        )
+        elapsed = time.monotonic() - started
 
         # Display summary
         processed_count = len(results["processed"])
         failed_count = len(results["failed"])
+        if not results["results"]:
+            return
+
+        succeeded = [r for r in results["results"] if r.ok]
+        sources = sum(1 for r in succeeded if r.note_type == "source")
+        notes_written = sum(len(r.saved_paths) for r in succeeded)
 
         console.print("\n[bold green]Processing Complete![/bold green]\n")
-        console.print(f"Successfully processed: [green]{processed_count}[/green] file(s)")
+        console.print(
+            f"Successfully processed: [green]{processed_count}[/green] file(s) "
+            f"({processed_count - sources} concept, {sources} source) in {elapsed:.0f}s"
+        )
+        console.print(f"Notes written: {notes_written}")
         if failed_count > 0:
-            console.print(f"Failed: [red]{failed_count}[/red] file(s)")
+            console.print(f"Failed: [red]{failed_count}[/red] file(s) (left in the inbox)")
+            for result in results["results"]:
+                if not result.ok:
+                    console.print(f"  [red]✗[/red] {result.filepath.relative_to(config.get_inbox_path())}")
+                    console.print(f"    [dim]{(result.error or '').splitlines()[0] if result.error else ''}[/dim]")
 
         if processed_count > 0:
             console.print(f"\n[dim]Notes saved to: {config.get_permanent_notes_path()}[/dim]")
@@ -998,6 +1260,79 @@ def config(
         console.print("Use --show to display current configuration")
 
 
+@app.command()
+def cache(
+    action: str = typer.Argument(
+        "stats",
+        help="Cache action: stats, prune, or clear",
+    ),
+    max_age_days: Optional[float] = typer.Option(
+        None,
+        "--max-age-days",
+        help="Remove responses older than this many days (for 'prune'; default: LLM_CACHE_TTL_DAYS)",
+    ),
+    max_mb: Optional[int] = typer.Option(
+        None,
+        "--max-mb",
+        help="Evict least recently used responses down to this size (for 'prune'; default: LLM_CACHE_MAX_MB)",
+    ),
+) -> None:
+    """
+    Inspect and prune the Claude response cache.
+
+    Examples:
+        zk cache                          # Show cache statistics
+        zk cache prune                    # Remove expired entries and enforce the size limit
+        zk cache prune --max-age-days 7   # Remove responses older than a week
+        zk cache clear                    # Remove every cached response
+    """
+    from datetime import datetime
+    from zettelkasten.processors.llm_cache import get_response_cache
+
+    try:
+        config = Config.from_env()
+        response_cache = get_response_cache(config)
+
+        if action == "stats":
+            stats = response_cache.stats()
+            console.print("[bold]Claude Response Cache[/bold]\n")
+            console.print(f"Location: [cyan]{response_cache.db_path}[/cyan]")
+            console.print(f"Enabled: {'[green]yes[/green]' if config.llm_cache_enabled else '[yellow]no[/yellow]'}")
+            console.print(f"Entries: {stats['entries']}")
+            console.print(f"Size: {stats['bytes'] / (1024 * 1024):.1f} MB (limit: {config.llm_cache_max_mb or 'none'} MB)")
+            console.print(f"Hits: {stats['hits']}")
+            console.print(f"Expired: {stats['expired']} (TTL: {config.llm_cache_ttl_days or 'none'} days)")
+            if stats["oldest"]:
+                oldest = datetime.fromtimestamp(stats["oldest"]).strftime("%Y-%m-%d %H:%M")
+                newest = datetime.fromtimestamp(stats["newest"]).strftime("%Y-%m-%d %H:%M")
+                console.print(f"Oldest: {oldest}")
+                console.print(f"Newest: {newest}")
+            if stats["models"]:
+                console.print("\n[bold]By model:[/bold]")
+                for model, count in stats["models"].items():
+                    console.print(f"  {model}: {count}")
+
+        elif action == "prune":
+            max_bytes = max_mb * 1024 * 1024 if max_mb is not None else None
+            removed = response_cache.prune(max_age_days=max_age_days, max_bytes=max_bytes)
+            console.print(f"[green]✓[/green] Removed {removed} cached response(s)")
+
+        elif action == "clear":
+            removed = response_cache.clear()
+            console.print(f"[green]✓[/green] Cleared {removed} cached response(s)")
+
+        else:
+            console.print(f"[bold red]Error:[/bold red] Unknown action '{action}'")
+            console.print("\nSupported actions: stats, prune, clear")
+            raise typer.Exit(1)
+
+    except typer.Exit:
+        raise
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        raise typer.Exit(1)
+
+
 @app.command()
 def vault(
     action: str = typer.Argument(
@@ -8,6 +8,30 @@ from dotenv import load_dotenv
 
 from zettelkasten.utils.project_root import find_project_root
 
+# Name of the hidden directory (inside the vault) holding derived caches such as
+# the note metadata catalog. Everything in it can be deleted and rebuilt.
+CACHE_DIRNAME = ".zk-cache"
+
+
+def cache_dir_for(vault_path: Path) -> Path:
+    """
+    Return the cache directory for a vault, creating it if needed.
+
+    The directory gets its own .gitignore so that `zk vault commit` never picks
+    up cache files.
+
+    Args:
+        vault_path: Path to the vault root directory
+
+    Returns:
+        Path to the cache directory
+    """
+    cache_dir = vault_path / CACHE_DIRNAME
+    if not cache_dir.exists():
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        (cache_dir / ".gitignore").write_text("*\n")
+    return cache_dir
+
 
 class Config(BaseModel):
     """Application configuration."""
@@ -21,6 +45,80 @@ class Config(BaseModel):
         description="Local Whisper model size (tiny, base, small, medium, large)",
     )
 
+    transcription_workers: int = Field(
+        default=1,
+        description="Whisper worker processes kept warm for transcription (0 = transcribe in-process)",
+    )
+
+    transcription_segment_seconds: int = Field(
+        default=600,
+        description="Split long audio at silences into segments of about this length, transcribed in parallel across workers and passed on as each finishes (0 = off)",
+    )
+
+    # LLM Request Configuration
+    llm_max_concurrency: int = Field(
+        default=4,
+        description="Maximum number of Claude requests in flight at once",
+    )
+    llm_requests_per_minute: int = Field(
+        default=50,
+        description="Claude request budget per minute (0 disables the limit)",
+    )
+    llm_input_tokens_per_minute: int = Field(
+        default=0,
+        description="Estimated Claude input token budget per minute (0 disables the limit)",
+    )
+    llm_max_retries: int = Field(
+        default=5,
+        description="Retries for rate-limited or transiently failing Claude requests",
+    )
+
+    llm_cache_enabled: bool = Field(
+        default=True,
+        description="Reuse cached Claude responses for identical requests",
+    )
+    llm_cache_ttl_days: float = Field(
+        default=30,
+        description="Days before a cached Claude response expires (0 = never)",
+    )
+    llm_cache_max_mb: int = Field(
+        default=200,
+        description="Maximum size of the Claude response cache in MB (0 = unlimited)",
+    )
+
+    import_workers: int = Field(
+        default=4,
+        description="Inbox files imported concurrently by `zk process-inbox`",
+    )
+
+    # Semantic index (optional, needs sentence-transformers)
+    semantic_index_enabled: bool = Field(
+        default=False,
+        description="Match and relate concepts with a local embedding index instead of asking Claude when the answer is clear",
+    )
+    embedding_model: str = Field(
+        default="sentence-transformers/all-MiniLM-L6-v2",
+        description="sentence-transformers model used for the semantic index (runs on the CPU)",
+    )
+
+    # Web UI Configuration
+    web_add_workers: int = Field(
+        default=1,
+        description="URLs the web UI processes at once; further /add-url submissions wait in the job queue",
+    )
+    web_handler_threads: int = Field(
+        default=16,
+        description="Threads running web UI page handlers (file reads, markdown rendering) concurrently",
+    )
+    web_render_cache_mb: int = Field(
+        default=64,
+        description="Memory budget in MB for rendered note pages cached by the web UI (0 = off)",
+    )
+    web_search_refresh_seconds: float = Field(
+        default=60,
+        description="Minimum seconds between web UI rescans of the vault for files changed outside the app",
+    )
+
     # Podcast Configuration
     podcast_rss_feed: str = Field(
         default="",
@@ -113,6 +211,22 @@ class Config(BaseModel):
         return cls(
             anthropic_api_key=os.getenv("ANTHROPIC_API_KEY", ""),
             whisper_model_size=os.getenv("WHISPER_MODEL_SIZE", "base"),
+            transcription_workers=int(os.getenv("TRANSCRIPTION_WORKERS", "1")),
+            transcription_segment_seconds=int(os.getenv("TRANSCRIPTION_SEGMENT_SECONDS", "600")),
+            llm_max_concurrency=int(os.getenv("LLM_MAX_CONCURRENCY", "4")),
+            llm_requests_per_minute=int(os.getenv("LLM_REQUESTS_PER_MINUTE", "50")),
+            llm_input_tokens_per_minute=int(os.getenv("LLM_INPUT_TOKENS_PER_MINUTE", "0")),
+            llm_max_retries=int(os.getenv("LLM_MAX_RETRIES", "5")),
+            llm_cache_enabled=os.getenv("LLM_CACHE_ENABLED", "true").lower() not in ("0", "false", "no"),
+            llm_cache_ttl_days=float(os.getenv("LLM_CACHE_TTL_DAYS", "30")),
+            llm_cache_max_mb=int(os.getenv("LLM_CACHE_MAX_MB", "200")),
+            import_workers=int(os.getenv("IMPORT_WORKERS", "4")),
+            semantic_index_enabled=os.getenv("SEMANTIC_INDEX", "false").lower() in ("1", "true", "yes"),
+            embedding_model=os.getenv("EMBEDDING_MODEL", "sentence-transformers/all-MiniLM-L6-v2"),
+            web_add_workers=int(os.getenv("WEB_ADD_WORKERS", "1")),
+            web_handler_threads=int(os.getenv("WEB_HANDLER_THREADS", "16")),
+            web_render_cache_mb=int(os.getenv("WEB_RENDER_CACHE_MB", "64")),
+            web_search_refresh_seconds=float(os.getenv("WEB_SEARCH_REFRESH_SECONDS", "60")),
             podcast_rss_feed=os.getenv("PODCAST_RSS_FEED", ""),
             vault_name=os.getenv("VAULT_NAME", "Your Zettelkasten"),
             vault_path=vault_path,
@@ -153,6 +267,10 @@ class Config(BaseModel):
         (self.vault_path / "staging" / "concepts").mkdir(parents=True, exist_ok=True)
         (self.vault_path / "staging" / "sources").mkdir(parents=True, exist_ok=True)
 
+    def get_cache_path(self) -> Path:
+        """Get path to the vault's cache directory (derived data, safe to delete)."""
+        return cache_dir_for(self.vault_path)
+
     def get_permanent_notes_path(self) -> Path:
         """Get path to permanent notes directory."""
         return self.vault_path / "permanent-notes"
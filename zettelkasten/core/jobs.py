@@ -0,0 +1,283 @@
+"""Checkpoints for `zk add` so a failed run can resume where it stopped.
+
+Each URL being added gets a job directory under the vault cache holding the
+artifacts of every completed stage:
+
+    job.json        url, state, error, timestamps
+    content.json    ProcessedContent (title, metadata, audio path, ...)
+    transcript.txt  text content
+    concepts.json   extracted concepts
+    summary.md      source summary
+
+States advance fetched -> transcribed -> extracted/summarized -> completed.
+A rerun of the same URL loads the artifacts it already has instead of
+re-downloading, re-transcribing or re-asking Claude. Completed jobs are
+removed; failed ones keep their artifacts and the error until resumed.
+"""
+
+import hashlib
+import json
+import shutil
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterator, List, Optional
+
+from zettelkasten.core.config import Config
+from zettelkasten.core.models import Concept, ProcessedContent
+from zettelkasten.utils.fileio import atomic_write_text
+
+
+# Stages in the order they complete ("extracted" and "summarized" may finish
+# in either order, they run concurrently)
+STAGES = ["created", "fetched", "transcribed", "extracted", "summarized", "completed"]
+
+
+class AddJob:
+    """Checkpointed state of one URL being added."""
+
+    def __init__(self, directory: Path):
+        """
+        Open a job directory (see JobStore.open).
+
+        Args:
+            directory: Job directory containing job.json
+        """
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._data = self._read_json("job.json") or {}
+
+    @property
+    def url(self) -> str:
+        return self._data.get("url", "")
+
+    @property
+    def state(self) -> str:
+        """Last completed stage."""
+        done = self._data.get("stages", [])
+        return max(done, key=STAGES.index) if done else "created"
+
+    @property
+    def error(self) -> Optional[str]:
+        return self._data.get("error")
+
+    @property
+    def created_at(self) -> Optional[datetime]:
+        value = self._data.get("created_at")
+        return datetime.fromisoformat(value) if value else None
+
+    @property
+    def updated_at(self) -> Optional[datetime]:
+        value = self._data.get("updated_at")
+        return datetime.fromisoformat(value) if value else None
+
+    @property
+    def title(self) -> Optional[str]:
+        return self._data.get("title")
+
+    def has(self, stage: str) -> bool:
+        """Whether a stage has completed."""
+        return stage in self._data.get("stages", [])
+
+    # Artifacts
+
+    def save_content(self, content: ProcessedContent) -> None:
+        """Checkpoint the fetched content."""
+        self._write_json("content.json", content.model_dump(mode="json"))
+        self._advance("fetched", title=content.title)
+
+    def load_content(self) -> Optional[ProcessedContent]:
+        """
+        Load the fetched content, if it is still usable.
+
+        Returns:
+            ProcessedContent, or None if not fetched yet or the downloaded audio
+            it needs for transcription has since been deleted
+        """
+        if not self.has("fetched"):
+            return None
+        data = self._read_json("content.json")
+        if data is None:
+            return None
+        content = ProcessedContent.model_validate(data)
+        if (
+            not content.text_content
+            and not self.has("transcribed")
+            and (not content.audio_file or not content.audio_file.exists())
+        ):
+            return None
+        return content
+
+    def save_text(self, text: str) -> None:
+        """Checkpoint the text content (article text or transcript)."""
+        self._write_text("transcript.txt", text)
+        self._advance("transcribed")
+
+    def load_text(self) -> Optional[str]:
+        """Load the checkpointed text content, if any."""
+        return self._read_text("transcript.txt") if self.has("transcribed") else None
+
+    def save_concepts(self, concepts: List[Concept]) -> None:
+        """Checkpoint the extracted concepts."""
+        self._write_json("concepts.json", [c.model_dump(mode="json") for c in concepts])
+        self._advance("extracted")
+
+    def load_concepts(self) -> Optional[List[Concept]]:
+        """Load the checkpointed concepts, if any."""
+        if not self.has("extracted"):
+            return None
+        data = self._read_json("concepts.json")
+        return [Concept.model_validate(c) for c in data] if data is not None else None
+
+    def save_summary(self, summary: str) -> None:
+        """Checkpoint the generated summary."""
+        self._write_text("summary.md", summary)
+        self._advance("summarized")
+
+    def load_summary(self) -> Optional[str]:
+        """Load the checkpointed summary, if any."""
+        return self._read_text("summary.md") if self.has("summarized") else None
+
+    # State transitions
+
+    @contextmanager
+    def recording_errors(self) -> Iterator[None]:
+        """Record an exception raised inside the block on the job, then re-raise it."""
+        try:
+            yield
+        except Exception as e:
+            with self._lock:
+                self._data["error"] = str(e) or type(e).__name__
+                self._save()
+            raise
+
+    def complete(self) -> None:
+        """Mark the job completed and delete its artifacts."""
+        self._advance("completed")
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _start(self, url: str) -> None:
+        """Initialize a new job."""
+        with self._lock:
+            self._data = {
+                "url": url,
+                "stages": ["created"],
+                "error": None,
+                "created_at": datetime.now().isoformat(timespec="seconds"),
+            }
+            self._save()
+
+    def _advance(self, stage: str, **fields: Any) -> None:
+        """Mark a stage completed (clearing any earlier error)."""
+        with self._lock:
+            stages = self._data.setdefault("stages", [])
+            if stage not in stages:
+                stages.append(stage)
+            self._data.update(fields)
+            self._data["error"] = None
+            self._save()
+
+    def _save(self) -> None:
+        self._data["updated_at"] = datetime.now().isoformat(timespec="seconds")
+        self._write_json("job.json", self._data)
+
+    # File helpers (writes are atomic so a crash never leaves a half-written
+    # artifact behind)
+
+    def _write_text(self, name: str, text: str) -> None:
+        atomic_write_text(self.directory / name, text)
+
+    def _read_text(self, name: str) -> Optional[str]:
+        try:
+            return (self.directory / name).read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+    def _write_json(self, name: str, data: Any) -> None:
+        self._write_text(name, json.dumps(data, indent=2, ensure_ascii=False))
+
+    def _read_json(self, name: str) -> Any:
+        text = self._read_text(name)
+        if text is None:
+            return None
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError:
+            return None
+
+
+class JobStore:
+    """Job directories for `zk add`, one per URL, under the vault cache."""
+
+    def __init__(self, config: Config):
+        """
+        Initialize the store.
+
+        Args:
+            config: Application configuration
+        """
+        self.root = config.get_cache_path() / "jobs"
+
+    def open(self, url: str, restart: bool = False) -> AddJob:
+        """
+        Get the job for a URL, creating it if there is none.
+
+        Args:
+            url: URL being added
+            restart: Discard any checkpoints from an earlier run
+
+        Returns:
+            AddJob for the URL
+        """
+        directory = self._job_dir(url)
+        if restart and directory.exists():
+            shutil.rmtree(directory, ignore_errors=True)
+
+        directory.mkdir(parents=True, exist_ok=True)
+        job = AddJob(directory)
+        if not job.url:
+            job._start(url)
+        return job
+
+    def get(self, url: str) -> Optional[AddJob]:
+        """
+        Get the existing job for a URL.
+
+        Args:
+            url: URL being added
+
+        Returns:
+            AddJob, or None if the URL has no unfinished job
+        """
+        directory = self._job_dir(url)
+        if not (directory / "job.json").exists():
+            return None
+        return AddJob(directory)
+
+    def incomplete(self) -> List[AddJob]:
+        """
+        List unfinished jobs, oldest first.
+
+        Returns:
+            Jobs that have not completed
+        """
+        if not self.root.exists():
+            return []
+
+        jobs = []
+        for directory in self.root.iterdir():
+            if not (directory / "job.json").exists():
+                continue
+            job = AddJob(directory)
+            if job.url and not job.has("completed"):
+                jobs.append(job)
+
+        return sorted(jobs, key=lambda job: job.created_at or datetime.min)
+
+    def discard(self, job: AddJob) -> None:
+        """Delete a job and its artifacts."""
+        shutil.rmtree(job.directory, ignore_errors=True)
+
+    def _job_dir(self, url: str) -> Path:
+        return self.root / hashlib.sha256(url.encode("utf-8")).hexdigest()[:16]
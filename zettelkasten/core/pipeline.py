@@ -0,0 +1,198 @@
+"""Pipelined batch processing of many URLs.
+
+`AddWorkflow.process_url` handles one URL from start to finish. For a backlog
+of URLs the stages use different resources (network for downloads, CPU for
+Whisper, the Claude API for extraction), so `AddPipeline` runs them as
+separate stages connected by bounded queues: while URL N is being
+transcribed, URL N+1 is downloading and URL N-1 is talking to Claude.
+Throughput approaches that of the slowest stage.
+"""
+
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, List, Optional
+
+from rich.console import Console
+
+from zettelkasten.core.config import Config
+from zettelkasten.core.models import ProcessedContent
+from zettelkasten.core.workflow import AddWorkflow
+
+console = Console()
+
+# Marks the end of the input on a stage queue
+_DONE = object()
+
+
+@dataclass
+class PipelineItem:
+    """A URL moving through the pipeline, and its outcome."""
+
+    index: int
+    url: str
+    content: Optional[ProcessedContent] = None
+    text_content: Optional[str] = None
+    saved_paths: List[Path] = field(default_factory=list)
+    error: Optional[str] = None
+    started: float = field(default_factory=time.monotonic)
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class AddPipeline:
+    """Process many URLs through fetch -> text -> notes stages concurrently."""
+
+    def __init__(
+        self,
+        config: Config,
+        fetch_workers: int = 2,
+        text_workers: int = 1,
+        notes_workers: int = 2,
+        queue_size: int = 2,
+    ):
+        """
+        Initialize the pipeline.
+
+        Args:
+            config: Application configuration
+            fetch_workers: Threads downloading/extracting content
+            text_workers: Threads transcribing audio (transcription itself runs
+                          in the shared Whisper worker pool)
+            notes_workers: Threads extracting concepts, summarizing and writing notes
+            queue_size: Maximum items waiting between two stages, so a fast
+                        stage can't run far ahead (e.g. fill the disk with audio)
+        """
+        self.config = config
+        self.fetch_workers = max(1, fetch_workers)
+        self.text_workers = max(1, text_workers)
+        self.notes_workers = max(1, notes_workers)
+        self.queue_size = max(1, queue_size)
+        self._local = threading.local()
+
+    def run(self, urls: List[str], force: bool = False) -> List[PipelineItem]:
+        """
+        Process every URL and wait for all of them to finish.
+
+        A failure affects only its own URL; the rest of the batch continues.
+
+        Args:
+            urls: URLs to process
+            force: Force reprocessing even if already exists
+
+        Returns:
+            One PipelineItem per URL, in input order
+        """
+        items = [PipelineItem(index=i, url=url) for i, url in enumerate(urls)]
+        total = len(items)
+
+        text_queue: "queue.Queue" = queue.Queue(maxsize=self.queue_size)
+        notes_queue: "queue.Queue" = queue.Queue(maxsize=self.queue_size)
+        input_queue: "queue.Queue" = queue.Queue()
+        for item in items:
+            input_queue.put(item)
+
+        def fetch(item: PipelineItem) -> None:
+            item.content = self._workflow().fetch_content(item.url, force=force)
+            console.print(
+                f"[green]✓[/green] [{item.index + 1}/{total}] Fetched: {item.content.title}"
+            )
+
+        def get_text(item: PipelineItem) -> None:
+            item.text_content = self._workflow().get_text(item.content)
+            console.print(
+                f"[green]✓[/green] [{item.index + 1}/{total}] Text ready "
+                f"({len(item.text_content)} characters): {item.content.title}"
+            )
+
+        def create_notes(item: PipelineItem) -> None:
+            item.saved_paths = self._workflow().create_notes(
+                item.content, item.text_content, item.url
+            )
+            console.print(
+                f"[green]✓[/green] [{item.index + 1}/{total}] Created {len(item.saved_paths)} "
+                f"notes: {item.content.title}"
+            )
+
+        stages = [
+            self._start_stage(
+                fetch, input_queue, text_queue, self.fetch_workers, self.text_workers, total
+            ),
+            self._start_stage(
+                get_text, text_queue, notes_queue, self.text_workers, self.notes_workers, total
+            ),
+            self._start_stage(create_notes, notes_queue, None, self.notes_workers, 0, total),
+        ]
+        # All input is queued up front; one end marker per fetch worker
+        for _ in range(self.fetch_workers):
+            input_queue.put(_DONE)
+
+        for threads in stages:
+            for thread in threads:
+                thread.join()
+
+        return items
+
+    def _start_stage(
+        self,
+        work: Callable[[PipelineItem], None],
+        inbox: "queue.Queue",
+        outbox: "Optional[queue.Queue]",
+        workers: int,
+        next_workers: int,
+        total: int,
+    ) -> List[threading.Thread]:
+        """
+        Start the worker threads of one stage.
+
+        Workers take items from inbox, run work on them and pass them on to
+        outbox (blocking while it is full). Failed items skip the remaining
+        stages. When the last worker of a stage sees the end of its input it
+        sends one end marker per worker of the next stage.
+        """
+        remaining = [workers]
+        lock = threading.Lock()
+
+        def loop() -> None:
+            while True:
+                item = inbox.get()
+                if item is _DONE:
+                    break
+
+                try:
+                    work(item)
+                except Exception as e:
+                    item.error = str(e)
+                    console.print(
+                        f"[bold red]✗[/bold red] [{item.index + 1}/{total}] {item.url}: {e}"
+                    )
+
+                if outbox is not None and item.ok:
+                    outbox.put(item)
+                else:
+                    item.elapsed = time.monotonic() - item.started
+
+            with lock:
+                remaining[0] -= 1
+                last = remaining[0] == 0
+            if last and outbox is not None:
+                for _ in range(next_workers):
+                    outbox.put(_DONE)
+
+        threads = [threading.Thread(target=loop, daemon=True) for _ in range(workers)]
+        for thread in threads:
+            thread.start()
+        return threads
+
+    def _workflow(self) -> AddWorkflow:
+        """Per-thread AddWorkflow (processors are not shared between threads)."""
+        workflow = getattr(self._local, "workflow", None)
+        if workflow is None:
+            workflow = AddWorkflow(self.config)
+            self._local.workflow = workflow
+        return workflow
@@ -0,0 +1,55 @@
+"""Progress reporting from deep inside the add workflow.
+
+Processors call `report(...)` at interesting points (download bytes, audio
+transcribed, Claude calls finished) without knowing who is listening. A
+caller that wants the events wraps its work in `reporting(callback)`; the
+callback is held in a context variable, so concurrent jobs in different
+threads each receive only their own events. Code that fans work out to a
+thread pool should run each task with `contextvars.copy_context()` so the
+events still reach the caller (LLMRequestEngine.map does).
+
+Without a listener, `report` does nothing.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Optional
+
+
+ProgressCallback = Callable[[str, Dict[str, Any]], None]
+
+_listener: ContextVar[Optional[ProgressCallback]] = ContextVar("zk_progress_listener", default=None)
+
+
+def report(event: str, **data: Any) -> None:
+    """
+    Send a progress event to the current listener, if any.
+
+    Listener errors are swallowed: progress reporting must never break the work.
+
+    Args:
+        event: Event name (e.g. "download", "transcription", "llm_call")
+        **data: Event details
+    """
+    listener = _listener.get()
+    if listener is None:
+        return
+    try:
+        listener(event, data)
+    except Exception:
+        pass
+
+
+@contextmanager
+def reporting(callback: ProgressCallback) -> Iterator[None]:
+    """
+    Deliver progress events reported inside the block to `callback`.
+
+    Args:
+        callback: Called with (event, data) for every event
+    """
+    token = _listener.set(callback)
+    try:
+        yield
+    finally:
+        _listener.reset(token)
@@ -1,24 +1,31 @@
 """Main workflow orchestration for processing content into Zettelkasten."""
 
+import contextvars
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional, Tuple
 from datetime import datetime
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from zettelkasten.core.config import Config
-from zettelkasten.core.models import ContentType, ProcessedContent, ZettelNote
+from zettelkasten.core.jobs import AddJob, JobStore
+from zettelkasten.core.models import Concept, ContentType, ProcessedContent, ZettelNote
 from zettelkasten.utils.url_detector import detect_content_type, is_valid_url
 from zettelkasten.utils.vault_scanner import (
-    get_existing_concept_titles,
+    ConceptIndex,
     get_inbox_files,
     parse_markdown_note,
 )
+from zettelkasten.utils.vault_catalog import get_catalog, normalize_title
 from zettelkasten.processors.youtube_processor import YouTubeProcessor
 from zettelkasten.processors.article_processor import ArticleProcessor
 from zettelkasten.processors.transcription import TranscriptionService
-from zettelkasten.processors.concept_extractor import ConceptExtractor
+from zettelkasten.processors.concept_extractor import ConceptExtractor, guess_note_type
 from zettelkasten.generators.zettel_generator import ZettelGenerator
+from zettelkasten.utils.fileio import atomic_move
 
 
 console = Console()
@@ -36,75 +43,108 @@ class AddWorkflow:
         )
         self.concept_extractor = ConceptExtractor(config)
         self.zettel_generator = ZettelGenerator(config)
+        self.jobs = JobStore(config)
 
     def process_url(self, url: str, force: bool = False) -> List[Path]:
         """
         Process a URL and generate Zettelkasten notes.
 
+        Every completed stage is checkpointed, so if an earlier run for the
+        same URL failed, this one resumes after its last completed stage.
+
         Args:
             url: URL to process
-            force: Force reprocessing even if already exists
+            force: Force reprocessing even if already exists (also discards
+                   checkpoints of an earlier run)
 
         Returns:
             List of paths to generated notes
         """
-        # Validate URL
-        if not is_valid_url(url):
-            raise ValueError(f"Invalid URL: {url}")
-
-        # Check if URL has already been processed (unless force=True)
-        if not force:
-            existing = self._check_url_exists(url)
-            if existing:
-                raise ValueError(
-                    f"URL already processed. Found existing source note:\n"
-                    f"  {existing.relative_to(self.config.vault_path)}\n\n"
-                    f"Use --force to reprocess anyway."
-                )
+        self._validate_new_url(url, force)
+        job = self.jobs.open(url, restart=force)
 
         console.print(f"\n[bold cyan]Processing:[/bold cyan] {url}\n")
+        if job.state != "created":
+            console.print(f"[dim]Resuming earlier run (last completed stage: {job.state})[/dim]")
 
-        with Progress(
+        with job.recording_errors(), Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             console=console,
         ) as progress:
-            # Step 1: Detect content type
-            task = progress.add_task("Detecting content type...", total=None)
-            content_type, metadata = detect_content_type(url)
-            console.print(f"[green]✓[/green] Content type: {content_type.value}")
-            progress.remove_task(task)
-
-            # Step 2: Process content based on type
-            task = progress.add_task("Downloading/extracting content...", total=None)
-            processed_content = self._process_content(url, content_type, metadata)
-            console.print(f"[green]✓[/green] Content extracted: {processed_content.title}")
-            progress.remove_task(task)
-
-            # Step 3: Get text content (transcribe if needed)
-            task = progress.add_task("Getting text content...", total=None)
-            text_content = self._get_text_content(processed_content)
-            console.print(f"[green]✓[/green] Text ready ({len(text_content)} characters)")
-            progress.remove_task(task)
+            processed_content = job.load_content()
+            if processed_content is None:
+                processed_content = self._fetch_with_progress(url, progress)
+                job.save_content(processed_content)
+            else:
+                console.print(f"[green]✓[/green] Content extracted: {processed_content.title} [dim](checkpoint)[/dim]")
+
+            text_content = job.load_text()
+            concepts = job.load_concepts()
+            summary = None
+
+            audio_file = processed_content.audio_file
+            if text_content is not None:
+                console.print(f"[green]✓[/green] Text ready ({len(text_content)} characters) [dim](checkpoint)[/dim]")
+            elif (
+                not processed_content.text_content
+                and audio_file
+                and concepts is None
+                and self.transcription_service.find_cached_transcript(audio_file) is None
+            ):
+                # Steps 3-4: Transcribe and extract concepts together - extraction
+                # of early parts starts while later audio is still being transcribed
+                task = progress.add_task("Transcribing audio...", total=None)
+
+                def segment_texts():
+                    for segment in self.transcription_service.transcribe_stream(audio_file):
+                        minutes, seconds = divmod(int(segment["end"]), 60)
+                        progress.update(
+                            task, description=f"Transcribing audio and extracting concepts ({minutes}:{seconds:02d} done)..."
+                        )
+                        yield segment["text"]
+
+                def summarize(text: str) -> str:
+                    result = self.concept_extractor.generate_summary(text=text, title=processed_content.title)
+                    job.save_summary(result)
+                    return result
+
+                summary_future: List[Future] = []
+
+                def start_summary(text: str) -> None:
+                    # Step 5 starts as soon as the full text is known, alongside
+                    # the last extraction requests and the reduce step
+                    job.save_text(text)
+                    context = contextvars.copy_context()
+                    summary_future.append(summarizer.submit(context.run, summarize, text))
+
+                with ThreadPoolExecutor(max_workers=1) as summarizer:
+                    text_content, concepts = self.concept_extractor.extract_concepts_incremental(
+                        segment_texts(),
+                        title=processed_content.title,
+                        source_url=url,
+                        on_text=start_summary,
+                    )
+                    job.save_concepts(concepts)
+                    summary = summary_future[0].result()
+                console.print(f"[green]✓[/green] Text ready ({len(text_content)} characters)")
+                progress.remove_task(task)
+            else:
+                # Step 3: Get text content (article text or cached transcript)
+                task = progress.add_task("Getting text content...", total=None)
+                text_content = self._get_text_content(processed_content)
+                job.save_text(text_content)
+                console.print(f"[green]✓[/green] Text ready ({len(text_content)} characters)")
+                progress.remove_task(task)
 
-            # Step 4: Extract concepts
-            task = progress.add_task("Extracting concepts with GPT...", total=None)
-            concepts = self.concept_extractor.extract_concepts(
-                text=text_content,
-                title=processed_content.title,
-                source_url=url,
-            )
+            if summary is None:
+                # Steps 4-5: Extract concepts and generate summary (independent, run
+                # concurrently; whichever an earlier run already finished is reused)
+                task = progress.add_task("Extracting concepts and generating summary...", total=None)
+                concepts, summary = self._analyze(job, processed_content, text_content, url)
+                progress.remove_task(task)
             console.print(f"[green]✓[/green] Extracted {len(concepts)} concepts")
-            progress.remove_task(task)
-
-            # Step 5: Generate summary
-            task = progress.add_task("Generating summary...", total=None)
-            summary = self.concept_extractor.generate_summary(
-                text=text_content,
-                title=processed_content.title,
-            )
             console.print(f"[green]✓[/green] Summary generated")
-            progress.remove_task(task)
 
             # Step 6: Generate Zettelkasten notes
             task = progress.add_task("Creating Zettelkasten notes...", total=None)
@@ -131,6 +171,7 @@ class AddWorkflow:
                 raise
 
             progress.remove_task(task)
+            job.complete()
 
             # Cleanup if needed
             if processed_content.audio_file and processed_content.audio_file.exists():
@@ -138,6 +179,152 @@ class AddWorkflow:
 
         return saved_paths
 
+    def _fetch_with_progress(self, url: str, progress: Progress) -> ProcessedContent:
+        """Detect the content type and download/extract content (steps 1-2)."""
+        # Step 1: Detect content type
+        task = progress.add_task("Detecting content type...", total=None)
+        content_type, metadata = detect_content_type(url)
+        console.print(f"[green]✓[/green] Content type: {content_type.value}")
+        progress.remove_task(task)
+
+        # Step 2: Process content based on type
+        task = progress.add_task("Downloading/extracting content...", total=None)
+        processed_content = self._process_content(url, content_type, metadata)
+        console.print(f"[green]✓[/green] Content extracted: {processed_content.title}")
+        progress.remove_task(task)
+
+        return processed_content
+
+    def fetch_content(
+        self, url: str, force: bool = False, restart: Optional[bool] = None
+    ) -> ProcessedContent:
+        """
+        Validate a URL and download/extract its content (steps 1-2 of process_url).
+
+        Args:
+            url: URL to process
+            force: Force reprocessing even if already exists
+            restart: Discard checkpoints of an earlier run (default: same as force)
+
+        Returns:
+            ProcessedContent with article text or downloaded audio
+        """
+        self._validate_new_url(url, force)
+        job = self.jobs.open(url, restart=force if restart is None else restart)
+
+        content = job.load_content()
+        if content is None:
+            with job.recording_errors():
+                content_type, metadata = detect_content_type(url)
+                content = self._process_content(url, content_type, metadata)
+            job.save_content(content)
+        return content
+
+    def get_text(self, content: ProcessedContent) -> str:
+        """
+        Get the text of fetched content, transcribing audio if needed (step 3).
+
+        Args:
+            content: Content from fetch_content
+
+        Returns:
+            Text content
+        """
+        job = self.jobs.open(content.url)
+        text_content = job.load_text()
+        if text_content is None:
+            with job.recording_errors():
+                text_content = self._get_text_content(content)
+            job.save_text(text_content)
+        return text_content
+
+    def create_notes(self, content: ProcessedContent, text_content: str, url: str) -> List[Path]:
+        """
+        Extract concepts, summarize and write notes to staging (steps 4-6).
+
+        Args:
+            content: Content from fetch_content
+            text_content: Text from get_text
+            url: Source URL
+
+        Returns:
+            List of paths to generated notes
+        """
+        job = self.jobs.open(url)
+        with job.recording_errors():
+            concepts, summary = self._analyze(job, content, text_content, url)
+            saved_paths = self.zettel_generator.generate_and_save_notes(
+                content=content,
+                summary=summary,
+                concepts=concepts,
+                source_url=url,
+                use_staging=True,
+            )
+        job.complete()
+
+        if content.audio_file and content.audio_file.exists():
+            self.youtube_processor.cleanup(content.audio_file)
+
+        return saved_paths
+
+    def _analyze(
+        self, job: AddJob, content: ProcessedContent, text_content: str, url: str
+    ) -> Tuple[List[Concept], str]:
+        """
+        Extract concepts and generate the summary, reusing checkpointed results.
+
+        Whatever is still missing runs concurrently and is checkpointed as soon
+        as it finishes, so a failure in one doesn't lose the other.
+
+        Returns:
+            Tuple of (concepts, summary)
+        """
+        def concepts() -> List[Concept]:
+            result = job.load_concepts()
+            if result is None:
+                result = self.concept_extractor.extract_concepts(
+                    text=text_content,
+                    title=content.title,
+                    source_url=url,
+                )
+                job.save_concepts(result)
+            return result
+
+        def summary() -> str:
+            result = job.load_summary()
+            if result is None:
+                result = self.concept_extractor.generate_summary(
+                    text=text_content,
+                    title=content.title,
+                )
+                job.save_summary(result)
+            return result
+
+        extracted, summarized = self.concept_extractor.engine.run_parallel(concepts, summary)
+        return extracted, summarized
+
+    def _validate_new_url(self, url: str, force: bool) -> None:
+        """
+        Raise ValueError if the URL is invalid or (unless force) already processed.
+
+        A URL with an unfinished job isn't "already processed" even if its
+        staging source note was written before the job failed: the run resumes
+        from its checkpoints instead.
+        """
+        # Validate URL
+        if not is_valid_url(url):
+            raise ValueError(f"Invalid URL: {url}")
+
+        # Check if URL has already been processed (unless force=True or resuming)
+        if not force and self.jobs.get(url) is None:
+            existing = self._check_url_exists(url)
+            if existing:
+                raise ValueError(
+                    f"URL already processed. Found existing source note:\n"
+                    f"  {existing.relative_to(self.config.vault_path)}\n\n"
+                    f"Use --force to reprocess anyway."
+                )
+
     def _process_content(
         self,
         url: str,
@@ -165,10 +352,16 @@ class AddWorkflow:
             # Already have text (article)
             return content.text_content
         elif content.audio_file:
-            # Need to transcribe audio
+            # Reuse an earlier transcript of the same audio if there is one
+            transcript = self.transcription_service.find_cached_transcript(content.audio_file)
+            if transcript is not None:
+                console.print("  [dim]Using cached transcript[/dim]")
+                return transcript.text
+
+            # Need to transcribe audio (part by part, so progress can be reported)
             console.print("  [dim]Transcribing audio (this may take a few minutes)...[/dim]")
-            transcript = self.transcription_service.transcribe(content.audio_file)
-            return transcript.text
+            segments = self.transcription_service.transcribe_stream(content.audio_file)
+            return "".join(segment["text"] for segment in segments)
         else:
             raise ValueError("No text or audio content available")
 
@@ -182,8 +375,6 @@ class AddWorkflow:
         Returns:
             Path to existing source note if found, None otherwise
         """
-        import re
-
         # Normalize URL for comparison (remove trailing slashes, fragments, etc.)
         normalized_url = url.rstrip('/').split('#')[0].split('?')[0]
 
@@ -193,34 +384,32 @@ class AddWorkflow:
             self.config.get_staging_path() / "sources",
         ]
 
+        catalog = get_catalog(self.config.vault_path)
         for directory in search_dirs:
-            if not directory.exists():
-                continue
-
-            for note_file in directory.glob("*.md"):
-                try:
-                    content = note_file.read_text()
-
-                    # Extract frontmatter
-                    fm_match = re.match(r'^---\s*\n(.*?)\n---', content, re.DOTALL)
-                    if fm_match:
-                        frontmatter = fm_match.group(1)
-                        # Look for source or source_url in frontmatter
-                        for line in frontmatter.split('\n'):
-                            # Check both 'source:' and 'source_url:' (models.py writes it as 'source:')
-                            if line.startswith('source:') or line.startswith('source_url:'):
-                                existing_url = line.split(':', 1)[1].strip().strip('"\'')
-                                # Normalize existing URL for comparison
-                                normalized_existing = existing_url.rstrip('/').split('#')[0].split('?')[0]
-                                if normalized_existing == normalized_url:
-                                    return note_file
-                except Exception:
-                    # Skip files that can't be read
+            # The catalog has already parsed 'source:'/'source_url:' from the frontmatter
+            for record in catalog.get_notes(directory):
+                if not record.source_url:
                     continue
+                # Normalize existing URL for comparison
+                normalized_existing = record.source_url.rstrip('/').split('#')[0].split('?')[0]
+                if normalized_existing == normalized_url:
+                    return record.filepath
 
         return None
 
 
+@dataclass
+class ImportResult:
+    """Outcome of importing one inbox file."""
+
+    filepath: Path
+    ok: bool = False
+    note_type: Optional[str] = None
+    saved_paths: List[Path] = field(default_factory=list)
+    error: Optional[str] = None
+    elapsed: float = 0.0
+
+
 class ImportWorkflow:
     """Orchestrates the workflow for importing notes from inbox into Zettelkasten."""
 
@@ -229,86 +418,152 @@ class ImportWorkflow:
         self.concept_extractor = ConceptExtractor(config)
         self.zettel_generator = ZettelGenerator(config)
         self.config.ensure_directories()
-
-    def process_inbox(self, archive: bool = True) -> Dict[str, List[Path]]:
+        # Concepts created during the current process_inbox run (normalized
+        # title -> filename stem): the concept index used for matching doesn't
+        # include them, so two files introducing the same concept would
+        # otherwise both create it. Read and updated under ZettelGenerator.write_lock
+        self._created_concepts: Dict[str, str] = {}
+        # Per-step progress lines (off when files are imported concurrently)
+        self._verbose = True
+        # Note types classified up front by process_inbox, keyed by file path
+        self._note_types: Dict[Path, str] = {}
+
+    def process_inbox(self, archive: bool = True, workers: int = 1) -> Dict[str, Any]:
         """
         Process all markdown files in the inbox directory.
 
+        With several workers, files are imported concurrently (their Claude
+        calls overlap; writes into the vault are still serialized). A failing
+        file is reported and left in the inbox without affecting the others.
+
         Args:
             archive: If True, move processed files to an archive folder.
                     If False, delete them after processing.
+            workers: Number of files imported at once
 
         Returns:
-            Dict with 'processed' and 'failed' lists of file paths
+            Dict with 'processed' and 'failed' lists of file paths, and
+            'results' (an ImportResult per file, in inbox order)
         """
         inbox_files = get_inbox_files(self.config)
 
         if not inbox_files:
             console.print("[yellow]No files found in inbox.[/yellow]")
-            return {"processed": [], "failed": []}
+            return {"processed": [], "failed": [], "results": []}
 
+        workers = max(1, min(workers, len(inbox_files)))
         console.print(f"\n[bold cyan]Processing {len(inbox_files)} file(s) from inbox...[/bold cyan]\n")
 
-        processed = []
-        failed = []
+        # Index existing concepts once (for efficiency)
+        existing_concepts = ConceptIndex.build(self.config)
 
-        # Get existing concepts once (for efficiency)
-        existing_concepts = get_existing_concept_titles(self.config)
+        # Classify untyped notes up front, many per Claude request
+        self._note_types = self._classify_inbox(inbox_files)
+        self._created_concepts = {}
 
-        for filepath in inbox_files:
-            try:
+        if workers == 1:
+            results = []
+            for filepath in inbox_files:
                 console.print(f"\n[bold]Processing:[/bold] {filepath.name}")
-                result = self._process_single_note(filepath, existing_concepts)
-                if result:
-                    processed.append(filepath)
-                    console.print(f"[green]✓[/green] Successfully processed {filepath.name}")
-
-                    # Archive or delete the original file
-                    if archive:
-                        self._archive_file(filepath)
-                    else:
-                        filepath.unlink()
+                results.append(self._import_file(filepath, existing_concepts, archive))
+        else:
+            self._verbose = False
+            try:
+                results_by_path = {}
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = {
+                        executor.submit(self._import_file, filepath, existing_concepts, archive): filepath
+                        for filepath in inbox_files
+                    }
+                    for done, future in enumerate(as_completed(futures), 1):
+                        result = future.result()
+                        results_by_path[futures[future]] = result
+                        console.print(f"[dim][{done}/{len(inbox_files)}][/dim]", end=" ")
+                        self._print_result(result)
+                results = [results_by_path[filepath] for filepath in inbox_files]
+            finally:
+                self._verbose = True
+
+        return {
+            "processed": [r.filepath for r in results if r.ok],
+            "failed": [r.filepath for r in results if not r.ok],
+            "results": results,
+        }
+
+    def _import_file(self, filepath: Path, existing_concepts: ConceptIndex, archive: bool) -> ImportResult:
+        """Import one inbox file, archiving or deleting it on success. Never raises."""
+        result = ImportResult(filepath=filepath)
+        started = time.monotonic()
+        try:
+            result.ok = self._process_single_note(filepath, existing_concepts, result)
+            if result.ok:
+                # Archive or delete the original file
+                if archive:
+                    self._archive_file(filepath)
                 else:
-                    failed.append(filepath)
-                    console.print(f"[red]✗[/red] Failed to process {filepath.name}")
-
-            except Exception as e:
-                failed.append(filepath)
-                console.print(f"[red]✗[/red] Error processing {filepath.name}: {e}")
+                    filepath.unlink()
+            elif result.error is None:
+                result.error = "Empty content"
+        except Exception as e:
+            result.ok = False
+            result.error = str(e) or type(e).__name__
+
+        result.elapsed = time.monotonic() - started
+        if self._verbose:
+            self._print_result(result)
+        return result
+
+    def _print_result(self, result: ImportResult) -> None:
+        """Print the one-line outcome of importing a file."""
+        name = result.filepath.name
+        if result.ok:
+            console.print(f"[green]✓[/green] Successfully processed {name}")
+        elif result.error and result.error != "Empty content":
+            console.print(f"[red]✗[/red] Error processing {name}: {result.error}")
+        else:
+            console.print(f"[red]✗[/red] Failed to process {name}")
 
-        return {"processed": processed, "failed": failed}
+    def _log(self, message: str) -> None:
+        """Print a per-step progress line (sequential imports only)."""
+        if self._verbose:
+            console.print(message)
 
     def _process_single_note(
-        self, filepath: Path, existing_concepts: List[str]
+        self, filepath: Path, existing_concepts: ConceptIndex, result: Optional[ImportResult] = None
     ) -> bool:
         """
         Process a single note from inbox.
 
         Args:
             filepath: Path to the markdown file
-            existing_concepts: List of existing concept titles in KB
+            existing_concepts: Index of the existing concepts in KB
+            result: If given, filled in with the note type and saved paths
 
         Returns:
             True if successful, False otherwise
         """
+        result = result or ImportResult(filepath=filepath)
         # Parse the note
         parsed = parse_markdown_note(filepath)
         title = parsed["title"]
         content = parsed["content"]
 
         if not content:
-            console.print(f"  [yellow]Warning: Empty content in {filepath.name}[/yellow]")
+            self._log(f"  [yellow]Warning: Empty content in {filepath.name}[/yellow]")
             return False
 
         # Determine note type using hybrid approach
         note_type = self._determine_note_type(filepath, parsed, content, title)
-        console.print(f"  [dim]Detected as: {note_type}[/dim]")
+        self._log(f"  [dim]Detected as: {note_type}[/dim]")
+        result.note_type = note_type
 
         # Route to appropriate handler
         if note_type == "source":
-            return self._process_as_source(filepath, title, content, existing_concepts)
+            saved_paths = self._process_as_source(filepath, title, content, existing_concepts)
         else:
-            return self._process_as_concept(filepath, title, content, existing_concepts)
+            saved_paths = self._process_as_concept(filepath, title, content, existing_concepts)
+        result.saved_paths = saved_paths
+        return True
 
     def _determine_note_type(
         self, filepath: Path, parsed: Dict[str, str], content: str, title: str
@@ -319,7 +574,8 @@ class ImportWorkflow:
         Priority:
         1. Folder structure (inbox/concepts/ or inbox/sources/)
         2. Frontmatter metadata (type: concept/source)
-        3. Claude classification
+        3. Local heuristic (links, citations, length), when confident
+        4. Claude classification (done in batches up front by process_inbox)
 
         Args:
             filepath: Path to the file
@@ -330,6 +586,29 @@ class ImportWorkflow:
         Returns:
             Either "concept" or "source"
         """
+        note_type = (
+            self._declared_note_type(filepath, parsed)
+            or self._note_types.get(filepath)
+            or guess_note_type(title, content)
+        )
+        if note_type:
+            return note_type
+
+        # Use Claude to classify
+        self._log("  [dim]Classifying note with Claude...[/dim]")
+        return self.concept_extractor.classify_note(content, title)
+
+    def _declared_note_type(self, filepath: Path, parsed: Dict[str, str]) -> Optional[str]:
+        """
+        Get the note type given by the inbox folder or frontmatter, if any.
+
+        Args:
+            filepath: Path to the file
+            parsed: Parsed note data
+
+        Returns:
+            "concept", "source", or None if the note doesn't say
+        """
         inbox_path = self.config.get_inbox_path()
 
         # 1. Check folder structure
@@ -354,59 +633,99 @@ class ImportWorkflow:
         if "source" in parsed or "source_url" in parsed or "url" in parsed:
             return "source"
 
-        # 3. Use Claude to classify
-        console.print("  [dim]Classifying note with Claude...[/dim]")
-        return self.concept_extractor.classify_note(content, title)
+        return None
+
+    def _classify_inbox(self, inbox_files: List[Path]) -> Dict[Path, str]:
+        """
+        Classify every inbox note whose type isn't declared, batching the Claude calls.
+
+        Notes typed by folder, frontmatter or the local heuristic cost nothing;
+        the rest are sent to Claude several per request instead of one
+        request each.
+
+        Args:
+            inbox_files: Files about to be imported
+
+        Returns:
+            Dict of file path to "concept"/"source" for the notes Claude classified
+        """
+        undecided = []
+        for filepath in inbox_files:
+            try:
+                parsed = parse_markdown_note(filepath)
+            except Exception:
+                continue  # Reported when the file itself is imported
+            if not parsed["content"] or self._declared_note_type(filepath, parsed):
+                continue
+            if guess_note_type(parsed["title"], parsed["content"]):
+                continue
+            undecided.append((filepath, parsed["title"], parsed["content"]))
+
+        if not undecided:
+            return {}
+
+        console.print(f"[dim]Classifying {len(undecided)} note(s) with Claude...[/dim]")
+        try:
+            note_types = self.concept_extractor.classify_notes(
+                [(title, content) for _, title, content in undecided]
+            )
+        except Exception as e:
+            # Fall back to classifying each note as it is imported
+            console.print(f"[yellow]Warning: batch classification failed: {e}[/yellow]")
+            return {}
+        return {filepath: note_type for (filepath, _, _), note_type in zip(undecided, note_types)}
 
     def _process_as_concept(
-        self, filepath: Path, title: str, content: str, existing_concepts: List[str]
-    ) -> bool:
-        """Process note as a concept (current behavior)."""
+        self, filepath: Path, title: str, content: str, existing_concepts: ConceptIndex
+    ) -> List[Path]:
+        """Process note as a concept (current behavior). Returns the saved note path."""
         # Find related concepts using Claude
-        console.print("  [dim]Finding related concepts...[/dim]")
+        self._log("  [dim]Finding related concepts...[/dim]")
         related_concepts = self.concept_extractor.find_related_concepts(
             note_content=content, note_title=title, existing_concepts=existing_concepts
         )
 
         if related_concepts:
-            console.print(
+            self._log(
                 f"  [green]✓[/green] Found {len(related_concepts)} related concept(s)"
             )
         else:
-            console.print("  [dim]No related concepts found[/dim]")
+            self._log("  [dim]No related concepts found[/dim]")
 
         # Create a properly formatted permanent note
         note = self._create_permanent_note(
             title=title, content=content, related_concepts=related_concepts
         )
 
-        # Save the note
-        saved_path = self.zettel_generator.save_note(note)
-        console.print(
+        # Save the note (and make it the merge target for the same concept
+        # introduced by other files in this run)
+        with self.zettel_generator.write_lock:
+            saved_path = self.zettel_generator.save_note(note)
+            self._created_concepts[normalize_title(title)] = saved_path.stem
+        self._log(
             f"  [green]✓[/green] Saved to: {saved_path.relative_to(self.config.vault_path)}"
         )
 
-        return True
+        return [saved_path]
 
     def _process_as_source(
-        self, filepath: Path, title: str, content: str, existing_concepts: List[str]
-    ) -> bool:
-        """Process note as a source (extract concepts, generate summary)."""
-        console.print("  [dim]Extracting concepts from source...[/dim]")
-
-        # Extract concepts from the source content
-        concepts = self.concept_extractor.extract_concepts(
-            text=content,
-            title=title,
-            source_url="",  # No URL for imported sources
-            max_concepts=10,
+        self, filepath: Path, title: str, content: str, existing_concepts: ConceptIndex
+    ) -> List[Path]:
+        """Process note as a source (extract concepts, generate summary). Returns saved paths."""
+        self._log("  [dim]Extracting concepts and generating summary...[/dim]")
+
+        # Extract concepts and generate the summary concurrently
+        concepts, summary = self.concept_extractor.engine.run_parallel(
+            lambda: self.concept_extractor.extract_concepts(
+                text=content,
+                title=title,
+                source_url="",  # No URL for imported sources
+                max_concepts=10,
+            ),
+            lambda: self.concept_extractor.generate_summary(text=content, title=title),
         )
-        console.print(f"  [green]✓[/green] Extracted {len(concepts)} concept(s)")
-
-        # Generate summary
-        console.print("  [dim]Generating summary...[/dim]")
-        summary = self.concept_extractor.generate_summary(text=content, title=title)
-        console.print(f"  [green]✓[/green] Summary generated")
+        self._log(f"  [green]✓[/green] Extracted {len(concepts)} concept(s)")
+        self._log(f"  [green]✓[/green] Summary generated")
 
         # Create source note with ProcessedContent mock
         from zettelkasten.core.models import ContentType, ProcessedContent
@@ -419,19 +738,21 @@ class ImportWorkflow:
             metadata={"imported": True},
         )
 
-        # Generate and save notes
+        # Generate and save notes (only the file writes are serialized; concepts
+        # other imports in this run created are merged into, not duplicated)
         saved_paths = self.zettel_generator.generate_and_save_notes(
             content=processed_content,
             summary=summary,
             concepts=concepts,
             source_url="",
+            created_concepts=self._created_concepts,
         )
 
-        console.print(
+        self._log(
             f"  [green]✓[/green] Created {len(saved_paths)} note(s): 1 source + {len(concepts)} concepts"
         )
 
-        return True
+        return saved_paths
 
     def _create_permanent_note(
         self, title: str, content: str, related_concepts: List[str]
@@ -487,8 +808,5 @@ class ImportWorkflow:
         relative_path = filepath.relative_to(self.config.get_inbox_path())
         archive_path = archive_dir / relative_path
 
-        # Create parent directories if needed
-        archive_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Move the file
-        filepath.rename(archive_path)
+        # Move the file (atomic rename; creates parent directories if needed)
+        atomic_move(filepath, archive_path)
@@ -1,14 +1,18 @@
 """Generate index pages for concepts and sources."""
 
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
-import re
 from collections import defaultdict
 
 from zettelkasten.core.config import Config
 from zettelkasten.core.models import ContentType
 from zettelkasten.processors.concept_extractor import ConceptExtractor
+from zettelkasten.utils.fileio import atomic_write_text
+from zettelkasten.utils.vault_catalog import NoteRecord, get_catalog
+
+# A note whose description failed to generate is retried after this long
+DESCRIPTION_RETRY_SECONDS = 24 * 60 * 60
 
 
 class NoteMetadata:
@@ -22,6 +26,7 @@ class NoteMetadata:
         source_url: Optional[str] = None,
         created: Optional[str] = None,
         tags: Optional[List[str]] = None,
+        content_hash: Optional[str] = None,
     ):
         self.filepath = filepath
         self.title = title
@@ -29,6 +34,7 @@ class NoteMetadata:
         self.source_url = source_url
         self.created = created
         self.tags = tags or []
+        self.content_hash = content_hash
 
 
 class IndexGenerator:
@@ -39,6 +45,8 @@ class IndexGenerator:
         self.config.ensure_directories()
         # Initialize concept extractor for generating summaries
         self.concept_extractor = ConceptExtractor(config)
+        # Parsed note metadata, re-read only for files that changed
+        self.catalog = get_catalog(config.vault_path)
 
     def rebuild_indices(self) -> Dict[str, Path]:
         """
@@ -75,35 +83,26 @@ class IndexGenerator:
         """
         permanent_notes_dir = self.config.get_permanent_notes_path()
 
-        # Find all markdown files
-        note_files = list(permanent_notes_dir.glob("*.md"))
-
-        # Exclude all index files
-        note_files = [f for f in note_files if f.stem.upper() not in ["INDEX", "PEOPLE-INDEX", "PERSON-INDEX"]]
+        # Find all markdown files, excluding index files
+        records = [
+            r for r in self.catalog.get_notes(permanent_notes_dir)
+            if r.filepath.stem.upper() not in ["INDEX", "PEOPLE-INDEX", "PERSON-INDEX"]
+        ]
 
-        if not note_files:
+        if not records:
             return None
 
         # Parse all notes
         notes = []
-        for filepath in note_files:
-            metadata = self._parse_note_metadata(filepath)
+        for record in records:
+            metadata = self._record_to_metadata(record)
             if metadata:
                 notes.append(metadata)
 
         # Sort alphabetically by title
         notes.sort(key=lambda n: n.title.lower())
 
-        # Group by first letter
-        grouped_notes: Dict[str, List[NoteMetadata]] = defaultdict(list)
-        for note in notes:
-            first_letter = note.title[0].upper()
-            # Group numbers and special characters under '#'
-            if not first_letter.isalpha():
-                first_letter = "#"
-            grouped_notes[first_letter].append(note)
-
-        # Generate markdown content
+        # Generate markdown header
         lines = []
         lines.append("---")
         lines.append("title: Concept Index")
@@ -116,25 +115,9 @@ class IndexGenerator:
         lines.append(f"*{len(notes)} concepts*")
         lines.append("")
 
-        # Add alphabetical sections
-        for letter in sorted(grouped_notes.keys()):
-            lines.append(f"## {letter}")
-            lines.append("")
-            for note in grouped_notes[letter]:
-                # Create relative link to the note with description
-                relative_filename = note.filepath.stem
-
-                # Try to extract a brief description from the note content
-                description = self._extract_description(Path(note.filepath))
-                if description:
-                    lines.append(f"- **[[{relative_filename}|{note.title}]]**: {description}")
-                else:
-                    lines.append(f"- [[{relative_filename}|{note.title}]]")
-            lines.append("")
-
-        # Write index file
+        # Write index file (skipped if no letter section changed)
         index_path = permanent_notes_dir / "INDEX.md"
-        index_path.write_text("\n".join(lines))
+        self._write_alphabetical_index(index_path, lines, notes)
 
         return index_path
 
@@ -147,16 +130,16 @@ class IndexGenerator:
         """
         permanent_notes_dir = self.config.get_permanent_notes_path()
 
-        # Find all markdown files
-        note_files = list(permanent_notes_dir.glob("*.md"))
-
-        # Exclude the index files themselves
-        note_files = [f for f in note_files if f.stem.upper() not in ["INDEX", "PEOPLE-INDEX", "PERSON-INDEX"]]
+        # Find all markdown files, excluding the index files themselves
+        records = [
+            r for r in self.catalog.get_notes(permanent_notes_dir)
+            if r.filepath.stem.upper() not in ["INDEX", "PEOPLE-INDEX", "PERSON-INDEX"]
+        ]
 
         # Filter to only person notes (those with 'person' or 'contact' tag)
         person_notes = []
-        for filepath in note_files:
-            metadata = self._parse_note_metadata(filepath)
+        for record in records:
+            metadata = self._record_to_metadata(record)
             if metadata and ("person" in metadata.tags or "contact" in metadata.tags):
                 person_notes.append(metadata)
 
@@ -166,7 +149,7 @@ class IndexGenerator:
         # Sort alphabetically by title
         person_notes.sort(key=lambda n: n.title.lower())
 
-        # Generate markdown content
+        # Generate markdown header
         lines = []
         lines.append("---")
         lines.append("title: People Index")
@@ -181,34 +164,9 @@ class IndexGenerator:
         lines.append("Directory of professionals, speakers, and contacts in your Zettelkasten.")
         lines.append("")
 
-        # Group by first letter
-        grouped_notes: Dict[str, List[NoteMetadata]] = defaultdict(list)
-        for note in person_notes:
-            first_letter = note.title[0].upper()
-            # Group numbers and special characters under '#'
-            if not first_letter.isalpha():
-                first_letter = "#"
-            grouped_notes[first_letter].append(note)
-
-        # Add alphabetical sections
-        for letter in sorted(grouped_notes.keys()):
-            lines.append(f"## {letter}")
-            lines.append("")
-            for note in grouped_notes[letter]:
-                # Create relative link to the note with description
-                relative_filename = note.filepath.stem
-
-                # Try to extract a brief description from the note content
-                description = self._extract_description(Path(note.filepath))
-                if description:
-                    lines.append(f"- **[[{relative_filename}|{note.title}]]**: {description}")
-                else:
-                    lines.append(f"- [[{relative_filename}|{note.title}]]")
-            lines.append("")
-
-        # Write index file
+        # Write index file (skipped if no letter section changed)
         index_path = permanent_notes_dir / "PEOPLE-INDEX.md"
-        index_path.write_text("\n".join(lines))
+        self._write_alphabetical_index(index_path, lines, person_notes)
 
         return index_path
 
@@ -222,16 +180,16 @@ class IndexGenerator:
         # Get summaries directory (where source notes are stored)
         summaries_dir = self.config.get_sources_path()
 
-        # Find all markdown files in summaries
-        note_files = list(summaries_dir.glob("*.md"))
-
-        # Exclude the index file itself
-        note_files = [f for f in note_files if f.stem.upper() != "INDEX"]
+        # Find all markdown files in summaries, excluding the index file itself
+        records = [
+            r for r in self.catalog.get_notes(summaries_dir)
+            if r.filepath.stem.upper() != "INDEX"
+        ]
 
         # Parse all notes
         notes = []
-        for filepath in note_files:
-            metadata = self._parse_note_metadata(filepath)
+        for record in records:
+            metadata = self._record_to_metadata(record)
             if metadata:
                 notes.append(metadata)
 
@@ -313,112 +271,152 @@ class IndexGenerator:
 
         return index_path
 
-    def _parse_note_metadata(self, filepath: Path) -> Optional[NoteMetadata]:
+    def _record_to_metadata(self, record: NoteRecord) -> Optional[NoteMetadata]:
         """
-        Parse metadata from a markdown file's YAML frontmatter.
+        Convert a catalog record into NoteMetadata.
 
         Args:
-            filepath: Path to the markdown file
+            record: Catalog record for the note
 
         Returns:
-            NoteMetadata object or None if parsing fails
+            NoteMetadata object, or None if the note has no frontmatter
         """
-        try:
-            content = filepath.read_text()
-
-            # Extract YAML frontmatter
-            frontmatter = self._extract_frontmatter(content)
-            if not frontmatter:
-                return None
-
-            # Parse key fields
-            title = frontmatter.get("title", filepath.stem)
-            source_type = frontmatter.get("source_type")
-            source_url = frontmatter.get("source")
-            created = frontmatter.get("created")
-            tags_raw = frontmatter.get("tags", "")
-
-            # Parse tags (handle both list and bracketed string formats)
-            tags = []
-            if isinstance(tags_raw, str):
-                # Remove brackets and split by comma
-                tags_clean = tags_raw.strip("[]")
-                tags = [t.strip() for t in tags_clean.split(",") if t.strip()]
-            elif isinstance(tags_raw, list):
-                tags = tags_raw
-
-            return NoteMetadata(
-                filepath=filepath,
-                title=title,
-                source_type=source_type,
-                source_url=source_url,
-                created=created,
-                tags=tags,
-            )
-
-        except Exception as e:
-            print(f"Warning: Could not parse {filepath.name}: {e}")
+        if not record.has_frontmatter:
             return None
 
-    def _extract_frontmatter(self, content: str) -> Optional[Dict]:
+        frontmatter = record.properties
+        return NoteMetadata(
+            filepath=record.filepath,
+            title=frontmatter.get("title", record.filepath.stem),
+            source_type=frontmatter.get("source_type"),
+            source_url=frontmatter.get("source"),
+            created=frontmatter.get("created"),
+            tags=record.tags,
+            content_hash=record.content_hash,
+        )
+
+    def _write_alphabetical_index(
+        self, index_path: Path, header_lines: List[str], notes: List[NoteMetadata]
+    ) -> None:
+        """
+        Write an index grouped into one "## <letter>" section per first letter.
+
+        Descriptions come from the content-hash cache, so only new or edited
+        notes are summarized. The result is compared with the existing file
+        section by section; if no section changed the file is not rewritten at
+        all. Otherwise the whole file is written (a Markdown file can't be
+        edited in place), with unchanged sections byte-identical.
+
+        Args:
+            index_path: Path of the index file to write
+            header_lines: Frontmatter and heading lines preceding the sections
+            notes: Notes to list, already sorted by title
+        """
+        descriptions = self._get_descriptions(notes)
+
+        # Group by first letter
+        grouped_notes: Dict[str, List[NoteMetadata]] = defaultdict(list)
+        for note in notes:
+            first_letter = note.title[0].upper()
+            # Group numbers and special characters under '#'
+            if not first_letter.isalpha():
+                first_letter = "#"
+            grouped_notes[first_letter].append(note)
+
+        # Build the alphabetical sections
+        sections: Dict[str, List[str]] = {}
+        for letter in sorted(grouped_notes.keys()):
+            section = [f"## {letter}", ""]
+            for note in grouped_notes[letter]:
+                # Create relative link to the note with description
+                relative_filename = note.filepath.stem
+                description = descriptions.get(note.filepath)
+                if description:
+                    section.append(f"- **[[{relative_filename}|{note.title}]]**: {description}")
+                else:
+                    section.append(f"- [[{relative_filename}|{note.title}]]")
+            section.append("")
+            sections[letter] = section
+
+        existing_header, existing_sections = self._read_index_sections(index_path)
+
+        # The header only differs by its timestamp unless the note count changed
+        def without_timestamp(lines: List[str]) -> List[str]:
+            return [line for line in lines if not line.startswith("created:")]
+
+        if existing_sections == sections and without_timestamp(existing_header) == without_timestamp(header_lines):
+            return
+
+        lines = list(header_lines)
+        for letter, section in sections.items():
+            lines.extend(section)
+        atomic_write_text(index_path, "\n".join(lines))
+
+    def _read_index_sections(self, index_path: Path) -> Tuple[List[str], Dict[str, List[str]]]:
         """
-        Extract YAML frontmatter from markdown content.
+        Split an existing alphabetical index into its header and letter sections.
 
         Args:
-            content: Markdown file content
+            index_path: Path of the index file
 
         Returns:
-            Dict of frontmatter key-value pairs or None
+            Tuple of (header lines, dict mapping letter to section lines)
         """
-        # Match YAML frontmatter between --- delimiters
-        match = re.match(r"^---\s*\n(.*?)\n---\s*\n", content, re.DOTALL)
-        if not match:
-            return None
+        if not index_path.exists():
+            return [], {}
 
-        frontmatter_text = match.group(1)
-        frontmatter = {}
-
-        # Parse YAML - handle both simple key: value and list formats
-        lines = frontmatter_text.split("\n")
-        current_key = None
-        current_list = []
-
-        for line in lines:
-            # Check if line is a key: value pair
-            if ":" in line and not line.startswith(" "):
-                # Save previous list if any
-                if current_key and current_list:
-                    frontmatter[current_key] = current_list
-                    current_list = []
-
-                key, value = line.split(":", 1)
-                key = key.strip()
-                value = value.strip()
-
-                if value:
-                    # Regular key: value pair
-                    # Strip surrounding quotes from value if present
-                    if value.startswith('"') and value.endswith('"'):
-                        value = value[1:-1]
-                    elif value.startswith("'") and value.endswith("'"):
-                        value = value[1:-1]
-                    frontmatter[key] = value
-                    current_key = None
-                else:
-                    # Might be start of a list
-                    current_key = key
-                    current_list = []
+        header: List[str] = []
+        sections: Dict[str, List[str]] = {}
+        current: List[str] = header
+
+        for line in index_path.read_text().split("\n"):
+            if line.startswith("## "):
+                current = []
+                sections[line[3:].strip()] = current
+            current.append(line)
+
+        return header, sections
 
-            elif line.startswith("  - ") and current_key:
-                # List item
-                item = line.strip()[2:].strip()  # Remove "- " prefix
-                current_list.append(item)
+    def _get_descriptions(self, notes: List[NoteMetadata]) -> Dict[Path, Optional[str]]:
+        """
+        Get one-line descriptions for notes, calling Claude only for new or edited notes.
+
+        Descriptions are cached by note content hash, so a note is summarized
+        again only when its content changes. Failures are recorded too, and
+        retried only after DESCRIPTION_RETRY_SECONDS.
 
-        # Save any remaining list
-        if current_key and current_list:
-            frontmatter[current_key] = current_list
+        Args:
+            notes: Notes to describe
 
-        return frontmatter
+        Returns:
+            Dict mapping note filepath to its description (None if unavailable)
+        """
+        content_hashes = [n.content_hash for n in notes if n.content_hash]
+        cached = self.catalog.get_descriptions(content_hashes)
+        failed = self.catalog.get_description_failures(content_hashes, DESCRIPTION_RETRY_SECONDS)
+
+        # Notes that need a new description (one per distinct content hash),
+        # summarized concurrently through the shared request engine
+        missing: Dict[str, NoteMetadata] = {}
+        for note in notes:
+            if cached.get(note.content_hash) is None and note.content_hash not in failed:
+                missing.setdefault(note.content_hash or str(note.filepath), note)
+
+        generated = self.concept_extractor.engine.map(
+            lambda note: self._extract_description(Path(note.filepath)), missing.values()
+        )
+        for key, description in zip(missing.keys(), generated):
+            if missing[key].content_hash:
+                if description:
+                    self.catalog.set_description(key, description)
+                else:
+                    self.catalog.set_description_failed(key)
+            cached[key] = description
+
+        return {
+            note.filepath: cached.get(note.content_hash or str(note.filepath))
+            for note in notes
+        }
 
     def _get_episodes(self) -> List[Dict]:
         """
@@ -445,7 +443,8 @@ class IndexGenerator:
 
                 # Parse the index.md frontmatter to get title and episode number
                 try:
-                    metadata = self._parse_note_metadata(index_file)
+                    record = self.catalog.get_note(index_file)
+                    metadata = self._record_to_metadata(record) if record else None
                     if metadata:
                         episode_info = {
                             'title': metadata.title,
@@ -454,9 +453,8 @@ class IndexGenerator:
                         }
 
                         # Try to extract episode number from frontmatter
-                        content = index_file.read_text()
-                        frontmatter = self._extract_frontmatter(content)
-                        if frontmatter and 'episode_number' in frontmatter:
+                        frontmatter = record.properties
+                        if 'episode_number' in frontmatter:
                             try:
                                 episode_info['episode_number'] = int(frontmatter['episode_number'])
                             except (ValueError, TypeError):
@@ -505,14 +503,12 @@ Content:
 
 Return ONLY the summary text, no other commentary. Keep it under 150 characters."""
 
-            response = self.concept_extractor.client.messages.create(
+            summary = self.concept_extractor.engine.complete(
                 model="claude-3-haiku-20240307",
                 max_tokens=100,
                 temperature=0.5,
                 messages=[{"role": "user", "content": prompt}],
-            )
-
-            summary = response.content[0].text.strip()
+            ).strip()
 
             # Truncate if too long
             if len(summary) > 150:
@@ -323,14 +323,14 @@ Return only the description text, no JSON or formatting.""")
 
         prompt = "\n".join(prompt_parts)
 
-        response = self.concept_extractor.client.messages.create(
+        response_text = self.concept_extractor.engine.complete(
             model="claude-3-haiku-20240307",
             max_tokens=1024,
             temperature=0.5,
             messages=[{"role": "user", "content": prompt}],
         )
 
-        return response.content[0].text.strip()
+        return response_text.strip()
 
     def _generate_person_summary(
         self,
@@ -377,11 +377,11 @@ Return only the professional summary text, no JSON or formatting.""")
 
         prompt = "\n".join(prompt_parts)
 
-        response = self.concept_extractor.client.messages.create(
+        response_text = self.concept_extractor.engine.complete(
             model="claude-3-haiku-20240307",
             max_tokens=1024,
             temperature=0.5,
             messages=[{"role": "user", "content": prompt}],
         )
 
-        return response.content[0].text.strip()
+        return response_text.strip()
@@ -1,8 +1,10 @@
 """Generate Zettelkasten notes from processed content."""
 
+import sqlite3
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Set
 from zettelkasten.core.models import (
     ZettelNote,
     ProcessedContent,
@@ -11,11 +13,19 @@ from zettelkasten.core.models import (
 )
 from zettelkasten.core.config import Config
 from zettelkasten.processors.concept_extractor import ConceptExtractor
+from zettelkasten.utils.fileio import atomic_write_text
+from zettelkasten.utils.search_index import get_search_index
+from zettelkasten.utils.vault_catalog import normalize_title
 
 
 class ZettelGenerator:
     """Generate Zettelkasten markdown files."""
 
+    # Held (process-wide) while filenames are chosen and notes written, so
+    # notes created in the same second with the same title by different
+    # threads get distinct files instead of overwriting each other
+    write_lock = threading.RLock()
+
     def __init__(self, config: Config):
         self.config = config
         self.config.ensure_directories()
@@ -165,50 +175,45 @@ class ZettelGenerator:
 
         return notes
 
-    def save_note(self, note: ZettelNote, use_staging: bool = False) -> Path:
+    def save_note(
+        self, note: ZettelNote, use_staging: bool = False, filename: Optional[str] = None
+    ) -> Path:
         """
         Save a note to the vault in the appropriate directory.
 
         Args:
             note: The note to save
             use_staging: If True, save to staging directory instead of final location
+            filename: File name reserved by the caller (under write_lock); by
+                      default the note's own filename, with a numeric suffix
+                      if a file of that name already exists
 
         Returns:
             Path to the saved file
         """
-        filename = note.get_filename()
-
-        # Determine directory based on note tags
-        if use_staging:
-            # Save to staging directory with subdirectories
-            if "source" in note.tags:
-                directory = self.config.get_staging_path() / "sources"
-            elif "concept" in note.tags or "permanent-note" in note.tags:
-                directory = self.config.get_staging_path() / "concepts"
-            else:
-                directory = self.config.get_staging_path()
-        else:
-            # Save to final location
-            if "source" in note.tags:
-                # Source/literature notes go in sources/
-                directory = self.config.get_sources_path()
-            elif "concept" in note.tags or "permanent-note" in note.tags:
-                # Concept/permanent notes go in permanent-notes/
-                directory = self.config.get_permanent_notes_path()
-            elif "fleeting" in note.tags or "fleeting-note" in note.tags:
-                # Fleeting notes go in fleeting-notes/
-                directory = self.config.get_fleeting_notes_path()
-            else:
-                # Default to vault root
-                directory = self.config.vault_path
+        directory = self._note_directory(note.tags, use_staging)
 
         # Ensure directory exists
         directory.mkdir(parents=True, exist_ok=True)
-        filepath = directory / filename
 
-        # Write markdown content
-        markdown = note.to_markdown()
-        filepath.write_text(markdown)
+        with self.write_lock:
+            if filename is None:
+                filename = f"{self._unique_stem(directory, Path(note.get_filename()).stem)}.md"
+            filepath = directory / filename
+
+            # Write markdown content (atomically: the vault may be read meanwhile)
+            atomic_write_text(filepath, note.to_markdown())
+
+        # Keep the search index current (if this fails, the next refresh catches up)
+        try:
+            get_search_index(self.config.vault_path).update_files([filepath])
+        except sqlite3.Error:
+            pass
+
+        # New and changed concepts are embedded on the next semantic lookup
+        if self.config.semantic_index_enabled and directory == self.config.get_permanent_notes_path():
+            from zettelkasten.utils.semantic_index import get_semantic_index
+            get_semantic_index(self.config).invalidate()
 
         return filepath
 
@@ -225,6 +230,51 @@ class ZettelGenerator:
         """
         return [self.save_note(note, use_staging=use_staging) for note in notes]
 
+    def _note_directory(self, tags: List[str], use_staging: bool) -> Path:
+        """Directory a note with these tags is saved in."""
+        if use_staging:
+            # Save to staging directory with subdirectories
+            if "source" in tags:
+                return self.config.get_staging_path() / "sources"
+            if "concept" in tags or "permanent-note" in tags:
+                return self.config.get_staging_path() / "concepts"
+            return self.config.get_staging_path()
+
+        if "source" in tags:
+            # Source/literature notes go in sources/
+            return self.config.get_sources_path()
+        if "concept" in tags or "permanent-note" in tags:
+            # Concept/permanent notes go in permanent-notes/
+            return self.config.get_permanent_notes_path()
+        if "fleeting" in tags or "fleeting-note" in tags:
+            # Fleeting notes go in fleeting-notes/
+            return self.config.get_fleeting_notes_path()
+        # Default to vault root
+        return self.config.vault_path
+
+    @staticmethod
+    def _unique_stem(directory: Path, stem: str, taken: Optional[Set[str]] = None) -> str:
+        """
+        Pick a filename stem not used by a file in `directory` (or in `taken`).
+
+        Call with write_lock held, until the file has been written.
+
+        Args:
+            directory: Directory the note will be saved in
+            stem: Preferred stem ("<timestamp>-<slug>")
+            taken: Stems already reserved by the current batch (updated)
+
+        Returns:
+            `stem`, or `stem` with a "-2", "-3", ... suffix
+        """
+        candidate, suffix = stem, 2
+        while (taken is not None and candidate in taken) or (directory / f"{candidate}.md").exists():
+            candidate = f"{stem}-{suffix}"
+            suffix += 1
+        if taken is not None:
+            taken.add(candidate)
+        return candidate
+
     def note_exists(self, title: str) -> bool:
         """
         Check if a note with the given title already exists.
@@ -252,6 +302,7 @@ class ZettelGenerator:
         concepts: List[Concept],
         source_url: str,
         use_staging: bool = False,
+        created_concepts: Optional[Dict[str, str]] = None,
     ) -> List[Path]:
         """
         Generate notes with proper filename-based links and save them.
@@ -259,12 +310,21 @@ class ZettelGenerator:
         This creates all notes, gets their filenames, then updates the links
         to use actual filenames instead of titles.
 
+        Matching against existing concepts (a Claude request) runs without
+        any lock; only choosing filenames and writing the files holds
+        write_lock, so concurrent callers overlap their requests.
+
         Args:
             content: Processed content
             summary: Generated summary
             concepts: Extracted concepts
             source_url: Source URL
             use_staging: If True, save to staging directory instead of final location
+            created_concepts: Concepts created earlier in the same run
+                              (normalized title -> filename stem), which the
+                              concept index doesn't know about yet; matching
+                              concepts are merged into those notes, and new
+                              ones are added to it
 
         Returns:
             List of saved file paths
@@ -275,11 +335,11 @@ class ZettelGenerator:
         created_at = datetime.now()
         timestamp = created_at.strftime("%Y%m%d%H%M%S")
 
-        # Check for duplicate concepts using intelligent matching
-        for concept in concepts:
-            existing = self.concept_extractor.find_matching_concept_intelligent(
-                concept.name, concept.description, self.config
-            )
+        # Check for duplicate concepts using intelligent matching (all concepts
+        # resolved in one request against the concept index)
+        matches = self.concept_extractor.find_matching_concepts_batch(concepts, self.config)
+        for concept, result in zip(concepts, matches):
+            existing = result["match"]
             if existing:
                 # Mark concept for merging into existing note
                 concept.is_new = False
@@ -289,13 +349,42 @@ class ZettelGenerator:
                 concept.is_new = True
                 print(f"  → Will create new concept: '{concept.name}'")
 
+        with self.write_lock:
+            return self._write_notes(
+                content, summary, concepts, source_url, use_staging,
+                created_at, timestamp, created_concepts,
+            )
+
+    def _write_notes(
+        self,
+        content: ProcessedContent,
+        summary: str,
+        concepts: List[Concept],
+        source_url: str,
+        use_staging: bool,
+        created_at: datetime,
+        timestamp: str,
+        created_concepts: Optional[Dict[str, str]],
+    ) -> List[Path]:
+        """Choose filenames for matched concepts and write every note (call with write_lock held)."""
+        if created_concepts is not None:
+            for concept in concepts:
+                earlier = created_concepts.get(normalize_title(concept.name))
+                if concept.is_new and earlier:
+                    concept.is_new = False
+                    concept.merge_target = f"{earlier}.md"
+                    print(f"  → Will merge '{concept.name}' into note created in this run: {concept.merge_target}")
+
         # Build filename mapping: title -> filename (without .md)
         filename_map = {}
+        taken: Set[str] = set()
 
         # Source note filename
         source_slug = content.title.lower().replace(" ", "-")
         source_slug = "".join(c for c in source_slug if c.isalnum() or c == "-")
-        source_filename = f"{timestamp}-{source_slug}"
+        source_filename = self._unique_stem(
+            self._note_directory(["source"], use_staging), f"{timestamp}-{source_slug}", taken
+        )
         filename_map[content.title] = source_filename
 
         # Save article full text if this is an article
@@ -311,15 +400,17 @@ class ZettelGenerator:
                 raise
 
         # Concept note filenames - use existing filenames if merging
+        concept_directory = self._note_directory(["concept"], use_staging)
+        note_filenames = []
         for concept in concepts:
+            concept_slug = concept.name.lower().replace(" ", "-")
+            concept_slug = "".join(c for c in concept_slug if c.isalnum() or c == "-")
+            concept_filename = self._unique_stem(concept_directory, f"{timestamp}-{concept_slug}", taken)
+            note_filenames.append(f"{concept_filename}.md")
             if not concept.is_new and concept.merge_target:
                 # Use existing filename (without .md extension)
                 filename_map[concept.name] = concept.merge_target.replace('.md', '')
             else:
-                # Create new filename
-                concept_slug = concept.name.lower().replace(" ", "-")
-                concept_slug = "".join(c for c in concept_slug if c.isalnum() or c == "-")
-                concept_filename = f"{timestamp}-{concept_slug}"
                 filename_map[concept.name] = concept_filename
 
         # Generate source note with filename-based links
@@ -340,9 +431,17 @@ class ZettelGenerator:
             created_at=created_at,
         )
 
-        # Save all notes
-        all_notes = [source_note] + concept_notes
-        return self.save_notes(all_notes, use_staging=use_staging)
+        # Save all notes under the filenames reserved above
+        saved_paths = [self.save_note(source_note, use_staging, filename=f"{source_filename}.md")]
+        for note, filename in zip(concept_notes, note_filenames):
+            saved_paths.append(self.save_note(note, use_staging, filename=filename))
+
+        if created_concepts is not None:
+            for concept in concepts:
+                if concept.is_new:
+                    created_concepts[normalize_title(concept.name)] = filename_map[concept.name]
+
+        return saved_paths
 
     def _generate_source_note_with_filenames(
         self,
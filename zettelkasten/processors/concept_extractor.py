@@ -1,12 +1,88 @@
 """Concept extraction using Claude for Zettelkasten generation."""
 
+import contextvars
 import json
 import re
-from typing import List, Optional, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, List, Optional, Dict, Tuple
 from pathlib import Path
-from anthropic import Anthropic
 from zettelkasten.core.models import Concept
 from zettelkasten.core.config import Config
+from zettelkasten.processors.llm_engine import get_request_engine
+from zettelkasten.utils.bm25 import BM25Index
+from zettelkasten.utils.vault_catalog import get_catalog
+from zettelkasten.utils.vault_scanner import ConceptIndex
+
+# Existing concepts (per new concept) passed to Claude for duplicate matching
+MATCH_CANDIDATES = 15
+# Existing concepts (per note) offered to Claude as possible related concepts
+RELATED_CANDIDATES = 40
+
+# With the semantic index (SEMANTIC_INDEX=true), a new concept at least this
+# similar to an existing one is merged into it and one below the lower bound
+# is new, without asking Claude; only those in between are sent to Claude
+SEMANTIC_MATCH_THRESHOLD = 0.85
+SEMANTIC_NEW_THRESHOLD = 0.55
+# Existing concepts at least this similar to a note are suggested as related
+SEMANTIC_RELATED_THRESHOLD = 0.45
+SEMANTIC_RELATED_LIMIT = 10
+# Semantic lookups rescan the vault for changed concepts at most this often;
+# notes saved through ZettelGenerator are picked up on the next lookup
+SEMANTIC_REFRESH_SECONDS = 60
+
+# Longest text sent in one extraction/summary request; longer content is split
+# into chunks of this size that are processed concurrently and then merged
+EXTRACT_CHUNK_CHARS = 15000
+SUMMARY_CHUNK_CHARS = 10000
+
+# Inbox notes classified per request, and how much of each note's body is sent
+CLASSIFY_BATCH_SIZE = 20
+CLASSIFY_BODY_CHARS = 1500
+
+_URL_PATTERN = re.compile(r"https?://\S+")
+# Markers of notes taken from something else: metadata lines, references, citations
+_CITATION_PATTERNS = [
+    re.compile(r"^\s*[-*]?\s*\**(source|author|authors|url|link|via|publisher|published)\**\s*:", re.IGNORECASE | re.MULTILINE),
+    re.compile(r"\bdoi:\s*10\.|\bdoi\.org/|\bisbn\b|\barxiv\b", re.IGNORECASE),
+    re.compile(r"\bet al\.", re.IGNORECASE),
+    re.compile(r"\bretrieved from\b|\baccessed (on )?\w+ \d", re.IGNORECASE),
+    re.compile(r"^\s*#+\s*(references|bibliography|highlights|key takeaways)\b", re.IGNORECASE | re.MULTILINE),
+    re.compile(r"\[\d+\](?!\()"),
+]
+_SOURCE_TITLE_PATTERN = re.compile(
+    r"^(notes? on|summary of|highlights (from|of)|review of|book notes)\b|\b(podcast|episode|lecture|talk|interview)\b",
+    re.IGNORECASE,
+)
+
+
+def guess_note_type(title: str, content: str) -> Optional[str]:
+    """
+    Classify a note as 'concept' or 'source' from its text alone, when the answer is clear.
+
+    Notes full of links and citations, or titled like notes on something,
+    are sources; short notes without any are concepts. Anything in between
+    is left to Claude.
+
+    Args:
+        title: Note title
+        content: Note body (without frontmatter)
+
+    Returns:
+        "concept", "source", or None if the heuristic isn't confident
+    """
+    words = len(content.split())
+    urls = len(_URL_PATTERN.findall(content))
+    citations = sum(1 for pattern in _CITATION_PATTERNS if pattern.search(content))
+    source_title = bool(_SOURCE_TITLE_PATTERN.search(title))
+
+    # Links per 100 words
+    url_density = 100 * urls / max(words, 1)
+
+    if citations >= 2 or (urls >= 3 and url_density >= 1) or (source_title and (urls or citations)):
+        return "source"
+    if not urls and not citations and not source_title and words <= 400:
+        return "concept"
+    return None
 
 
 class ConceptExtractor:
@@ -14,7 +90,17 @@ class ConceptExtractor:
 
     def __init__(self, config: Config):
         self.config = config
-        self.client = Anthropic(api_key=config.anthropic_api_key)
+        # Shared engine: all extractors in the process share one rate budget
+        self.engine = get_request_engine(config)
+        self.client = self.engine.client
+        # Parsed concept index entries and their BM25 index, keyed by INDEX.md mtime
+        self._index_entries: Optional[Tuple[int, List[str], BM25Index]] = None
+        # Local embedding index of permanent notes (optional; numpy and
+        # sentence-transformers are only imported when it's enabled)
+        self._semantic = None
+        if config.semantic_index_enabled:
+            from zettelkasten.utils.semantic_index import get_semantic_index
+            self._semantic = get_semantic_index(config)
 
     def extract_concepts(
         self,
@@ -26,6 +112,11 @@ class ConceptExtractor:
         """
         Extract key concepts from text using Claude.
 
+        Text longer than one request is split into chunks on paragraph and
+        sentence boundaries; concepts are extracted from every chunk
+        concurrently and then merged (map-reduce), so long transcripts are
+        covered in full.
+
         Args:
             text: The text to analyze
             title: Title of the source content
@@ -35,6 +126,94 @@ class ConceptExtractor:
         Returns:
             List of Concept objects
         """
+        if len(text) <= EXTRACT_CHUNK_CHARS:
+            return self._extract_chunk_concepts(text, title, source_url, max_concepts)
+
+        chunks = split_text(text, EXTRACT_CHUNK_CHARS)
+        chunk_concepts = self.engine.map(
+            lambda numbered: self._extract_chunk_concepts(
+                numbered[1],
+                f"{title} (part {numbered[0]} of {len(chunks)})",
+                source_url,
+                max_concepts,
+            ),
+            list(enumerate(chunks, start=1)),
+        )
+        return self._reduce_concepts(chunk_concepts, title, max_concepts)
+
+    def extract_concepts_incremental(
+        self,
+        text_stream: Iterable[str],
+        title: str,
+        source_url: str,
+        max_concepts: int = 10,
+        on_text: Optional[Callable[[str], None]] = None,
+    ) -> Tuple[str, List[Concept]]:
+        """
+        Extract concepts from text that is still being produced (e.g. streamed
+        transcription segments).
+
+        Each time enough text has arrived to fill a chunk, its extraction is
+        started in the background, so most of the work is done by the time the
+        stream ends. The result matches extract_concepts on the full text.
+
+        Args:
+            text_stream: Pieces of text, in order
+            title: Title of the source content
+            source_url: URL of the source
+            max_concepts: Maximum number of concepts to extract
+            on_text: Called with the full text as soon as the stream ends
+                     (before the last chunks and the reduce step finish), e.g.
+                     to start the summary alongside them
+
+        Returns:
+            Tuple of (full text, list of Concept objects)
+        """
+        pieces: List[str] = []
+        buffer = ""
+        futures = []
+
+        with ThreadPoolExecutor(max_workers=self.engine.max_concurrency) as executor:
+            def submit(chunk: str) -> None:
+                # Run in a copy of the caller's context so progress listeners
+                # (see core.progress) still receive the chunk's llm_call events
+                context = contextvars.copy_context()
+                futures.append(executor.submit(
+                    context.run,
+                    self._extract_chunk_concepts,
+                    chunk,
+                    f"{title} (part {len(futures) + 1})",
+                    source_url,
+                    max_concepts,
+                ))
+
+            for piece in text_stream:
+                pieces.append(piece)
+                buffer += piece
+                if len(buffer) > EXTRACT_CHUNK_CHARS:
+                    # Keep the last (partial) chunk until more text arrives
+                    chunks = split_text(buffer, EXTRACT_CHUNK_CHARS)
+                    for chunk in chunks[:-1]:
+                        submit(chunk)
+                    buffer = chunks[-1]
+
+            text = "".join(pieces)
+            if on_text is not None:
+                on_text(text)
+            if not futures:
+                # Short enough for a single request
+                return text, self.extract_concepts(text, title, source_url, max_concepts)
+
+            if buffer.strip():
+                submit(buffer)
+            chunk_concepts = [future.result() for future in futures]
+
+        return text, self._reduce_concepts(chunk_concepts, title, max_concepts)
+
+    def _extract_chunk_concepts(
+        self, text: str, title: str, source_url: str, max_concepts: int
+    ) -> List[Concept]:
+        """Extract concepts from text that fits in a single request."""
         prompt = f"""You are an expert at analyzing content and extracting key concepts for a Zettelkasten knowledge management system.
 
 Your task is to:
@@ -63,7 +242,7 @@ Title: {title}
 Source: {source_url}
 
 Content:
-{text[:15000]}
+{text[:EXTRACT_CHUNK_CHARS]}
 
 Extract up to {max_concepts} concepts. Focus on the most important and actionable ideas.
 
@@ -81,7 +260,7 @@ Return your analysis as a JSON object with this structure:
 
 IMPORTANT: Return ONLY valid JSON. Do NOT use smart quotes or curly quotes. Escape any quotes inside strings properly with backslashes."""
 
-        response = self.client.messages.create(
+        content_text = self.engine.complete(
             model="claude-3-haiku-20240307",
             max_tokens=4096,
             temperature=0.7,
@@ -90,9 +269,6 @@ IMPORTANT: Return ONLY valid JSON. Do NOT use smart quotes or curly quotes. Esca
             ],
         )
 
-        # Parse response - Claude returns text content
-        content_text = response.content[0].text
-
         # Extract JSON from the response (Claude might wrap it in markdown)
         if "```json" in content_text:
             # Extract JSON from markdown code block
@@ -182,10 +358,124 @@ IMPORTANT: Return ONLY valid JSON. Do NOT use smart quotes or curly quotes. Esca
 
         return concepts
 
+    def _reduce_concepts(
+        self, chunk_concepts: List[List[Concept]], title: str, max_concepts: int
+    ) -> List[Concept]:
+        """
+        Merge concepts extracted from separate chunks of one source.
+
+        Concepts with the same name are merged locally (quotes and related
+        concepts are combined without duplicates). If more than max_concepts
+        remain, Claude picks the most important ones and folds near-duplicates
+        together, based on names and descriptions only.
+
+        Args:
+            chunk_concepts: Concepts extracted from each chunk, in chunk order
+            title: Title of the source content
+            max_concepts: Maximum number of concepts to return
+
+        Returns:
+            Merged list of Concept objects
+        """
+        merged: Dict[str, Concept] = {}
+        mentions: Dict[str, int] = {}
+        for concepts in chunk_concepts:
+            for concept in concepts:
+                key = " ".join(concept.name.lower().split())
+                # Fold a plural "s" (one, and not "ss": "Loss", "Process")
+                if key.endswith("s") and not key.endswith("ss"):
+                    key = key[:-1]
+                if key in merged:
+                    _merge_concept_into(merged[key], concept)
+                else:
+                    merged[key] = concept.model_copy(deep=True)
+                mentions[key] = mentions.get(key, 0) + 1
+
+        # Concepts that recur across chunks are the most central ones
+        candidates = [
+            merged[key] for key in sorted(merged, key=lambda k: -mentions[k])
+        ]
+        if len(candidates) <= max_concepts:
+            return candidates
+
+        listing = "\n".join(
+            f"{i}. {concept.name}: {concept.description}"
+            for i, concept in enumerate(candidates, start=1)
+        )
+        prompt = f"""You are an expert at analyzing content and extracting key concepts for a Zettelkasten knowledge management system.
+
+The concepts below were extracted from consecutive parts of the same source, "{title}". Some of them describe the same idea under different names.
+
+CANDIDATE CONCEPTS:
+{listing}
+
+Task: Select the {max_concepts} most important and actionable concepts for the source as a whole. Merge candidates that describe the same idea into one concept.
+
+Return your answer as JSON:
+{{
+  "concepts": [
+    {{
+      "name": "Concept Name",
+      "description": "Clear, concise description of the concept",
+      "merged": [1, 4]
+    }}
+  ]
+}}
+
+IMPORTANT: Return ONLY valid JSON. "merged" lists the numbers of every candidate the concept combines (at least one)."""
+
+        content_text = self.engine.complete(
+            model="claude-3-haiku-20240307",
+            max_tokens=4096,
+            temperature=0.3,
+            messages=[{"role": "user", "content": prompt}],
+        )
+
+        # Extract JSON
+        if "```json" in content_text:
+            json_start = content_text.find("```json") + 7
+            json_end = content_text.find("```", json_start)
+            content_text = content_text[json_start:json_end].strip()
+        elif "```" in content_text:
+            json_start = content_text.find("```") + 3
+            json_end = content_text.find("```", json_start)
+            content_text = content_text[json_start:json_end].strip()
+
+        try:
+            data = json.loads(content_text)
+        except json.JSONDecodeError:
+            # Fall back to the concepts mentioned most often
+            return candidates[:max_concepts]
+
+        reduced = []
+        for concept_data in data.get("concepts", [])[:max_concepts]:
+            indices = []
+            for index in concept_data.get("merged", []):
+                try:
+                    if 1 <= int(index) <= len(candidates):
+                        indices.append(int(index) - 1)
+                except (TypeError, ValueError):
+                    continue
+            if not indices:
+                continue
+
+            concept = candidates[indices[0]].model_copy(deep=True)
+            for index in indices[1:]:
+                _merge_concept_into(concept, candidates[index])
+            concept.name = concept_data.get("name") or concept.name
+            concept.description = concept_data.get("description") or concept.description
+            reduced.append(concept)
+
+        return reduced or candidates[:max_concepts]
+
     def generate_summary(self, text: str, title: str) -> str:
         """
         Generate a concise summary of the content.
 
+        Text longer than one request is split into chunks that are summarized
+        concurrently; the final summary is then written from those partial
+        summaries.
+
         Args:
             text: The text to summarize
             title: Title of the content
@@ -193,6 +483,21 @@ IMPORTANT: Return ONLY valid JSON. Do NOT use smart quotes or curly quotes. Esca
         Returns:
             Summary text
         """
+        if len(text) > SUMMARY_CHUNK_CHARS:
+            chunks = split_text(text, SUMMARY_CHUNK_CHARS)
+            partial_summaries = self.engine.map(
+                lambda numbered: self.generate_summary(
+                    numbered[1], f"{title} (part {numbered[0]} of {len(chunks)})"
+                ),
+                list(enumerate(chunks, start=1)),
+            )
+            # Reduce: summarize the partial summaries (recurses if still too long)
+            text = "\n\n".join(
+                f"Part {i} summary:\n{summary}"
+                for i, summary in enumerate(partial_summaries, start=1)
+            )
+            return self.generate_summary(text, title)
+
         prompt = f"""You are an expert at creating concise, insightful summaries for a Zettelkasten knowledge base.
 
 Create a summary that:
@@ -206,9 +511,9 @@ Summarize this content:
 Title: {title}
 
 Content:
-{text[:10000]}"""
+{text}"""
 
-        response = self.client.messages.create(
+        return self.engine.complete(
             model="claude-3-haiku-20240307",
             max_tokens=1024,
             temperature=0.7,
@@ -217,28 +522,44 @@ Content:
             ],
         )
 
-        return response.content[0].text
-
     def find_related_concepts(
-        self, note_content: str, note_title: str, existing_concepts: List[str]
+        self, note_content: str, note_title: str, existing_concepts: ConceptIndex
     ) -> List[str]:
         """
         Analyze a note and find which existing concepts in the KB are related.
 
+        Only the RELATED_CANDIDATES existing concepts that rank highest by BM25
+        against the note are offered to Claude, so the prompt stays the same
+        size however large the vault grows. With the semantic index enabled,
+        the most similar concepts are returned without asking Claude.
+
         Args:
             note_content: The text content of the note to analyze
             note_title: Title of the note
-            existing_concepts: List of existing concept titles in the vault
+            existing_concepts: Index of the existing concepts in the vault
 
         Returns:
             List of related concept titles from the existing KB
         """
-        # If there are no existing concepts, return empty list
-        if not existing_concepts:
+        # With the semantic index, the nearest concepts are the answer
+        semantic = self._semantic_similar([f"{note_title}\n{note_content}"], SEMANTIC_RELATED_LIMIT)
+        if semantic is not None:
+            return [
+                match.title
+                for match in semantic[0]
+                if match.score >= SEMANTIC_RELATED_THRESHOLD and match.title != note_title
+            ]
+
+        candidates = existing_concepts.relevant_titles(
+            f"{note_title}\n{note_title}\n{note_content[:10000]}", RELATED_CANDIDATES
+        )
+
+        # If there are no candidate concepts, return empty list
+        if not candidates:
             return []
 
         # Format the existing concepts for the prompt
-        concepts_list = "\n".join([f"- {concept}" for concept in existing_concepts])
+        concepts_list = "\n".join([f"- {concept}" for concept in candidates])
 
         prompt = f"""You are an expert at analyzing notes and finding conceptual relationships in a Zettelkasten knowledge base.
 
@@ -270,16 +591,13 @@ Return your analysis as a JSON object:
 
 IMPORTANT: Only include concept names that appear in the "Existing Concepts in Knowledge Base" list above."""
 
-        response = self.client.messages.create(
+        content_text = self.engine.complete(
             model="claude-3-haiku-20240307",
             max_tokens=1024,
             temperature=0.5,
             messages=[{"role": "user", "content": prompt}],
         )
 
-        # Parse response
-        content_text = response.content[0].text
-
         # Extract JSON from the response
         if "```json" in content_text:
             json_start = content_text.find("```json") + 7
@@ -295,7 +613,7 @@ IMPORTANT: Only include concept names that appear in the "Existing Concepts in K
             related = data.get("related_concepts", [])
 
             # Filter to only include concepts that actually exist
-            filtered_related = [c for c in related if c in existing_concepts]
+            filtered_related = [c for c in related if c in candidates]
 
             return filtered_related
         except json.JSONDecodeError:
@@ -340,16 +658,13 @@ Return your classification as a JSON object:
 
 The type must be either "concept" or "source"."""
 
-        response = self.client.messages.create(
+        content_text = self.engine.complete(
             model="claude-3-haiku-20240307",
             max_tokens=512,
             temperature=0.3,
             messages=[{"role": "user", "content": prompt}],
         )
 
-        # Parse response
-        content_text = response.content[0].text
-
         # Extract JSON
         if "```json" in content_text:
             json_start = content_text.find("```json") + 7
@@ -371,6 +686,108 @@ The type must be either "concept" or "source"."""
             # Default to concept if parsing fails
             return "concept"
 
+    def classify_notes(
+        self, notes: List[Tuple[str, str]], batch_size: int = CLASSIFY_BATCH_SIZE
+    ) -> List[str]:
+        """
+        Classify several notes as 'concept' or 'source' with one request per batch.
+
+        Same judgement as classify_note, but each note is sent as its title and
+        the first CLASSIFY_BODY_CHARS of its body, `batch_size` notes per
+        request. Batches run concurrently. Notes the response doesn't cover
+        (unparseable JSON, missing entries) fall back to classify_note.
+
+        Args:
+            notes: (title, content) of each note
+            batch_size: Maximum number of notes per request
+
+        Returns:
+            List aligned with `notes`, each "concept" or "source"
+        """
+        if not notes:
+            return []
+
+        batches = [notes[i:i + batch_size] for i in range(0, len(notes), batch_size)]
+        results = self.engine.map(self._classify_batch, batches)
+        types = [note_type for batch_types in results for note_type in batch_types]
+
+        return [
+            note_type or self.classify_note(content, title)
+            for note_type, (title, content) in zip(types, notes)
+        ]
+
+    def _classify_batch(self, notes: List[Tuple[str, str]]) -> List[Optional[str]]:
+        """Classify one batch of notes with a single Claude request (None where unanswered)."""
+        if len(notes) == 1:
+            title, content = notes[0]
+            return [self.classify_note(content, title)]
+
+        listed_notes = "\n\n".join(
+            f"--- NOTE {i} ---\nTitle: {title}\n\n{content[:CLASSIFY_BODY_CHARS]}"
+            for i, (title, content) in enumerate(notes, start=1)
+        )
+
+        prompt = f"""You are an expert at analyzing notes in a Zettelkasten knowledge management system.
+
+Your task: Determine for EACH of the {len(notes)} notes below whether it is a CONCEPT or a SOURCE.
+
+Definitions:
+- CONCEPT: A standalone idea, framework, principle, or mental model. These are atomic ideas that can be linked and built upon. Examples: "Growth Mindset", "Cognitive Dissonance", "The 4 Ps Framework"
+- SOURCE: Notes about external content - summaries or highlights from articles, books, videos, podcasts, or other references. These document what you learned from a specific source.
+
+Only the beginning of long notes is shown.
+
+{listed_notes}
+
+Judge each note independently, based on:
+1. Does it reference an external source (article, book, video)?
+2. Is it a summary or notes FROM something else?
+3. Does it contain a URL or citation?
+4. Or is it a standalone explanation of an idea/concept?
+
+Return your classification as JSON, with one entry per note:
+{{
+  "notes": [
+    {{"index": 1, "type": "concept"}}
+  ]
+}}
+
+IMPORTANT: Return ONLY valid JSON. "index" is the number of the note above, and each type must be either "concept" or "source"."""
+
+        content_text = self.engine.complete(
+            model="claude-3-haiku-20240307",
+            max_tokens=min(4096, 128 + 32 * len(notes)),
+            temperature=0.3,
+            messages=[{"role": "user", "content": prompt}],
+        )
+
+        # Extract JSON
+        if "```json" in content_text:
+            json_start = content_text.find("```json") + 7
+            json_end = content_text.find("```", json_start)
+            content_text = content_text[json_start:json_end].strip()
+        elif "```" in content_text:
+            json_start = content_text.find("```") + 3
+            json_end = content_text.find("```", json_start)
+            content_text = content_text[json_start:json_end].strip()
+
+        types: List[Optional[str]] = [None] * len(notes)
+        try:
+            data = json.loads(content_text)
+        except json.JSONDecodeError:
+            return types
+
+        for entry in data.get("notes", []):
+            try:
+                position = int(entry.get("index")) - 1
+            except (TypeError, ValueError):
+                continue
+            note_type = str(entry.get("type", "")).lower()
+            if 0 <= position < len(notes) and note_type in ("concept", "source"):
+                types[position] = note_type
+
+        return types
+
     def find_matching_concept_intelligent(
         self, concept_name: str, concept_description: str, config: Config
     ) -> Optional[Dict[str, str]]:
@@ -388,24 +805,14 @@ The type must be either "concept" or "source"."""
         Returns:
             Dict with 'title' and 'filepath' if a match is found, None otherwise
         """
-        # Read the concept index
-        index_path = config.get_permanent_notes_path() / "INDEX.md"
-        if not index_path.exists():
-            return None
-
-        index_content = index_path.read_text()
+        semantic = self._match_semantically([f"{concept_name}\n{concept_description}"], config)[0]
+        if semantic is not None:
+            return semantic["match"]
 
-        # Extract only the concepts section from the index
-        # The index has sections like "## A", "## B", etc. with concepts listed under them
-        concepts_section = ""
-        in_concepts = False
-        for line in index_content.split("\n"):
-            if line.startswith("## "):
-                in_concepts = True
-            if in_concepts:
-                concepts_section += line + "\n"
-
-        if not concepts_section.strip():
+        concepts_section = self._candidate_concepts(
+            [f"{concept_name} {concept_description}"], config
+        )
+        if not concepts_section:
             return None
 
         prompt = f"""You are an expert at analyzing concepts for a Zettelkasten knowledge base.
@@ -436,16 +843,13 @@ Return your analysis as JSON:
 
 IMPORTANT: Return ONLY valid JSON. If it's a duplicate, matching_concept_title must be the EXACT title as it appears in the existing concepts list."""
 
-        response = self.client.messages.create(
+        content_text = self.engine.complete(
             model="claude-3-haiku-20240307",
             max_tokens=512,
             temperature=0.3,
             messages=[{"role": "user", "content": prompt}],
         )
 
-        # Parse response
-        content_text = response.content[0].text
-
         # Extract JSON
         if "```json" in content_text:
             json_start = content_text.find("```json") + 7
@@ -464,45 +868,325 @@ IMPORTANT: Return ONLY valid JSON. If it's a duplicate, matching_concept_title m
             if not is_duplicate or not matching_title:
                 return None
 
-            # Find the actual file for this concept
-            # We need to search the permanent notes directory for a file with this title
-            permanent_notes_path = config.get_permanent_notes_path()
+            return self._find_concept_file(matching_title, config)
 
-            # Search for a markdown file with matching title in frontmatter or heading
-            for filepath in permanent_notes_path.glob("*.md"):
-                if filepath.stem.upper() == "INDEX":
-                    continue
+        except json.JSONDecodeError:
+            # If parsing fails, return None (no match)
+            return None
 
-                try:
-                    file_content = filepath.read_text()
-
-                    # Check frontmatter title
-                    frontmatter_match = re.match(r"^---\s*\n(.*?)\n---\s*\n", file_content, re.DOTALL)
-                    if frontmatter_match:
-                        frontmatter = frontmatter_match.group(1)
-                        for line in frontmatter.split("\n"):
-                            if line.startswith("title:"):
-                                title = line.split(":", 1)[1].strip()
-                                if title == matching_title:
-                                    return {
-                                        "title": matching_title,
-                                        "filepath": str(filepath)
-                                    }
-
-                    # Check first heading
-                    heading_match = re.search(r"^#\s+(.+)$", file_content, re.MULTILINE)
-                    if heading_match:
-                        title = heading_match.group(1).strip()
-                        if title == matching_title:
-                            return {
-                                "title": matching_title,
-                                "filepath": str(filepath)
-                            }
-                except Exception:
-                    continue
+    def find_matching_concepts_batch(
+        self, concepts: List[Concept], config: Config, batch_size: int = 20
+    ) -> List[Dict[str, Any]]:
+        """
+        Match several new concepts against existing concepts in one request.
 
-            return None
+        Same judgement as find_matching_concept_intelligent, but the candidate
+        existing concepts are sent once per batch instead of once per concept. Very large extractions
+        are split into batches of `batch_size`, which run concurrently. With
+        the semantic index enabled, only concepts it can't decide are sent.
+
+        Args:
+            concepts: New concepts from one extraction
+            config: Application configuration
+            batch_size: Maximum number of concepts per request
+
+        Returns:
+            List aligned with `concepts`; each entry is a dict with 'match' (dict
+            with 'title' and 'filepath', or None) and 'reasoning'
+        """
+        if not concepts:
+            return []
+
+        # Concepts the semantic index is sure about don't need Claude
+        results = self._match_semantically(
+            [f"{concept.name}\n{concept.description}" for concept in concepts], config
+        )
+        undecided = [i for i, result in enumerate(results) if result is None]
+        if undecided:
+            claude_results = self._match_concepts_with_claude(
+                [concepts[i] for i in undecided], config, batch_size
+            )
+            for i, result in zip(undecided, claude_results):
+                results[i] = result
+        return results
+
+    def _match_concepts_with_claude(
+        self, concepts: List[Concept], config: Config, batch_size: int
+    ) -> List[Dict[str, Any]]:
+        """Match concepts against the concept index, batch_size per Claude request."""
+        batches = [concepts[i:i + batch_size] for i in range(0, len(concepts), batch_size)]
+        jobs = [
+            (batch, self._candidate_concepts([f"{c.name} {c.description}" for c in batch], config))
+            for batch in batches
+        ]
+
+        def match(job: Tuple[List[Concept], str]) -> List[Dict[str, Any]]:
+            batch, concepts_section = job
+            if not concepts_section:
+                # Nothing in the vault resembles these concepts, no need to ask
+                return [{"match": None, "reasoning": "No similar existing concepts"} for _ in batch]
+            return self._match_concept_batch(batch, concepts_section, config)
+
+        results = self.engine.map(match, jobs)
+        return [result for batch_results in results for result in batch_results]
+
+    def _match_concept_batch(
+        self, concepts: List[Concept], concepts_section: str, config: Config
+    ) -> List[Dict[str, Any]]:
+        """Resolve one batch of concepts with a single Claude request."""
+        new_concepts = "\n\n".join(
+            f"{i}. Name: {concept.name}\n   Description: {concept.description}"
+            for i, concept in enumerate(concepts, start=1)
+        )
+
+        prompt = f"""You are an expert at analyzing concepts for a Zettelkasten knowledge base.
+
+I have {len(concepts)} NEW CONCEPTS that need to be added, but first I need to check whether each one already exists (possibly under a different name or as part of a broader concept).
+
+NEW CONCEPTS:
+{new_concepts}
+
+EXISTING CONCEPTS IN THE KNOWLEDGE BASE:
+{concepts_section}
+
+Task: For EACH new concept, determine if it is semantically the same as (or a clear subset of) any existing concept.
+
+Guidelines:
+- Look for concepts that cover the same core idea, even if worded differently
+- Consider if the new concept would be redundant with an existing one
+- Be conservative: only match if they're clearly about the same thing
+- Don't match if the new concept adds significant new perspective
+- Judge each new concept independently against the existing concepts only
+
+Return your analysis as JSON, with one entry per new concept:
+{{
+  "matches": [
+    {{
+      "index": 1,
+      "is_duplicate": true or false,
+      "matching_concept_title": "Exact Title of Matching Concept" or null,
+      "reasoning": "Brief explanation of why it matches or doesn't match"
+    }}
+  ]
+}}
+
+IMPORTANT: Return ONLY valid JSON. "index" is the number of the new concept above. If it's a duplicate, matching_concept_title must be the EXACT title as it appears in the existing concepts list."""
+
+        content_text = self.engine.complete(
+            model="claude-3-haiku-20240307",
+            max_tokens=min(4096, 256 + 160 * len(concepts)),
+            temperature=0.3,
+            messages=[{"role": "user", "content": prompt}],
+        )
+
+        # Extract JSON
+        if "```json" in content_text:
+            json_start = content_text.find("```json") + 7
+            json_end = content_text.find("```", json_start)
+            content_text = content_text[json_start:json_end].strip()
+        elif "```" in content_text:
+            json_start = content_text.find("```") + 3
+            json_end = content_text.find("```", json_start)
+            content_text = content_text[json_start:json_end].strip()
 
+        results: List[Dict[str, Any]] = [
+            {"match": None, "reasoning": ""} for _ in concepts
+        ]
+        try:
+            data = json.loads(content_text)
         except json.JSONDecodeError:
-            # If parsing fails, return None (no match)
+            # If parsing fails, treat every concept as new (no match)
+            return results
+
+        for entry in data.get("matches", []):
+            try:
+                position = int(entry.get("index")) - 1
+            except (TypeError, ValueError):
+                continue
+            if not 0 <= position < len(concepts):
+                continue
+
+            results[position]["reasoning"] = entry.get("reasoning", "")
+            matching_title = entry.get("matching_concept_title")
+            if entry.get("is_duplicate") and matching_title:
+                results[position]["match"] = self._find_concept_file(matching_title, config)
+
+        return results
+
+    def _semantic_similar(self, texts: List[str], k: int) -> Optional[List[List[Any]]]:
+        """
+        Find the existing concepts most similar to each text with the semantic index.
+
+        Args:
+            texts: Query texts
+            k: Maximum number of matches per text
+
+        Returns:
+            List of SemanticMatch lists aligned with `texts`, or None if the
+            semantic index is disabled, empty or unusable (then Claude decides)
+        """
+        if self._semantic is None:
+            return None
+        try:
+            self._semantic.refresh(max_age=SEMANTIC_REFRESH_SECONDS)
+            if not len(self._semantic):
+                return None
+            return self._semantic.similar_to_texts(texts, k)
+        except Exception as e:
+            print(f"  ⚠ Semantic index unavailable, using Claude instead: {e}")
+            self._semantic = None
+            return None
+
+    def _match_semantically(
+        self, queries: List[str], config: Config
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Resolve the concept matches the semantic index is confident about.
+
+        Args:
+            queries: Text of each new concept (name and description)
+            config: Application configuration
+
+        Returns:
+            List aligned with `queries`: a result dict ('match', 'reasoning') where
+            the best similarity is above SEMANTIC_MATCH_THRESHOLD or below
+            SEMANTIC_NEW_THRESHOLD, None where Claude should decide
+        """
+        similar = self._semantic_similar(queries, 1)
+        if similar is None:
+            return [None] * len(queries)
+
+        results: List[Optional[Dict[str, Any]]] = []
+        for matches in similar:
+            best = matches[0] if matches else None
+            if best is None or best.score < SEMANTIC_NEW_THRESHOLD:
+                score = best.score if best else 0.0
+                results.append({"match": None, "reasoning": f"No similar existing concept ({score:.2f})"})
+            elif best.score >= SEMANTIC_MATCH_THRESHOLD:
+                results.append({
+                    "match": {
+                        "title": best.title,
+                        "filepath": str(config.vault_path / best.path),
+                    },
+                    "reasoning": f"Semantically equivalent to '{best.title}' ({best.score:.2f})",
+                })
+            else:
+                results.append(None)
+        return results
+
+    def _candidate_concepts(self, queries: List[str], config: Config) -> str:
+        """
+        Select the existing concepts worth comparing against, from the concept index.
+
+        Rather than sending the whole INDEX.md, each query keeps only its top
+        MATCH_CANDIDATES entries by BM25 over titles and descriptions, so the
+        prompt stays bounded however large the vault grows.
+
+        Args:
+            queries: Text of each new concept (name and description)
+            config: Application configuration
+
+        Returns:
+            Matching index lines (in index order), or empty string if none
+        """
+        index_path = config.get_permanent_notes_path() / "INDEX.md"
+        if not index_path.exists():
+            return ""
+
+        mtime_ns = index_path.stat().st_mtime_ns
+        if self._index_entries is None or self._index_entries[0] != mtime_ns:
+            # Concept entries are the list items under the "## A", "## B", ... headings
+            entries = []
+            in_concepts = False
+            for line in index_path.read_text().split("\n"):
+                if line.startswith("## "):
+                    in_concepts = True
+                elif in_concepts and line.startswith("- "):
+                    entries.append(line)
+            self._index_entries = (mtime_ns, entries, BM25Index(entries))
+
+        _, entries, bm25 = self._index_entries
+
+        selected = set()
+        for query in queries:
+            selected.update(bm25.top_k(query, MATCH_CANDIDATES))
+
+        return "\n".join(entries[i] for i in sorted(selected))
+
+    def _find_concept_file(self, matching_title: str, config: Config) -> Optional[Dict[str, str]]:
+        """
+        Find the permanent note whose title (or heading or alias) matches.
+
+        Args:
+            matching_title: Concept title as listed in the index
+            config: Application configuration
+
+        Returns:
+            Dict with 'title' and 'filepath', or None if no note has that title
+        """
+        catalog = get_catalog(config.vault_path)
+        record = catalog.find_by_title(config.get_permanent_notes_path(), matching_title)
+        if record is None or record.filepath.stem.upper() == "INDEX":
             return None
+
+        return {
+            "title": matching_title,
+            "filepath": str(record.filepath)
+        }
+
+
+def split_text(text: str, max_chars: int) -> List[str]:
+    """
+    Split text into chunks of at most max_chars, on paragraph boundaries where
+    possible, then sentence boundaries, then hard cuts for run-on text.
+
+    Args:
+        text: Text to split
+        max_chars: Maximum chunk length
+
+    Returns:
+        List of chunks, in order
+    """
+    # (piece, separator that joins it to the previous piece)
+    pieces: List[Tuple[str, str]] = []
+    for paragraph in re.split(r"\n\s*\n", text):
+        if len(paragraph) <= max_chars:
+            pieces.append((paragraph, "\n\n"))
+            continue
+        separator = "\n\n"
+        for sentence in re.split(r"(?<=[.!?])\s+", paragraph):
+            while len(sentence) > max_chars:
+                pieces.append((sentence[:max_chars], separator))
+                sentence = sentence[max_chars:]
+                separator = ""
+            pieces.append((sentence, separator))
+            separator = " "
+
+    chunks: List[str] = []
+    current = ""
+    for piece, separator in pieces:
+        if not piece.strip():
+            continue
+        if current and len(current) + len(separator) + len(piece) > max_chars:
+            chunks.append(current)
+            current = piece
+        else:
+            current = f"{current}{separator}{piece}" if current else piece
+    if current:
+        chunks.append(current)
+
+    return chunks
+
+
+def _merge_concept_into(target: Concept, other: Concept) -> None:
+    """Fold another concept's quotes and related concepts into target (no duplicates)."""
+    if len(other.description) > len(target.description):
+        target.description = other.description
+    for quote in other.quotes:
+        if quote not in target.quotes:
+            target.quotes.append(quote)
+    known = {name.lower() for name in target.related_concepts}
+    for name in other.related_concepts:
+        if name.lower() not in known:
+            target.related_concepts.append(name)
+            known.add(name.lower())
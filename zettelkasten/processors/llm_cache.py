@@ -0,0 +1,234 @@
+"""Disk-backed, content-addressed cache of Claude responses.
+
+Responses are keyed by a hash of the full request (model, messages and
+generation parameters), so re-running the same prompt — `zk add --force`, a
+retried import, re-filling orphans — is answered from disk instead of the API.
+Entries expire after a TTL and the least recently used ones are evicted once
+the cache grows past its size limit.
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from zettelkasten.core.config import Config
+
+
+class ResponseCache:
+    """SQLite-backed LRU cache of LLM response texts with TTL expiry."""
+
+    def __init__(self, db_path: Path, ttl_days: float = 30, max_bytes: int = 200 * 1024 * 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            db_path: Path to the SQLite database file
+            ttl_days: Days before an entry expires (0 = never)
+            max_bytes: Maximum total size of cached responses (0 = unlimited)
+        """
+        self.db_path = db_path
+        self.ttl_seconds = ttl_days * 86400
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def make_key(model: str, messages: Any, params: Dict[str, Any]) -> str:
+        """
+        Build the cache key for a request.
+
+        Args:
+            model: Model name
+            messages: Request messages
+            params: All other generation parameters (max_tokens, temperature, ...)
+
+        Returns:
+            Hex sha256 of the canonical request
+        """
+        payload = json.dumps(
+            {"model": model, "messages": messages, "params": params},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response, refreshing its LRU position.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Cached response text, or None if missing or expired
+        """
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            row = conn.execute(
+                "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            if self.ttl_seconds and now - row["created_at"] > self.ttl_seconds:
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+
+            conn.execute(
+                "UPDATE responses SET accessed_at = ?, hits = hits + 1 WHERE key = ?", (now, key)
+            )
+            return row["response"]
+
+    def put(self, key: str, model: str, response: str) -> None:
+        """
+        Store a response, evicting least recently used entries if over the size limit.
+
+        Args:
+            key: Cache key from make_key
+            model: Model that produced the response (for `zk cache` stats)
+            response: Response text
+        """
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO responses (key, model, response, size, created_at, accessed_at, hits)
+                VALUES (?, ?, ?, ?, ?, ?, 0)
+                """,
+                (key, model, response, len(response.encode("utf-8")), now, now),
+            )
+            if self.max_bytes:
+                self._evict(conn, self.max_bytes)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Summarize cache contents.
+
+        Returns:
+            Dict with 'entries', 'bytes', 'hits', 'expired', 'oldest', 'newest'
+            (timestamps) and 'models' (model -> entry count)
+        """
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                """
+                SELECT COUNT(*) AS entries, COALESCE(SUM(size), 0) AS bytes,
+                       COALESCE(SUM(hits), 0) AS hits,
+                       MIN(created_at) AS oldest, MAX(created_at) AS newest
+                FROM responses
+                """
+            ).fetchone()
+            expired = 0
+            if self.ttl_seconds:
+                expired = conn.execute(
+                    "SELECT COUNT(*) FROM responses WHERE created_at < ?",
+                    (time.time() - self.ttl_seconds,),
+                ).fetchone()[0]
+            models = {
+                r["model"]: r["count"]
+                for r in conn.execute(
+                    "SELECT model, COUNT(*) AS count FROM responses GROUP BY model ORDER BY count DESC"
+                )
+            }
+
+        return {
+            "entries": row["entries"],
+            "bytes": row["bytes"],
+            "hits": row["hits"],
+            "expired": expired,
+            "oldest": row["oldest"],
+            "newest": row["newest"],
+            "models": models,
+        }
+
+    def prune(self, max_age_days: Optional[float] = None, max_bytes: Optional[int] = None) -> int:
+        """
+        Remove expired entries, then evict LRU entries down to a size limit.
+
+        Args:
+            max_age_days: Remove entries older than this (default: the cache TTL)
+            max_bytes: Size limit to evict down to (default: the cache limit)
+
+        Returns:
+            Number of entries removed
+        """
+        max_age_seconds = max_age_days * 86400 if max_age_days is not None else self.ttl_seconds
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+
+        with closing(self._connect()) as conn, conn:
+            removed = 0
+            if max_age_seconds:
+                removed += conn.execute(
+                    "DELETE FROM responses WHERE created_at < ?", (time.time() - max_age_seconds,)
+                ).rowcount
+            if max_bytes:
+                removed += self._evict(conn, max_bytes)
+        return removed
+
+    def clear(self) -> int:
+        """
+        Remove every entry.
+
+        Returns:
+            Number of entries removed
+        """
+        with closing(self._connect()) as conn, conn:
+            removed = conn.execute("DELETE FROM responses").rowcount
+        with closing(self._connect()) as conn:
+            conn.execute("VACUUM")
+        return removed
+
+    def _evict(self, conn: sqlite3.Connection, max_bytes: int) -> int:
+        """Delete least recently used entries until the total size fits."""
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= max_bytes:
+            return 0
+
+        victims = []
+        for row in conn.execute("SELECT key, size FROM responses ORDER BY accessed_at"):
+            if total <= max_bytes:
+                break
+            victims.append((row["key"],))
+            total -= row["size"]
+
+        conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+        return len(victims)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection, creating the schema if needed."""
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                response TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                hits INTEGER NOT NULL DEFAULT 0
+            )
+            """
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)")
+        return conn
+
+
+def get_response_cache(config: Config) -> ResponseCache:
+    """
+    Get the response cache stored in the vault's cache directory.
+
+    Args:
+        config: Application configuration
+
+    Returns:
+        ResponseCache configured from LLM_CACHE_TTL_DAYS and LLM_CACHE_MAX_MB
+    """
+    return ResponseCache(
+        config.get_cache_path() / "llm_responses.sqlite3",
+        ttl_days=config.llm_cache_ttl_days,
+        max_bytes=config.llm_cache_max_mb * 1024 * 1024,
+    )
@@ -0,0 +1,290 @@
+"""Concurrent, rate-limited request layer over the Anthropic client.
+
+All Claude calls go through a single engine per API key so that every
+ConceptExtractor, generator and workflow in the process shares one
+concurrency limit and one rate budget. The engine retries transient
+failures (rate limits, overloads, connection errors) with jittered
+exponential backoff, answers repeated requests from the response cache, and
+offers small helpers to issue independent calls in parallel.
+"""
+
+import contextvars
+import random
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, TypeVar
+
+import anthropic
+from anthropic import Anthropic
+
+from zettelkasten.core.config import Config
+from zettelkasten.core.progress import report
+from zettelkasten.processors.llm_cache import ResponseCache, get_response_cache
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Backoff bounds (seconds) for retried requests
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 60.0
+
+
+class TokenBucket:
+    """Thread-safe token bucket that refills continuously up to one minute's budget."""
+
+    def __init__(self, rate_per_minute: float):
+        """
+        Initialize the bucket (starts full).
+
+        Args:
+            rate_per_minute: Tokens added per minute; also the bucket capacity
+        """
+        self.capacity = float(rate_per_minute)
+        self.rate_per_second = rate_per_minute / 60.0
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self, amount: float = 1.0) -> None:
+        """
+        Block until `amount` tokens are available, then take them.
+
+        Args:
+            amount: Number of tokens to take (clamped to the bucket capacity)
+        """
+        amount = min(amount, self.capacity)
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate_per_second
+                )
+                self._updated = now
+
+                if now >= self._paused_until and self._tokens >= amount:
+                    self._tokens -= amount
+                    return
+
+                wait = max(
+                    self._paused_until - now,
+                    (amount - self._tokens) / self.rate_per_second,
+                )
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """
+        Stop handing out tokens for a while (e.g. after the API returned 429).
+
+        Args:
+            seconds: How long to pause, starting now
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+class LLMRequestEngine:
+    """Issue Claude requests with a concurrency limit, rate limiting and retries."""
+
+    def __init__(
+        self,
+        client: Anthropic,
+        max_concurrency: int = 4,
+        requests_per_minute: int = 50,
+        input_tokens_per_minute: int = 0,
+        max_retries: int = 5,
+        cache: Optional[ResponseCache] = None,
+    ):
+        """
+        Initialize the engine.
+
+        Args:
+            client: Anthropic client (its own retries should be disabled)
+            max_concurrency: Maximum number of requests in flight at once
+            requests_per_minute: Request budget per minute (0 disables the limit)
+            input_tokens_per_minute: Estimated input token budget per minute
+                                     (0 disables the limit)
+            max_retries: Retries for rate-limited or transiently failing requests
+            cache: Response cache for identical requests (None disables caching)
+        """
+        self.client = client
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_retries = max_retries
+        self.cache = cache
+        self._semaphore = threading.BoundedSemaphore(self.max_concurrency)
+        self._request_bucket = TokenBucket(requests_per_minute) if requests_per_minute > 0 else None
+        self._token_bucket = (
+            TokenBucket(input_tokens_per_minute) if input_tokens_per_minute > 0 else None
+        )
+
+    def complete(
+        self,
+        model: str,
+        messages: List[Dict[str, Any]],
+        max_tokens: int,
+        use_cache: bool = True,
+        **params: Any,
+    ) -> str:
+        """
+        Send a messages request and return the text of the first content block.
+
+        Identical requests are answered from the response cache. Otherwise
+        blocks until the rate limits allow the request, and retries rate-limit,
+        overload and connection errors with jittered exponential backoff.
+
+        Args:
+            model: Claude model name
+            messages: Conversation messages
+            max_tokens: Maximum tokens to generate
+            use_cache: Whether to read and write the response cache
+            **params: Other messages.create parameters (temperature, system, ...)
+
+        Returns:
+            Response text
+        """
+        cache_key = None
+        if use_cache and self.cache is not None:
+            cache_key = ResponseCache.make_key(model, messages, {"max_tokens": max_tokens, **params})
+            try:
+                cached = self.cache.get(cache_key)
+            except sqlite3.Error:
+                cached = None
+            if cached is not None:
+                report("llm_call", model=model, cached=True)
+                return cached
+
+        # Rough input size estimate (~4 characters per token) for the token budget
+        estimated_tokens = sum(len(str(m.get("content", ""))) for m in messages) // 4 + 1
+
+        attempt = 0
+        while True:
+            if self._request_bucket:
+                self._request_bucket.acquire()
+            if self._token_bucket:
+                self._token_bucket.acquire(estimated_tokens)
+
+            try:
+                with self._semaphore:
+                    response = self.client.messages.create(
+                        model=model,
+                        messages=messages,
+                        max_tokens=max_tokens,
+                        **params,
+                    )
+                text = response.content[0].text
+                break
+            except Exception as e:
+                if attempt >= self.max_retries or not _is_retryable(e):
+                    raise
+
+                delay = _backoff_delay(attempt, e)
+                if isinstance(e, anthropic.RateLimitError):
+                    # Hold back every other thread too, not just this one
+                    for bucket in (self._request_bucket, self._token_bucket):
+                        if bucket:
+                            bucket.pause(delay)
+                time.sleep(delay)
+                attempt += 1
+
+        if cache_key is not None:
+            try:
+                self.cache.put(cache_key, model, text)
+            except sqlite3.Error:
+                pass  # A cache write failure shouldn't lose the response
+        report("llm_call", model=model, cached=False)
+        return text
+
+    def map(self, fn: Callable[[T], R], items: Iterable[T]) -> List[R]:
+        """
+        Apply `fn` to every item concurrently, preserving order.
+
+        Calls beyond the engine's concurrency limit simply wait for a slot, so
+        this is safe to nest. The first exception raised by `fn` propagates.
+        Each call runs in a copy of the caller's context, so progress
+        listeners (see core.progress) still receive its events.
+
+        Args:
+            fn: Function to call (typically one that makes an LLM request)
+            items: Items to process
+
+        Returns:
+            List of results in the same order as `items`
+        """
+        items = list(items)
+        if len(items) <= 1:
+            return [fn(item) for item in items]
+
+        # One context copy per call: a Context can't be entered by two threads at once
+        contexts = [contextvars.copy_context() for _ in items]
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(items))) as executor:
+            return list(executor.map(lambda ctx, item: ctx.run(fn, item), contexts, items))
+
+    def run_parallel(self, *calls: Callable[[], Any]) -> List[Any]:
+        """
+        Run independent zero-argument calls concurrently.
+
+        Args:
+            *calls: Callables to run
+
+        Returns:
+            List of their results, in argument order
+        """
+        return self.map(lambda call: call(), calls)
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Whether an API error is transient and worth retrying."""
+    if isinstance(error, anthropic.APIConnectionError):
+        return True
+    if isinstance(error, anthropic.APIStatusError):
+        # 429 rate limited, 408/409 transient, 5xx/529 server errors and overload
+        return error.status_code in (408, 409, 429) or error.status_code >= 500
+    return False
+
+
+def _backoff_delay(attempt: int, error: Exception) -> float:
+    """Full-jitter exponential backoff, honoring the server's retry-after header."""
+    delay = random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * (2 ** attempt)))
+
+    response = getattr(error, "response", None)
+    retry_after = response.headers.get("retry-after") if response is not None else None
+    if retry_after:
+        try:
+            delay = max(delay, float(retry_after))
+        except ValueError:
+            pass
+
+    return delay
+
+
+_engines: Dict[str, LLMRequestEngine] = {}
+_engines_lock = threading.Lock()
+
+
+def get_request_engine(config: Config) -> LLMRequestEngine:
+    """
+    Get the shared request engine for the configured API key.
+
+    Args:
+        config: Application configuration
+
+    Returns:
+        LLMRequestEngine shared by all callers in this process
+    """
+    with _engines_lock:
+        engine = _engines.get(config.anthropic_api_key)
+        if engine is None:
+            engine = LLMRequestEngine(
+                # Retries are handled by the engine so they respect the shared budget
+                client=Anthropic(api_key=config.anthropic_api_key, max_retries=0),
+                max_concurrency=config.llm_max_concurrency,
+                requests_per_minute=config.llm_requests_per_minute,
+                input_tokens_per_minute=config.llm_input_tokens_per_minute,
+                max_retries=config.llm_max_retries,
+                cache=get_response_cache(config) if config.llm_cache_enabled else None,
+            )
+            _engines[config.anthropic_api_key] = engine
+        return engine
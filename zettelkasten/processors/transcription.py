@@ -1,9 +1,329 @@
 """Audio transcription using local Whisper."""
 
+import atexit
+import hashlib
+import json
+import multiprocessing
+import re
+import subprocess
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
+from typing import Any, Dict, Generator, Iterator, List, Optional, Tuple
+
+import numpy as np
 import whisper
 from zettelkasten.core.models import Transcript
 from zettelkasten.core.config import Config
+from zettelkasten.core.progress import report
+from zettelkasten.utils.fileio import atomic_write_text
+
+
+# Whisper model loaded once per pool worker process (see TranscriptionPool)
+_worker_model: Optional[whisper.Whisper] = None
+
+# Segmented transcription: audio around each cut point is transcribed twice
+# (by both neighbouring segments) and stitched at the cut
+SEGMENT_OVERLAP_SECONDS = 2.0
+# Silence detection thresholds for choosing cut points
+SILENCE_NOISE_DB = -30
+SILENCE_MIN_SECONDS = 0.4
+
+
+def _init_worker(model_size: str) -> None:
+    """Load the Whisper model when a pool worker starts."""
+    global _worker_model
+    _worker_model = whisper.load_model(model_size)
+
+
+def _worker_ready() -> None:
+    """No-op job used to start workers (and load their models) ahead of time."""
+
+
+def _transcribe_in_worker(audio_file: str, language: str) -> Dict[str, Any]:
+    """Transcribe one file with the worker's warm model."""
+    result = _worker_model.transcribe(audio_file, language=language, verbose=False)
+    return {
+        "text": result["text"],
+        "language": result.get("language", language),
+        "segments": [
+            {"start": seg["start"], "end": seg["end"], "text": seg["text"]}
+            for seg in result.get("segments", [])
+        ],
+    }
+
+
+def _transcribe_segment_in_worker(
+    audio_file: str, start: float, end: float, core: Tuple[float, float], language: str
+) -> Dict[str, Any]:
+    """Transcribe [start, end) of a file with the worker's warm model."""
+    return transcribe_slice(_worker_model, audio_file, start, end, core, language)
+
+
+def transcribe_slice(
+    model: whisper.Whisper,
+    audio_file: str,
+    start: float,
+    end: float,
+    core: Tuple[float, float],
+    language: str,
+) -> Dict[str, Any]:
+    """
+    Transcribe [start, end) of a file.
+
+    Only Whisper segments whose midpoint falls inside `core` are kept, so the
+    overlapping edges shared with neighbouring segments are dropped here.
+    Timestamps are shifted to be relative to the start of the whole file.
+
+    Args:
+        model: Loaded Whisper model
+        audio_file: Path to audio file
+        start: Slice start (seconds), including overlap
+        end: Slice end (seconds), including overlap
+        core: (start, end) of the part this slice is responsible for
+        language: Language code
+
+    Returns:
+        Dict with 'segments' and 'language'
+    """
+    audio = load_audio_slice(audio_file, start, end - start)
+    result = model.transcribe(audio, language=language, verbose=False)
+
+    segments = []
+    for segment in result.get("segments", []):
+        seg_start = segment["start"] + start
+        seg_end = segment["end"] + start
+        if core[0] <= (seg_start + seg_end) / 2 < core[1]:
+            segments.append({"start": seg_start, "end": seg_end, "text": segment["text"]})
+
+    return {"segments": segments, "language": result.get("language", language)}
+
+
+class TranscriptionPool:
+    """
+    Long-lived pool of Whisper worker processes.
+
+    Each worker loads the model once when it starts and keeps it for every job
+    it runs, so callers (e.g. every web request to /add-url) don't pay model
+    load time. Jobs are queued by the executor and several files can be
+    transcribed in parallel across cores.
+    """
+
+    def __init__(self, model_size: str, workers: int):
+        """
+        Initialize the pool (worker processes start on first use).
+
+        Args:
+            model_size: Whisper model size loaded by each worker
+            workers: Number of worker processes
+        """
+        self.model_size = model_size
+        self.workers = max(1, workers)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def warm_up(self) -> None:
+        """Start every worker now so the first real job doesn't wait for model loading."""
+        with self._lock:
+            executor = self._get_executor()
+            for _ in range(self.workers):
+                executor.submit(_worker_ready)
+
+    def submit(self, audio_file: Path, language: str = "en") -> "Future[Dict[str, Any]]":
+        """
+        Queue a file for transcription.
+
+        Args:
+            audio_file: Path to audio file
+            language: Language code
+
+        Returns:
+            Future resolving to a dict with 'text' and 'language'
+        """
+        return self._submit(_transcribe_in_worker, str(audio_file), language)
+
+    def submit_segment(
+        self,
+        audio_file: Path,
+        start: float,
+        end: float,
+        core: Tuple[float, float],
+        language: str = "en",
+    ) -> "Future[Dict[str, Any]]":
+        """
+        Queue part of a file for transcription.
+
+        Args:
+            audio_file: Path to audio file
+            start: Segment start (seconds), including overlap
+            end: Segment end (seconds), including overlap
+            core: (start, end) of the part this segment is responsible for
+            language: Language code
+
+        Returns:
+            Future resolving to a dict with 'segments' (absolute timestamps) and 'language'
+        """
+        return self._submit(
+            _transcribe_segment_in_worker, str(audio_file), start, end, core, language
+        )
+
+    def _submit(self, fn, *args) -> Future:
+        """Submit a job, recreating the pool if a worker has died."""
+        with self._lock:
+            try:
+                return self._get_executor().submit(fn, *args)
+            except BrokenProcessPool:
+                # A worker died (e.g. out of memory); start a fresh pool
+                self._executor = None
+        return self._submit(fn, *args)
+
+    def transcribe(self, audio_file: Path, language: str = "en") -> Dict[str, Any]:
+        """
+        Transcribe a file in the pool and wait for the result.
+
+        Args:
+            audio_file: Path to audio file
+            language: Language code
+
+        Returns:
+            Dict with 'text' and 'language'
+        """
+        future = self.submit(audio_file, language)
+        try:
+            return future.result()
+        except BrokenProcessPool:
+            with self._lock:
+                self._executor = None
+            raise
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Create the executor on first use (call with the lock held)."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                # Fresh interpreters: forking a process that has loaded
+                # torch (or started threads) is unsafe
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self.model_size,),
+            )
+        return self._executor
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+_pools: Dict[str, TranscriptionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_transcription_pool(model_size: str, workers: int) -> TranscriptionPool:
+    """
+    Get the process-wide transcription pool for a model size.
+
+    Args:
+        model_size: Whisper model size
+        workers: Number of worker processes (used when the pool is first created)
+
+    Returns:
+        Shared TranscriptionPool
+    """
+    with _pools_lock:
+        if model_size not in _pools:
+            _pools[model_size] = TranscriptionPool(model_size, workers)
+        return _pools[model_size]
+
+
+@atexit.register
+def _shutdown_pools() -> None:
+    for pool in _pools.values():
+        pool.shutdown()
+
+
+def load_audio_slice(audio_file: str, start: float, duration: float) -> np.ndarray:
+    """
+    Decode part of an audio file to 16 kHz mono float32, as Whisper expects.
+
+    Args:
+        audio_file: Path to audio file
+        start: Offset in seconds
+        duration: Length in seconds
+
+    Returns:
+        Audio samples in [-1, 1]
+    """
+    cmd = [
+        "ffmpeg", "-nostdin", "-hide_banner", "-loglevel", "error",
+        "-ss", f"{start:.3f}", "-t", f"{duration:.3f}", "-i", audio_file,
+        "-f", "s16le", "-ac", "1", "-acodec", "pcm_s16le", "-ar", str(whisper.audio.SAMPLE_RATE),
+        "-",
+    ]
+    output = subprocess.run(cmd, capture_output=True, check=True).stdout
+    return np.frombuffer(output, np.int16).flatten().astype(np.float32) / 32768.0
+
+
+def detect_silences(audio_file: Path) -> Tuple[Optional[float], List[Tuple[float, float]]]:
+    """
+    Find the duration and the silent stretches of an audio file with ffmpeg.
+
+    Args:
+        audio_file: Path to audio file
+
+    Returns:
+        (duration in seconds or None if unknown, list of (silence start, silence end))
+    """
+    cmd = [
+        "ffmpeg", "-nostdin", "-hide_banner", "-nostats", "-i", str(audio_file),
+        "-af", f"silencedetect=noise={SILENCE_NOISE_DB}dB:d={SILENCE_MIN_SECONDS}",
+        "-f", "null", "-",
+    ]
+    log = subprocess.run(cmd, capture_output=True, text=True).stderr
+
+    duration = None
+    duration_match = re.search(r"Duration: (\d+):(\d+):(\d+(?:\.\d+)?)", log)
+    if duration_match:
+        hours, minutes, seconds = duration_match.groups()
+        duration = int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
+    starts = [float(t) for t in re.findall(r"silence_start: (-?\d+(?:\.\d+)?)", log)]
+    ends = [float(t) for t in re.findall(r"silence_end: (\d+(?:\.\d+)?)", log)]
+    return duration, list(zip(starts, ends))
+
+
+def plan_segments(
+    duration: float, silences: List[Tuple[float, float]], target_seconds: float
+) -> List[Tuple[float, float]]:
+    """
+    Choose segment boundaries of roughly target_seconds, cutting in silences.
+
+    Each cut is placed in the middle of the silence closest to the target
+    length, looking up to a quarter of the target either way; if there is no
+    silence in that window the cut is made at the target length.
+
+    Args:
+        duration: Audio duration in seconds
+        silences: (start, end) of silent stretches
+        target_seconds: Desired segment length
+
+    Returns:
+        List of (start, end) core ranges covering [0, duration)
+    """
+    midpoints = [(start + end) / 2 for start, end in silences]
+    segments = []
+    start = 0.0
+    while duration - start > target_seconds * 1.25:
+        target = start + target_seconds
+        window = [m for m in midpoints if abs(m - target) <= target_seconds / 4]
+        cut = min(window, key=lambda m: abs(m - target)) if window else target
+        segments.append((start, cut))
+        start = cut
+    segments.append((start, duration))
+    return segments
 
 
 class TranscriptionService:
@@ -23,8 +343,19 @@ class TranscriptionService:
         """
         self.config = config
         self.model_size = model_size
-        self.model = None  # Lazy load the model
+        self.model = None  # Lazy load the model (in-process mode only)
+        # Shared worker pool with warm models, unless TRANSCRIPTION_WORKERS=0
+        self.pool = (
+            get_transcription_pool(model_size, config.transcription_workers)
+            if config.transcription_workers > 0
+            else None
+        )
         self.config.ensure_directories()
+        # Transcripts keyed by audio content hash, model size and language
+        self.cache_dir = config.get_cache_path() / "transcripts"
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # (path, mtime_ns, size) -> content hash, so a file is hashed only once
+        self._hashes: Dict[Tuple[str, int, int], str] = {}
 
     def _load_model(self) -> whisper.Whisper:
         """Lazy load the Whisper model."""
@@ -36,6 +367,9 @@ class TranscriptionService:
         """
         Transcribe an audio file using local Whisper.
 
+        If the same audio (by content hash) was already transcribed with this
+        model size and language, the cached transcript is returned instead.
+
         Args:
             audio_file: Path to audio file
             language: Language code (default: "en")
@@ -46,27 +380,264 @@ class TranscriptionService:
         if not audio_file.exists():
             raise FileNotFoundError(f"Audio file not found: {audio_file}")
 
-        # Load model
-        model = self._load_model()
+        cached = self.find_cached_transcript(audio_file, language)
+        if cached is not None:
+            return cached
 
-        # Transcribe audio
-        result = model.transcribe(
-            str(audio_file),
-            language=language,
-            verbose=False,
+        # Drain the segment stream, keeping the full result it returns
+        stream = self._transcribe_segmented(audio_file, language)
+        while True:
+            try:
+                next(stream)
+            except StopIteration as done:
+                result = done.value
+                break
+
+        return Transcript(
+            text=result["text"],
+            source_file=audio_file,
+            language=result["language"],
+            duration=result["duration"],
         )
 
+    def transcribe_stream(self, audio_file: Path, language: str = "en") -> Iterator[Dict[str, Any]]:
+        """
+        Transcribe an audio file, yielding Whisper segments as they finish.
+
+        Same transcription (and cache) as transcribe(), but each part's
+        segments are yielded as soon as that part is done, so callers can work
+        on the start of a long recording while the rest is transcribed.
+
+        Args:
+            audio_file: Path to audio file
+            language: Language code (default: "en")
+
+        Yields:
+            Dicts with 'start', 'end' (seconds from the start of the file) and 'text'
+        """
+        if not audio_file.exists():
+            raise FileNotFoundError(f"Audio file not found: {audio_file}")
+
+        cached = self.find_cached_transcript(audio_file, language)
+        if cached is not None:
+            yield from self._cached_segments(audio_file, language) or [
+                {"start": 0.0, "end": cached.duration or 0.0, "text": cached.text}
+            ]
+            return
+
+        yield from self._transcribe_segmented(audio_file, language)
+
+    def _transcribe_segmented(
+        self, audio_file: Path, language: str
+    ) -> Generator[Dict[str, Any], None, Dict[str, Any]]:
+        """
+        Transcribe a file as overlapping segments, yielding Whisper segments in order.
+
+        The file is cut at silences into segments of about
+        TRANSCRIPTION_SEGMENT_SECONDS; each segment is transcribed with a short
+        overlap on both sides, and the overlapping parts are de-duplicated by
+        keeping each Whisper segment only in the range it belongs to. With the
+        worker pool every segment is queued at once, so they run in parallel
+        across workers while earlier ones are consumed. Short files (or
+        TRANSCRIPTION_SEGMENT_SECONDS=0) are transcribed in one go.
+
+        The transcript file is appended to as segments arrive, and the
+        finished result is cached.
+
+        Args:
+            audio_file: Path to audio file
+            language: Language code
+
+        Yields:
+            Dicts with 'start', 'end' (seconds from the start of the file) and 'text'
+
+        Returns:
+            Dict with 'text', 'language', 'segments' and 'duration' (like a Whisper result)
+        """
+        target = self.config.transcription_segment_seconds
+        duration, silences = detect_silences(audio_file) if target > 0 else (None, [])
+
+        futures: List[Future] = []
+        if duration is not None and duration > target * 1.25:
+            slices = [
+                (
+                    max(0.0, core_start - SEGMENT_OVERLAP_SECONDS),
+                    min(duration, core_end + SEGMENT_OVERLAP_SECONDS),
+                    (core_start, core_end),
+                )
+                for core_start, core_end in plan_segments(duration, silences, target)
+            ]
+            if self.pool is not None:
+                futures = [
+                    self.pool.submit_segment(audio_file, start, end, core, language)
+                    for start, end, core in slices
+                ]
+                parts = (future.result() for future in futures)
+            else:
+                model = self._load_model()
+                parts = (
+                    transcribe_slice(model, str(audio_file), start, end, core, language)
+                    for start, end, core in slices
+                )
+            ends = [core[1] for _, _, core in slices]
+        else:
+            # Too short to be worth splitting (or length unknown)
+            parts = iter([self._transcribe_whole(audio_file, language)])
+            ends = [duration]
+
+        segments: List[Dict[str, Any]] = []
+        detected_language = language
+        try:
+            with open(self.get_transcript_path(audio_file), "w") as f:
+                for part, part_end in zip(parts, ends):
+                    detected_language = part.get("language") or detected_language
+                    for segment in part["segments"]:
+                        f.write(segment["text"])
+                        f.flush()
+                        segments.append(segment)
+                        yield segment
+                    if duration:
+                        report("transcription", done=part_end, total=duration)
+        finally:
+            # Don't leave abandoned segments queued ahead of other jobs
+            for future in futures:
+                future.cancel()
+
+        result = {
+            "text": "".join(segment["text"] for segment in segments),
+            "language": detected_language,
+            "duration": duration,
+            "segments": segments,
+        }
+        self._write_cache(audio_file, language, result)
+        return result
+
+    def _transcribe_whole(self, audio_file: Path, language: str) -> Dict[str, Any]:
+        """Transcribe a file in one job, in the pool or in-process."""
+        if self.pool is not None:
+            return self.pool.transcribe(audio_file, language)
+
+        result = self._load_model().transcribe(str(audio_file), language=language, verbose=False)
+        return {
+            "language": result.get("language", language),
+            "segments": [
+                {"start": seg["start"], "end": seg["end"], "text": seg["text"]}
+                for seg in result.get("segments", [])
+            ],
+        }
+
+    def transcribe_many(self, audio_files: List[Path], language: str = "en") -> List[Transcript]:
+        """
+        Transcribe several audio files, in parallel when the worker pool is enabled.
+
+        Args:
+            audio_files: Paths to audio files
+            language: Language code (default: "en")
+
+        Returns:
+            Transcripts in the same order as audio_files
+        """
+        if self.pool is None:
+            return [self.transcribe(audio_file, language) for audio_file in audio_files]
+
+        for audio_file in audio_files:
+            if not audio_file.exists():
+                raise FileNotFoundError(f"Audio file not found: {audio_file}")
+
+        transcripts = [self.find_cached_transcript(audio_file, language) for audio_file in audio_files]
+        futures = {
+            i: self.pool.submit(audio_file, language)
+            for i, audio_file in enumerate(audio_files)
+            if transcripts[i] is None
+        }
+        for i, future in futures.items():
+            transcripts[i] = self._save_transcript(audio_files[i], future.result(), language)
+        return transcripts
+
+    def _save_transcript(self, audio_file: Path, result: Dict, language: str) -> Transcript:
+        """Write a Whisper result to the transcripts directory and the cache, and wrap it."""
         # Save transcript to file
         transcript_file = self.config.transcripts_path / f"{audio_file.stem}.txt"
         transcript_file.write_text(result["text"])
 
+        self._write_cache(audio_file, language, result)
+
         return Transcript(
             text=result["text"],
             source_file=audio_file,
             language=result.get("language", language),
-            duration=None,  # Whisper doesn't provide duration directly
+            duration=result.get("duration"),  # Only known for segmented transcription
+        )
+
+    def _write_cache(self, audio_file: Path, language: str, result: Dict[str, Any]) -> None:
+        """Cache a Whisper result by audio content (atomically, so readers never see a partial entry)."""
+        atomic_write_text(self._get_cache_file(audio_file, language), json.dumps({
+            "text": result["text"],
+            "language": result.get("language", language),
+            "duration": result.get("duration"),
+            "segments": [
+                {"start": seg["start"], "end": seg["end"], "text": seg["text"]}
+                for seg in result.get("segments", [])
+            ],
+            "model_size": self.model_size,
+            "source_file": str(audio_file),
+        }))
+
+    def _cached_segments(self, audio_file: Path, language: str) -> List[Dict[str, Any]]:
+        """Get the timestamped segments stored with a cached transcript (may be empty)."""
+        try:
+            return json.loads(self._get_cache_file(audio_file, language).read_text()).get("segments", [])
+        except (OSError, ValueError):
+            return []
+
+    def find_cached_transcript(self, audio_file: Path, language: str = "en") -> Optional[Transcript]:
+        """
+        Look up a transcript of the same audio content, model size and language.
+
+        Unlike transcript_exists/load_transcript (keyed by filename), this can't
+        return a stale or colliding transcript: a different recording with the
+        same name has a different content hash.
+
+        Args:
+            audio_file: Path to audio file
+            language: Language code (default: "en")
+
+        Returns:
+            Cached Transcript, or None if this audio hasn't been transcribed yet
+        """
+        cache_file = self._get_cache_file(audio_file, language)
+        try:
+            data = json.loads(cache_file.read_text())
+        except (OSError, ValueError):
+            return None
+
+        # Keep the human-readable transcript next to the other sources
+        transcript_file = self.get_transcript_path(audio_file)
+        if not transcript_file.exists():
+            transcript_file.write_text(data["text"])
+
+        return Transcript(
+            text=data["text"],
+            source_file=audio_file,
+            language=data.get("language") or language,
+            duration=data.get("duration"),
         )
 
+    def _get_cache_file(self, audio_file: Path, language: str) -> Path:
+        """Get the cache entry path for an audio file's content, model size and language."""
+        stat = audio_file.stat()
+        hash_key = (str(audio_file.resolve()), stat.st_mtime_ns, stat.st_size)
+        content_hash = self._hashes.get(hash_key)
+        if content_hash is None:
+            digest = hashlib.sha256()
+            with open(audio_file, "rb") as f:
+                for block in iter(lambda: f.read(1024 * 1024), b""):
+                    digest.update(block)
+            content_hash = digest.hexdigest()
+            self._hashes[hash_key] = content_hash
+
+        return self.cache_dir / f"{content_hash}-{self.model_size}-{language}.json"
+
     def get_transcript_path(self, audio_file: Path) -> Path:
         """Get the expected path for a transcript file."""
         return self.config.transcripts_path / f"{audio_file.stem}.txt"
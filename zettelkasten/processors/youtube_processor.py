@@ -5,6 +5,7 @@ from pathlib import Path
 from typing import Optional
 from zettelkasten.core.models import ProcessedContent, ContentType
 from zettelkasten.core.config import Config
+from zettelkasten.core.progress import report
 
 
 class YouTubeProcessor:
@@ -40,6 +41,7 @@ class YouTubeProcessor:
             ],
             "quiet": False,
             "no_warnings": False,
+            "progress_hooks": [_report_download],
         }
 
         # Download and extract info
@@ -75,3 +77,14 @@ class YouTubeProcessor:
         """Delete downloaded audio file after processing."""
         if audio_file and audio_file.exists():
             audio_file.unlink()
+
+
+def _report_download(status: dict) -> None:
+    """yt-dlp progress hook: forward download progress to the progress listener."""
+    if status.get("status") in ("downloading", "finished"):
+        report(
+            "download",
+            downloaded_bytes=status.get("downloaded_bytes") or 0,
+            total_bytes=status.get("total_bytes") or status.get("total_bytes_estimate") or 0,
+            finished=status.get("status") == "finished",
+        )
@@ -0,0 +1,111 @@
+"""Small in-memory BM25 index for ranking notes and concepts lexically.
+
+Used to narrow large candidate sets (e.g. every concept in the vault) down to
+the few worth sending to Claude.
+"""
+
+import math
+import re
+from collections import Counter
+from typing import Dict, List, Tuple
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Words too common to say anything about whether two concepts are related
+STOPWORDS = frozenset(
+    """a an and are as at be by for from has have how in into is it its of on or
+    that the their this to was were what when which who why with without""".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase terms for BM25.
+
+    Stopwords are dropped and a trailing plural "s" is removed so that e.g.
+    "habits" and "habit" match.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        List of terms
+    """
+    terms = []
+    for token in TOKEN_PATTERN.findall(text.lower()):
+        if token in STOPWORDS:
+            continue
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        terms.append(token)
+    return terms
+
+
+class BM25Index:
+    """Okapi BM25 over a fixed list of documents, backed by an inverted index."""
+
+    def __init__(self, documents: List[str], k1: float = 1.5, b: float = 0.75):
+        """
+        Build the index.
+
+        Args:
+            documents: Document texts; results refer to positions in this list
+            k1: Term frequency saturation
+            b: Document length normalization
+        """
+        self.k1 = k1
+        self.b = b
+        self.postings: Dict[str, List[Tuple[int, int]]] = {}
+        self.doc_lengths: List[int] = []
+
+        for doc_id, text in enumerate(documents):
+            terms = tokenize(text)
+            self.doc_lengths.append(len(terms))
+            for term, count in Counter(terms).items():
+                self.postings.setdefault(term, []).append((doc_id, count))
+
+        self.avg_length = (sum(self.doc_lengths) / len(self.doc_lengths)) if documents else 0.0
+
+    def __len__(self) -> int:
+        return len(self.doc_lengths)
+
+    def scores(self, query: str) -> Dict[int, float]:
+        """
+        Score documents against a query.
+
+        Args:
+            query: Query text
+
+        Returns:
+            Dict mapping document position to score (only documents sharing a term)
+        """
+        total = len(self.doc_lengths)
+        scores: Dict[int, float] = {}
+
+        for term in set(tokenize(query)):
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+
+            idf = math.log(1 + (total - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc_id, count in postings:
+                length_norm = 1 - self.b + self.b * self.doc_lengths[doc_id] / (self.avg_length or 1)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * (
+                    count * (self.k1 + 1) / (count + self.k1 * length_norm)
+                )
+
+        return scores
+
+    def top_k(self, query: str, k: int) -> List[int]:
+        """
+        Return the positions of the best-matching documents.
+
+        Args:
+            query: Query text
+            k: Maximum number of results
+
+        Returns:
+            Document positions, best first (documents with no shared terms are excluded)
+        """
+        scores = self.scores(query)
+        return sorted(scores, key=lambda doc_id: (-scores[doc_id], doc_id))[:k]
@@ -0,0 +1,45 @@
+"""Atomic file operations.
+
+Notes are written by several threads at once (batch add, parallel inbox
+import) and read by Obsidian and the web UI while that happens. Writing to a
+temporary file and renaming it into place means readers only ever see the
+old or the new content, never a half-written note.
+"""
+
+import os
+import threading
+from pathlib import Path
+
+
+def atomic_write_text(path: Path, text: str, encoding: str = "utf-8") -> None:
+    """
+    Write a text file atomically.
+
+    Args:
+        path: Destination file
+        text: Content to write
+        encoding: Text encoding
+    """
+    # Hidden, unique temp name in the same directory (so the rename is atomic
+    # and vault scans never pick it up as a note)
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        temp_path.write_text(text, encoding=encoding)
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def atomic_move(source: Path, destination: Path) -> None:
+    """
+    Move a file atomically, creating the destination directory if needed.
+
+    Both paths must be on the same filesystem (true within the vault).
+
+    Args:
+        source: File to move
+        destination: New path (replaced if it exists)
+    """
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    os.replace(source, destination)
@@ -2,7 +2,8 @@
 
 from pathlib import Path
 from typing import Optional
-import anthropic
+
+from zettelkasten.processors.llm_engine import get_request_engine
 
 
 class InterviewQuestionGenerator:
@@ -16,7 +17,7 @@ class InterviewQuestionGenerator:
             config: Application configuration with API key
         """
         self.config = config
-        self.client = anthropic.Anthropic(api_key=config.anthropic_api_key)
+        self.engine = get_request_engine(config)
         # Look for podcast_context in the vault/workflows directory
         self.context_dir = config.vault_path / "workflows" / "podcast_context"
 
@@ -61,7 +62,7 @@ class InterviewQuestionGenerator:
             return {"background": "", "key_topics": ""}
 
         # Use Claude to extract key information from the transcript
-        message = self.client.messages.create(
+        response_text = self.engine.complete(
             model="claude-opus-4-1-20250805",
             max_tokens=1024,
             messages=[
@@ -84,7 +85,6 @@ Transcript:
             ]
         )
 
-        response_text = message.content[0].text
         parts = response_text.split('KEY_TOPICS:')
 
         background = parts[0].replace('BACKGROUND:', '').strip() if parts else ""
@@ -142,7 +142,7 @@ Transcript:
         )
 
         # Generate questions using Claude
-        message = self.client.messages.create(
+        response_text = self.engine.complete(
             model="claude-opus-4-1-20250805",
             max_tokens=2048,
             messages=[
@@ -153,7 +153,7 @@ Transcript:
             ]
         )
 
-        return message.content[0].text
+        return response_text
 
     def save_questions(self, questions: str, output_path: Path) -> None:
         """
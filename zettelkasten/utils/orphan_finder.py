@@ -5,6 +5,8 @@ from pathlib import Path
 from typing import List, Dict
 from dataclasses import dataclass
 
+from zettelkasten.utils.vault_catalog import get_catalog
+
 
 @dataclass
 class EmptyNote:
@@ -26,13 +28,15 @@ class OrphanFinder:
         """
         self.vault_path = vault_path
         self.permanent_notes_path = vault_path / "permanent-notes"
+        self.catalog = get_catalog(vault_path)
 
     def find_all_orphans(self) -> List[EmptyNote]:
         """
         Find all empty/stub notes in the permanent notes directory.
 
         Empty notes are those with only frontmatter and a title heading,
-        no substantive content.
+        no substantive content. Emptiness is precomputed by the vault catalog,
+        so only notes changed since the last scan are read.
 
         Returns:
             List of EmptyNote objects
@@ -42,71 +46,43 @@ class OrphanFinder:
         if not self.permanent_notes_path.exists():
             return orphans
 
-        for note_file in self.permanent_notes_path.glob("*.md"):
-            if note_file.stem.upper() == "INDEX":
+        for record in self.catalog.get_notes(self.permanent_notes_path):
+            if record.filepath.stem.upper() == "INDEX" or not record.is_empty:
                 continue
 
-            if self._is_empty_note(note_file):
-                title = self._get_note_title(note_file)
-                if title:
-                    orphans.append(EmptyNote(
-                        title=title,
-                        filepath=note_file,
-                        is_stub=True
-                    ))
+            if record.is_blank:
+                # Completely empty file - derive the title from the filename
+                title = self._title_from_filename(record.filepath)
+            else:
+                title = record.title
+
+            if title:
+                orphans.append(EmptyNote(
+                    title=title,
+                    filepath=record.filepath,
+                    is_stub=True
+                ))
 
         # Sort by name for consistent output
         orphans.sort(key=lambda x: x.title)
         return orphans
 
-    def _is_empty_note(self, filepath: Path) -> bool:
+    def _title_from_filename(self, filepath: Path) -> str:
         """
-        Check if a note is essentially empty.
-
-        A note is considered empty if it:
-        - Is completely empty (0 bytes)
-        - Only contains YAML frontmatter
-        - Only contains frontmatter + title heading
-        - Only contains frontmatter + title + whitespace/comments
+        Derive a title from a note filename like 20251024145426-some-title.md.
 
         Args:
             filepath: Path to the note file
 
         Returns:
-            True if note is empty, False otherwise
+            Title-cased name with the timestamp prefix removed
         """
-        try:
-            content = filepath.read_text()
-
-            # Completely empty file
-            if not content or not content.strip():
-                return True
-
-            # Skip frontmatter
-            frontmatter_match = re.match(r"^---\s*\n(.*?)\n---\s*\n", content, re.DOTALL)
-            if frontmatter_match:
-                content = content[frontmatter_match.end():]
-            else:
-                # No frontmatter found - if file starts with non-frontmatter content,
-                # it's not empty in the way we're looking for
-                return False
-
-            # Remove title heading and surrounding whitespace
-            content = re.sub(r"^#\s+.+?\n\n", "", content, flags=re.MULTILINE)
-            content = content.strip()
-
-            # If nothing left, it's empty
-            if not content:
-                return True
-
-            # If only whitespace or HTML comments remain, it's empty
-            content_cleaned = re.sub(r"<!--.*?-->", "", content, flags=re.DOTALL)
-            content_cleaned = content_cleaned.strip()
-
-            return len(content_cleaned) == 0
-
-        except Exception:
-            return False
+        filename = filepath.stem
+        # Remove timestamp prefix (format: 20251024145426-title)
+        parts = filename.split("-", 1)
+        if len(parts) > 1:
+            return parts[1].replace("-", " ").title()
+        return filename
 
     def _get_note_title(self, filepath: Path) -> str:
         """
@@ -126,14 +102,7 @@ class OrphanFinder:
 
             # Completely empty file - use filename as title
             if not content or not content.strip():
-                # Extract title from filename (remove timestamp prefix and .md)
-                filename = filepath.stem
-                # Remove timestamp prefix (format: 20251024145426-title)
-                parts = filename.split("-", 1)
-                if len(parts) > 1:
-                    title = parts[1].replace("-", " ").title()
-                    return title
-                return filename
+                return self._title_from_filename(filepath)
 
             # Try YAML frontmatter first
             frontmatter_match = re.match(r"^---\s*\n(.*?)\n---\s*\n", content, re.DOTALL)
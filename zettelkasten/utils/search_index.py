@@ -0,0 +1,446 @@
+"""Full-text search over the vault.
+
+Note titles, tags and bodies (and plain-text transcripts) are kept in a
+SQLite FTS5 index under the vault's cache directory. Like the catalog, the
+index is refreshed incrementally: each file is stored with its mtime and
+size, and a refresh only re-reads files that changed, were added or were
+removed. Writers that know which files they touched (saving a note,
+approving staged notes) update just those, so searches never have to wait
+for a walk of the whole vault.
+
+Queries are ranked with BM25 (title matches weigh most, then tags, then the
+body) and return a highlighted snippet of the matching passage.
+"""
+
+import os
+import re
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from zettelkasten.core.config import cache_dir_for
+from zettelkasten.utils.vault_catalog import (
+    FRONTMATTER_PATTERN,
+    HEADING_PATTERN,
+    parse_frontmatter,
+)
+
+
+# Bump whenever the stored columns or parsing rules change; the index is then
+# rebuilt from the files on the next refresh.
+SCHEMA_VERSION = 1
+
+INDEXED_SUFFIXES = (".md", ".txt")
+
+# Snippet highlight markers (control characters never found in notes), for
+# callers to replace with their own markup
+MATCH_START = "\x02"
+MATCH_END = "\x03"
+
+# BM25 weights of the title, tags and body columns
+COLUMN_WEIGHTS = (10.0, 4.0, 1.0)
+SNIPPET_TOKENS = 24
+
+# Queries matching more files than this are only ranked by title and tag
+# matches (scoring every match would take too long)
+RANK_LIMIT = 10000
+
+# Refreshes changing more files than this also merge the index segments
+OPTIMIZE_AFTER = 1000
+
+_QUERY_TERM_PATTERN = re.compile(r'(-?)"([^"]*)"|(-?)(\S+)')
+_INLINE_TAG_PATTERN = re.compile(r"(?:^|\s)#([\w/-]+)")
+
+
+@dataclass
+class SearchResult:
+    """One matching file."""
+
+    path: str  # Relative to the vault root
+    title: str
+    folder: str  # Top-level vault folder (e.g. "permanent-notes", "sources")
+    snippet: str  # Matching passage, matches wrapped in MATCH_START/MATCH_END
+    score: float  # BM25 rank (lower is better)
+
+
+class SearchIndex:
+    """SQLite FTS5 index of the vault's notes and transcripts."""
+
+    def __init__(self, vault_path: Path):
+        """
+        Initialize the index for a vault.
+
+        Args:
+            vault_path: Path to the vault root directory
+        """
+        self.vault_path = vault_path
+        self.db_path = cache_dir_for(vault_path) / "search.sqlite3"
+        self._refresh_lock = threading.Lock()
+        self._last_refresh = 0.0
+
+    def refresh(self, max_age: float = 0.0, wait: bool = True) -> int:
+        """
+        Bring the index up to date with the files in the vault.
+
+        Args:
+            max_age: Skip the refresh if the last one finished less than this
+                     many seconds ago
+            wait: If another thread is already refreshing, wait for it (True)
+                  or return immediately (False)
+
+        Returns:
+            Number of files indexed or removed
+        """
+        if max_age and time.monotonic() - self._last_refresh < max_age:
+            return 0
+        if not self._refresh_lock.acquire(blocking=wait):
+            return 0
+        try:
+            on_disk = dict(self._scan())
+            changed = 0
+            with closing(self._connect()) as conn, conn:
+                # Files saved meanwhile by update_files (another thread or process)
+                # may change rows after this snapshot, so writes below go by path
+                indexed = {
+                    row["path"]: (row["mtime_ns"], row["size"])
+                    for row in conn.execute("SELECT path, mtime_ns, size FROM files")
+                }
+
+                for path in indexed:
+                    if path not in on_disk:
+                        self._remove(conn, path)
+                        changed += 1
+
+                for path, (mtime_ns, size) in on_disk.items():
+                    if indexed.get(path) == (mtime_ns, size):
+                        continue
+                    self._index(conn, path, mtime_ns, size)
+                    changed += 1
+
+                if changed > OPTIMIZE_AFTER:
+                    conn.execute("INSERT INTO notes_fts (notes_fts) VALUES ('optimize')")
+
+            self._last_refresh = time.monotonic()
+            return changed
+        finally:
+            self._refresh_lock.release()
+
+    def update_files(self, paths: Iterable[Path]) -> None:
+        """
+        Re-index specific files (or drop them, if they no longer exist).
+
+        Args:
+            paths: Files that were written, moved or deleted
+        """
+        with closing(self._connect()) as conn, conn:
+            for path in paths:
+                relative = self._relative(path)
+                if relative is None:
+                    continue
+                try:
+                    stat = path.stat()
+                except OSError:
+                    self._remove(conn, relative)
+                    continue
+                self._index(conn, relative, stat.st_mtime_ns, stat.st_size)
+
+    def search(
+        self, query: str, limit: int = 20, offset: int = 0, folder: Optional[str] = None
+    ) -> List[SearchResult]:
+        """
+        Search the index.
+
+        Words must all appear (in any order). "Quoted text" matches a phrase,
+        a trailing * matches a prefix (habit*), and a leading - excludes a
+        word (-draft).
+
+        Args:
+            query: Search query
+            limit: Maximum number of results
+            offset: Number of results to skip (for paging)
+            folder: Only return files in this top-level vault folder
+
+        Returns:
+            Matching files, best first
+        """
+        match = build_match_query(query)
+        if not match:
+            return []
+
+        with closing(self._connect()) as conn:
+            if self._count(conn, match, folder) <= RANK_LIMIT:
+                return self._query(conn, match, "score", limit, offset, folder)
+
+            # Too broad to score every match within budget (and a term found in
+            # nearly every file says little anyway): rank the title and tag
+            # matches, then list the remaining matches, most recently indexed first
+            title_match = f"{{title tags}} : ({match})"
+            results = self._query(conn, title_match, "score", limit, offset, folder)
+            if len(results) < limit:
+                results += self._query(
+                    conn,
+                    match,
+                    "notes_fts.rowid DESC",
+                    limit - len(results),
+                    max(0, offset - self._count(conn, title_match, folder)),
+                    folder,
+                    exclude=title_match,
+                )
+            return results
+
+    def count(self) -> int:
+        """Number of indexed files."""
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+
+    @staticmethod
+    def _count(conn: sqlite3.Connection, match: str, folder: Optional[str]) -> int:
+        """Number of files matching a MATCH expression."""
+        if folder:
+            return conn.execute(
+                "SELECT COUNT(*) FROM notes_fts CROSS JOIN files ON files.id = notes_fts.rowid"
+                " WHERE notes_fts MATCH ? AND files.folder = ?",
+                (match, folder),
+            ).fetchone()[0]
+        return conn.execute(
+            "SELECT COUNT(*) FROM notes_fts WHERE notes_fts MATCH ?", (match,)
+        ).fetchone()[0]
+
+    def _query(
+        self,
+        conn: sqlite3.Connection,
+        match: str,
+        order: str,
+        limit: int,
+        offset: int,
+        folder: Optional[str],
+        exclude: Optional[str] = None,
+    ) -> List[SearchResult]:
+        """Run one MATCH query, ordered by "score" (BM25) or rowid."""
+        sql = f"""
+            SELECT files.path, files.title, files.folder,
+                   snippet(notes_fts, 2, ?, ?, '…', {SNIPPET_TOKENS}) AS snippet,
+                   bm25(notes_fts, {", ".join(map(str, COLUMN_WEIGHTS))}) AS score
+            FROM notes_fts CROSS JOIN files ON files.id = notes_fts.rowid
+            WHERE notes_fts MATCH ?
+        """
+        params: List[object] = [MATCH_START, MATCH_END, match]
+        if exclude:
+            sql += " AND notes_fts.rowid NOT IN (SELECT rowid FROM notes_fts WHERE notes_fts MATCH ?)"
+            params.append(exclude)
+        if folder:
+            sql += " AND files.folder = ?"
+            params.append(folder)
+        sql += f" ORDER BY {order} LIMIT ? OFFSET ?"
+        params.extend([limit, offset])
+
+        return [
+            SearchResult(
+                path=row["path"],
+                title=row["title"],
+                folder=row["folder"],
+                snippet=row["snippet"] or "",
+                score=row["score"],
+            )
+            for row in conn.execute(sql, params)
+        ]
+
+    def _scan(self) -> Iterable[Tuple[str, Tuple[int, int]]]:
+        """Yield (relative path, (mtime_ns, size)) for every indexable file in the vault."""
+        for root, directories, filenames in os.walk(self.vault_path):
+            # Hidden directories: the cache itself, .obsidian, .git, ...
+            directories[:] = [d for d in directories if not d.startswith(".")]
+            for filename in filenames:
+                if filename.startswith(".") or not filename.endswith(INDEXED_SUFFIXES):
+                    continue
+                path = Path(root) / filename
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                yield path.relative_to(self.vault_path).as_posix(), (stat.st_mtime_ns, stat.st_size)
+
+    def _relative(self, path: Path) -> Optional[str]:
+        """Path relative to the vault, or None if the file isn't one the index covers."""
+        try:
+            relative = path.resolve().relative_to(self.vault_path.resolve())
+        except ValueError:
+            return None
+        if any(part.startswith(".") for part in relative.parts):
+            return None
+        if relative.suffix not in INDEXED_SUFFIXES:
+            return None
+        return relative.as_posix()
+
+    def _index(
+        self,
+        conn: sqlite3.Connection,
+        path: str,
+        mtime_ns: int,
+        size: int,
+    ) -> None:
+        """Read and (re-)index one file (inserting or updating its row by path)."""
+        try:
+            text = (self.vault_path / path).read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            self._remove(conn, path)
+            return
+
+        title, tags, body = parse_document(path, text)
+        folder = path.split("/", 1)[0] if "/" in path else ""
+
+        conn.execute(
+            """
+            INSERT INTO files (path, folder, title, mtime_ns, size) VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT (path) DO UPDATE SET
+                title = excluded.title, mtime_ns = excluded.mtime_ns, size = excluded.size
+            """,
+            (path, folder, title, mtime_ns, size),
+        )
+        file_id = conn.execute("SELECT id FROM files WHERE path = ?", (path,)).fetchone()["id"]
+        conn.execute("DELETE FROM notes_fts WHERE rowid = ?", (file_id,))
+
+        conn.execute(
+            "INSERT INTO notes_fts (rowid, title, tags, body) VALUES (?, ?, ?, ?)",
+            (file_id, title, " ".join(tags), body),
+        )
+
+    @staticmethod
+    def _remove(conn: sqlite3.Connection, path: str) -> None:
+        """Drop one file from the index (if it is indexed)."""
+        conn.execute(
+            "DELETE FROM notes_fts WHERE rowid IN (SELECT id FROM files WHERE path = ?)", (path,)
+        )
+        conn.execute("DELETE FROM files WHERE path = ?", (path,))
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection, creating or rebuilding the schema as needed."""
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            conn.execute("DROP TABLE IF EXISTS files")
+            conn.execute("DROP TABLE IF EXISTS notes_fts")
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS files (
+                id INTEGER PRIMARY KEY,
+                path TEXT NOT NULL UNIQUE,
+                folder TEXT NOT NULL,
+                title TEXT NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL
+            )
+            """
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS files_folder ON files (folder)")
+        conn.execute(
+            """
+            CREATE VIRTUAL TABLE IF NOT EXISTS notes_fts USING fts5(
+                title, tags, body,
+                tokenize = 'porter unicode61 remove_diacritics 2',
+                prefix = '2 3'
+            )
+            """
+        )
+        return conn
+
+
+def parse_document(path: str, text: str) -> Tuple[str, List[str], str]:
+    """
+    Extract the indexed fields of a file.
+
+    Args:
+        path: File path (relative to the vault)
+        text: File content
+
+    Returns:
+        Tuple of (title, tags, body); the title comes from the frontmatter,
+        the first heading or the filename, and tags from the frontmatter and
+        inline #tags
+    """
+    title = Path(path).stem
+    if not path.endswith(".md"):
+        return title, [], text
+
+    body = text
+    properties: Dict[str, object] = {}
+    frontmatter_match = FRONTMATTER_PATTERN.match(text)
+    if frontmatter_match:
+        properties = parse_frontmatter(frontmatter_match.group(1))
+        body = text[frontmatter_match.end():]
+
+    heading_match = HEADING_PATTERN.search(body)
+    if properties.get("title"):
+        title = str(properties["title"]).strip("\"'")
+    elif heading_match:
+        title = heading_match.group(1).strip()
+
+    tags = properties.get("tags") or []
+    if isinstance(tags, str):
+        tags = [tag.strip() for tag in tags.strip("[]").split(",")]
+    tags = [str(tag).strip("\"'#") for tag in tags if str(tag).strip()]
+    tags.extend(_INLINE_TAG_PATTERN.findall(body))
+
+    return title, list(dict.fromkeys(tags)), body
+
+
+def build_match_query(query: str) -> str:
+    """
+    Translate a user query into an FTS5 MATCH expression.
+
+    Every term is quoted, so punctuation in the query can't be mistaken
+    for FTS5 syntax.
+
+    Args:
+        query: User query (words, "phrases", prefix*, -excluded)
+
+    Returns:
+        MATCH expression, or empty string if the query has no terms
+    """
+    included = []
+    excluded = []
+    for match in _QUERY_TERM_PATTERN.finditer(query):
+        negated, phrase, word_negated, word = match.groups()
+        text = phrase if phrase is not None else word
+        prefix = phrase is None and text.endswith("*")
+        text = text.rstrip("*").replace('"', '""').strip()
+        if not re.search(r"\w", text):
+            continue
+        term = f'"{text}"' + ("*" if prefix else "")
+        if negated or word_negated:
+            excluded.append(term)
+        else:
+            included.append(term)
+
+    # FTS5's NOT is binary: exclusions need something to exclude from
+    if not included:
+        return ""
+    return " ".join(included) + "".join(f" NOT {term}" for term in excluded)
+
+
+_indexes: Dict[str, SearchIndex] = {}
+
+
+def get_search_index(vault_path: Path) -> SearchIndex:
+    """
+    Get a process-wide search index for a vault.
+
+    Args:
+        vault_path: Path to the vault root directory
+
+    Returns:
+        Shared SearchIndex instance
+    """
+    key = str(vault_path.resolve())
+    if key not in _indexes:
+        _indexes[key] = SearchIndex(vault_path)
+    return _indexes[key]
@@ -0,0 +1,392 @@
+"""Optional semantic index of permanent notes, built with a local embedding model.
+
+Each permanent note (title plus the start of its body) is embedded on the CPU
+with a sentence-transformers model and stored as one row of a float32 matrix
+under the vault's cache directory. The matrix is memory-mapped, so loading it
+costs nothing up front and the OS shares its pages between processes. A JSON
+id map records which note each row belongs to (with the mtime and size it was
+embedded at), so a refresh only embeds notes that are new or changed.
+
+Nearest neighbours are found by brute force: vectors are L2-normalized, so
+cosine similarity is a single matrix-vector product (a few milliseconds even
+for tens of thousands of notes).
+
+Requires the optional sentence-transformers package:
+    pip install 'zettelkasten-cli[semantic]'
+"""
+
+import json
+import os
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from zettelkasten.core.config import Config
+from zettelkasten.utils.fileio import atomic_write_text
+from zettelkasten.utils.vault_catalog import get_catalog
+from zettelkasten.utils.vault_scanner import parse_markdown_note
+
+# Leading characters of each note's body that are embedded along with its title
+EMBED_BODY_CHARS = 2000
+EMBED_BATCH_SIZE = 32
+
+
+class SemanticIndexUnavailable(RuntimeError):
+    """The embedding model can't be loaded (sentence-transformers not installed)."""
+
+
+@dataclass
+class SemanticMatch:
+    """A note similar to a query."""
+
+    title: str
+    path: str  # Relative to the vault root
+    score: float  # Cosine similarity, -1..1 (higher is more similar)
+
+
+class SemanticIndex:
+    """Memory-mapped float32 matrix of permanent-note embeddings, with an id map."""
+
+    def __init__(self, config: Config):
+        """
+        Initialize the index (nothing is loaded until first use).
+
+        Args:
+            config: Application configuration
+        """
+        self.config = config
+        self.model_name = config.embedding_model
+        self.ids_path = config.get_cache_path() / "embeddings.json"
+        self._refresh_lock = threading.Lock()
+        self._model_lock = threading.Lock()
+        self._last_refresh = 0.0
+        self._stale = True  # Set by invalidate() when notes were written
+        self._model: Any = None
+        # (id map mtime_ns, entries, matrix) of the loaded index
+        self._loaded: Optional[Tuple[int, List[Dict[str, Any]], np.ndarray]] = None
+
+    def refresh(self, max_age: float = 0.0, wait: bool = True) -> int:
+        """
+        Embed permanent notes added or changed since the last refresh, and drop deleted ones.
+
+        Args:
+            max_age: Skip the refresh if the last one finished less than this
+                     many seconds ago
+            wait: If another thread is already refreshing, wait for it (True)
+                  or return immediately (False)
+
+        Returns:
+            Number of notes embedded
+
+        Raises:
+            SemanticIndexUnavailable: If notes need embedding and the model can't be loaded
+        """
+        if self._is_fresh(max_age):
+            return 0
+        if not self._refresh_lock.acquire(blocking=wait):
+            return 0
+        try:
+            # Threads that waited for another thread's refresh don't repeat it
+            if self._is_fresh(max_age):
+                return 0
+            self._stale = False
+            entries, matrix = self._load()
+            existing = {entry["path"]: (row, entry) for row, entry in enumerate(entries)}
+
+            records = [
+                record
+                for record in get_catalog(self.config.vault_path).get_notes(
+                    self.config.get_permanent_notes_path()
+                )
+                if record.filepath.stem.upper() != "INDEX"
+            ]
+
+            new_entries: List[Dict[str, Any]] = []
+            kept_rows: List[int] = []
+            to_embed: List[Tuple[int, str]] = []
+            for record in records:
+                path = record.filepath.relative_to(self.config.vault_path).as_posix()
+                entry = {
+                    "path": path,
+                    "title": record.title,
+                    "mtime_ns": record.mtime_ns,
+                    "size": record.size,
+                }
+                previous = existing.get(path)
+                if previous is not None and (
+                    previous[1]["mtime_ns"], previous[1]["size"]
+                ) == (record.mtime_ns, record.size):
+                    kept_rows.append(previous[0])
+                else:
+                    kept_rows.append(-1)
+                    to_embed.append((len(new_entries), self._note_text(record.filepath, record.title)))
+                new_entries.append(entry)
+
+            if not to_embed and len(new_entries) == len(entries):
+                self._last_refresh = time.monotonic()
+                return 0
+
+            vectors = self.embed([text for _, text in to_embed]) if to_embed else None
+            dimensions = vectors.shape[1] if vectors is not None else matrix.shape[1]
+            new_matrix = np.zeros((len(new_entries), dimensions), dtype=np.float32)
+            for position, row in enumerate(kept_rows):
+                if row >= 0:
+                    new_matrix[position] = matrix[row]
+            for (position, _), vector in zip(to_embed, vectors if vectors is not None else []):
+                new_matrix[position] = vector
+
+            self._save(new_entries, new_matrix)
+            self._last_refresh = time.monotonic()
+            return len(to_embed)
+        finally:
+            self._refresh_lock.release()
+
+    def invalidate(self) -> None:
+        """Note that permanent notes were written, so the next refresh rescans even within max_age."""
+        self._stale = True
+
+    def _is_fresh(self, max_age: float) -> bool:
+        """Whether a refresh with this max_age can be skipped."""
+        return bool(max_age) and not self._stale and time.monotonic() - self._last_refresh < max_age
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed texts with the local model.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            float32 array of shape (len(texts), dimensions), rows L2-normalized
+
+        Raises:
+            SemanticIndexUnavailable: If the model can't be loaded
+        """
+        model = self._get_model()
+        vectors = model.encode(
+            texts,
+            batch_size=EMBED_BATCH_SIZE,
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+            show_progress_bar=False,
+        )
+        return np.asarray(vectors, dtype=np.float32).reshape(len(texts), -1)
+
+    def similar_to_text(
+        self, text: str, k: int = 10, exclude: Optional[str] = None
+    ) -> List[SemanticMatch]:
+        """
+        Find the permanent notes closest in meaning to a text.
+
+        Args:
+            text: Query text (e.g. a concept name and description)
+            k: Maximum number of matches
+            exclude: Relative path of a note to leave out
+
+        Returns:
+            Matches, most similar first
+        """
+        return self.similar_to_texts([text], k, exclude)[0]
+
+    def similar_to_texts(
+        self, texts: List[str], k: int = 10, exclude: Optional[str] = None
+    ) -> List[List[SemanticMatch]]:
+        """
+        Find the closest permanent notes for several texts (embedded in one batch).
+
+        Args:
+            texts: Query texts
+            k: Maximum number of matches per text
+            exclude: Relative path of a note to leave out
+
+        Returns:
+            List aligned with `texts` of matches, most similar first
+        """
+        entries, matrix = self._load()
+        if not entries or not texts:
+            return [[] for _ in texts]
+        return [
+            self._nearest(entries, matrix, vector, k, exclude) for vector in self.embed(texts)
+        ]
+
+    def similar_to_note(
+        self, filepath: Path, k: int = 5, embed_missing: bool = True
+    ) -> List[SemanticMatch]:
+        """
+        Find the permanent notes closest in meaning to a note.
+
+        Indexed notes use their stored vector (no model needed); other notes
+        (e.g. source summaries) are embedded on the fly unless embed_missing
+        is False.
+
+        Args:
+            filepath: Note file
+            k: Maximum number of matches (the note itself is excluded)
+            embed_missing: Embed the note if it isn't in the index (False
+                           returns no matches instead)
+
+        Returns:
+            Matches, most similar first
+        """
+        entries, matrix = self._load()
+        if not entries:
+            return []
+
+        try:
+            path = filepath.resolve().relative_to(self.config.vault_path.resolve()).as_posix()
+        except ValueError:
+            path = None
+
+        for row, entry in enumerate(entries):
+            if entry["path"] == path:
+                vector = np.asarray(matrix[row])
+                break
+        else:
+            if not embed_missing:
+                return []
+            vector = self.embed([self._note_text(filepath, filepath.stem)])[0]
+
+        return self._nearest(entries, matrix, vector, k, exclude=path)
+
+    def version(self) -> int:
+        """Modification time (ns) of the id map, 0 if there is no index yet; changes whenever the index does."""
+        try:
+            return self.ids_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return 0
+
+    def __len__(self) -> int:
+        return len(self._load()[0])
+
+    @staticmethod
+    def _nearest(
+        entries: List[Dict[str, Any]],
+        matrix: np.ndarray,
+        vector: np.ndarray,
+        k: int,
+        exclude: Optional[str],
+    ) -> List[SemanticMatch]:
+        """Brute-force top-k by cosine similarity."""
+        scores = matrix @ vector
+        # One spare candidate in case the excluded note is among the best
+        count = min(k + 1, len(entries))
+        top = np.argpartition(-scores, count - 1)[:count]
+        top = top[np.argsort(-scores[top])]
+
+        matches = []
+        for row in top:
+            entry = entries[int(row)]
+            if entry["path"] == exclude:
+                continue
+            matches.append(SemanticMatch(entry["title"], entry["path"], float(scores[row])))
+        return matches[:k]
+
+    def _note_text(self, filepath: Path, title: str) -> str:
+        """Text embedded for a note: its title and the start of its body."""
+        try:
+            body = parse_markdown_note(filepath)["content"]
+        except (OSError, UnicodeDecodeError):
+            body = ""
+        return f"{title}\n{body[:EMBED_BODY_CHARS]}"
+
+    def _get_model(self) -> Any:
+        """Load the embedding model on first use."""
+        with self._model_lock:
+            if self._model is None:
+                try:
+                    from sentence_transformers import SentenceTransformer
+                except ImportError as e:
+                    raise SemanticIndexUnavailable(
+                        "The semantic index needs sentence-transformers: "
+                        "pip install 'zettelkasten-cli[semantic]'"
+                    ) from e
+                self._model = SentenceTransformer(self.model_name, device="cpu")
+            return self._model
+
+    def _load(self) -> Tuple[List[Dict[str, Any]], np.ndarray]:
+        """Get the current entries and matrix, (re)mapping them if the id map changed."""
+        try:
+            mtime_ns = self.ids_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return [], np.zeros((0, 0), dtype=np.float32)
+
+        loaded = self._loaded
+        if loaded is not None and loaded[0] == mtime_ns:
+            return loaded[1], loaded[2]
+
+        data = json.loads(self.ids_path.read_text(encoding="utf-8"))
+        entries = data["entries"]
+        if data.get("model") != self.model_name or not entries:
+            # Built with another model (vectors aren't comparable): start over
+            entries, matrix = [], np.zeros((0, 0), dtype=np.float32)
+        else:
+            matrix = np.memmap(
+                self.ids_path.parent / data["matrix"],
+                dtype=np.float32,
+                mode="r",
+                shape=(len(entries), data["dimensions"]),
+            )
+
+        self._loaded = (mtime_ns, entries, matrix)
+        return entries, matrix
+
+    def _save(self, entries: List[Dict[str, Any]], matrix: np.ndarray) -> None:
+        """
+        Write a new matrix file and point the id map at it.
+
+        Each generation of the matrix gets its own file, so readers that still
+        have the previous one mapped keep a consistent view.
+        """
+        cache_path = self.ids_path.parent
+        old_matrix = None
+        if self.ids_path.exists():
+            old_matrix = json.loads(self.ids_path.read_text(encoding="utf-8")).get("matrix")
+
+        matrix_name = f"embeddings-{uuid.uuid4().hex[:12]}.f32"
+        temp_path = cache_path / f".{matrix_name}.tmp"
+        matrix.astype(np.float32).tofile(temp_path)
+        os.replace(temp_path, cache_path / matrix_name)
+
+        atomic_write_text(
+            self.ids_path,
+            json.dumps(
+                {
+                    "model": self.model_name,
+                    "dimensions": int(matrix.shape[1]) if matrix.size else 0,
+                    "matrix": matrix_name,
+                    "entries": entries,
+                }
+            ),
+        )
+
+        if old_matrix and old_matrix != matrix_name:
+            try:
+                (cache_path / old_matrix).unlink(missing_ok=True)
+            except OSError:
+                pass  # Still mapped by another process (Windows)
+
+
+_indexes: Dict[str, SemanticIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_semantic_index(config: Config) -> SemanticIndex:
+    """
+    Get a process-wide semantic index for the configured vault (the model is loaded once).
+
+    Args:
+        config: Application configuration
+
+    Returns:
+        Shared SemanticIndex instance
+    """
+    key = f"{config.vault_path.resolve()}|{config.embedding_model}"
+    with _indexes_lock:
+        if key not in _indexes:
+            _indexes[key] = SemanticIndex(config)
+        return _indexes[key]
@@ -0,0 +1,608 @@
+"""Persistent catalog of parsed note metadata shared by every vault scanner.
+
+Scanning the vault used to mean globbing a directory, reading every note and
+re-running the frontmatter regex, on every operation. The catalog keeps the
+parsed facts about each note in a SQLite database under the vault's cache
+directory, keyed by path, mtime and size, so only files that changed since
+the last scan are read and parsed again. It also keeps a title/alias -> file
+map so a note can be resolved by name without scanning its directory.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import time
+from contextlib import closing
+from dataclasses import dataclass, field
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from zettelkasten.core.config import cache_dir_for
+
+
+# Bump whenever the stored columns or parsing rules change; the table is then
+# dropped and rebuilt from the files on the next scan.
+SCHEMA_VERSION = 4
+
+FRONTMATTER_PATTERN = re.compile(r"^---\s*\n(.*?)\n---\s*\n", re.DOTALL)
+HEADING_PATTERN = re.compile(r"^#\s+(.+)$", re.MULTILINE)
+WIKILINK_PATTERN = re.compile(r"\[\[([^\]|]+)(?:\|([^\]]+))?\]\]")
+
+# A title lookup miss rescans its directory at most this often (catches titles
+# and aliases edited in place, which don't change the directory mtime)
+TITLE_MISS_REFRESH_SECONDS = 5.0
+
+# Leading characters of each note's body kept in the catalog (enough for
+# relevance ranking without rereading the file)
+BODY_EXCERPT_CHARS = 2000
+
+
+@dataclass
+class NoteRecord:
+    """Parsed metadata for a single note file."""
+
+    filepath: Path
+    title: str
+    mtime_ns: int
+    size: int
+    content_hash: str = ""  # sha256 of the file content
+    has_frontmatter: bool = False
+    heading: Optional[str] = None  # Text of the first "# " heading
+    aliases: List[str] = field(default_factory=list)
+    properties: Dict[str, Any] = field(default_factory=dict)
+    tags: List[str] = field(default_factory=list)
+    source_url: Optional[str] = None
+    merge_into: Optional[str] = None
+    is_new: Optional[bool] = None
+    links: List[Tuple[str, str]] = field(default_factory=list)  # (target, display text)
+    body_excerpt: str = ""  # Start of the body, without frontmatter and title heading
+    is_empty: bool = False  # Only frontmatter/title/comments, no real content
+    is_blank: bool = False  # File has no content at all
+
+
+class VaultCatalog:
+    """SQLite-backed cache of note metadata, refreshed by mtime and size."""
+
+    def __init__(self, vault_path: Path):
+        """
+        Initialize the catalog for a vault.
+
+        Args:
+            vault_path: Path to the vault root directory
+        """
+        self.vault_path = vault_path
+        self.db_path = cache_dir_for(vault_path) / "catalog.sqlite3"
+        # directory key -> (directory mtime_ns, monotonic time of the refresh,
+        # normalized title -> filename)
+        self._title_maps: Dict[str, Tuple[int, float, Dict[str, str]]] = {}
+
+    def get_notes(self, directory: Path, pattern: str = "*.md") -> List[NoteRecord]:
+        """
+        Get metadata for every note in a directory (non-recursive).
+
+        Files added, changed or removed since the last call are re-parsed or
+        dropped; everything else is served straight from the database.
+
+        Args:
+            directory: Directory to scan
+            pattern: Filename glob to match
+
+        Returns:
+            List of NoteRecord objects sorted by filename
+        """
+        on_disk: Dict[str, Tuple[int, int]] = {}
+        if directory.is_dir():
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if fnmatch(entry.name, pattern) and entry.is_file():
+                        stat = entry.stat()
+                        on_disk[entry.name] = (stat.st_mtime_ns, stat.st_size)
+
+        directory_key = str(directory.resolve())
+        records = []
+
+        with closing(self._connect()) as conn, conn:
+            cached = {
+                row["name"]: row
+                for row in conn.execute(
+                    "SELECT * FROM notes WHERE directory = ?", (directory_key,)
+                )
+            }
+
+            # Forget files that no longer exist (only those matching this pattern)
+            removed = [name for name in cached if name not in on_disk and fnmatch(name, pattern)]
+            for table in ("notes", "titles"):
+                conn.executemany(
+                    f"DELETE FROM {table} WHERE directory = ? AND name = ?",
+                    [(directory_key, name) for name in removed],
+                )
+
+            for name in sorted(on_disk):
+                mtime_ns, size = on_disk[name]
+                row = cached.get(name)
+                if row is not None and row["mtime_ns"] == mtime_ns and row["size"] == size:
+                    records.append(self._row_to_record(directory / name, row))
+                    continue
+
+                record = parse_note_file(directory / name, mtime_ns, size)
+                if record is None:
+                    continue
+                self._store(conn, directory_key, name, record)
+                records.append(record)
+
+        return records
+
+    def get_note(self, filepath: Path) -> Optional[NoteRecord]:
+        """
+        Get metadata for a single note, re-parsing it only if it changed.
+
+        Args:
+            filepath: Path to the note file
+
+        Returns:
+            NoteRecord, or None if the file doesn't exist or can't be read
+        """
+        try:
+            stat = filepath.stat()
+        except OSError:
+            return None
+
+        directory_key = str(filepath.parent.resolve())
+
+        with closing(self._connect()) as conn, conn:
+            row = conn.execute(
+                "SELECT * FROM notes WHERE directory = ? AND name = ?",
+                (directory_key, filepath.name),
+            ).fetchone()
+            if row is not None and row["mtime_ns"] == stat.st_mtime_ns and row["size"] == stat.st_size:
+                return self._row_to_record(filepath, row)
+
+            record = parse_note_file(filepath, stat.st_mtime_ns, stat.st_size)
+            if record is not None:
+                self._store(conn, directory_key, filepath.name, record)
+            return record
+
+    def find_by_title(self, directory: Path, title: str) -> Optional[NoteRecord]:
+        """
+        Find the note in a directory whose title, first heading, alias or filename
+        matches, ignoring case and extra whitespace.
+
+        Lookups are served from an in-memory map that is rebuilt when the
+        directory's mtime changes (a file was added, removed or renamed); a hit
+        is re-checked against the file's own mtime before it is returned. A
+        title or alias can be edited in place without touching the directory
+        mtime, so a miss also refreshes the map, but at most once every
+        TITLE_MISS_REFRESH_SECONDS per directory.
+
+        Args:
+            directory: Directory to search (non-recursive)
+            title: Title or alias to look for
+
+        Returns:
+            NoteRecord of the matching note, or None if no note has that name
+        """
+        key = normalize_title(title)
+        directory_key = str(directory.resolve())
+        try:
+            directory_mtime = directory.stat().st_mtime_ns
+        except OSError:
+            return None
+
+        cached = self._title_maps.get(directory_key)
+        if cached is not None and cached[0] == directory_mtime:
+            name = cached[2].get(key)
+            if name is not None:
+                record = self.get_note(directory / name)
+                if record is not None and key in title_keys(record):
+                    return record
+            elif time.monotonic() - cached[1] < TITLE_MISS_REFRESH_SECONDS:
+                # Misses in quick succession (several spellings of a concept,
+                # several directories) share one refresh
+                return None
+
+        # Directory changed, the hit went stale, or a miss may be an in-place
+        # title edit: refresh the catalog for the directory and rebuild the map
+        # from the persisted titles table
+        self.get_notes(directory)
+        title_map: Dict[str, str] = {}
+        with closing(self._connect()) as conn:
+            for row in conn.execute(
+                "SELECT key, name FROM titles WHERE directory = ? ORDER BY name",
+                (directory_key,),
+            ):
+                title_map.setdefault(row["key"], row["name"])
+        self._title_maps[directory_key] = (directory_mtime, time.monotonic(), title_map)
+
+        name = title_map.get(key)
+        return self.get_note(directory / name) if name else None
+
+    def get_descriptions(self, content_hashes: List[str]) -> Dict[str, str]:
+        """
+        Look up cached one-line descriptions by note content hash.
+
+        Args:
+            content_hashes: Content hashes to look up
+
+        Returns:
+            Dict mapping content hash to description (missing hashes are omitted)
+        """
+        descriptions = {}
+        with closing(self._connect()) as conn:
+            # Stay well below SQLite's bound-parameter limit
+            for start in range(0, len(content_hashes), 500):
+                batch = content_hashes[start:start + 500]
+                placeholders = ",".join("?" * len(batch))
+                for row in conn.execute(
+                    f"SELECT content_hash, description FROM descriptions "
+                    f"WHERE content_hash IN ({placeholders})",
+                    batch,
+                ):
+                    descriptions[row["content_hash"]] = row["description"]
+        return descriptions
+
+    def set_description(self, content_hash: str, description: str) -> None:
+        """
+        Cache the one-line description generated for a note's content.
+
+        Args:
+            content_hash: Content hash of the note
+            description: Generated description
+        """
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO descriptions (content_hash, description) VALUES (?, ?)",
+                (content_hash, description),
+            )
+            conn.execute(
+                "DELETE FROM description_failures WHERE content_hash = ?", (content_hash,)
+            )
+
+    def get_description_failures(self, content_hashes: List[str], max_age: float) -> Set[str]:
+        """
+        Find content hashes whose description failed to generate recently.
+
+        Args:
+            content_hashes: Content hashes to look up
+            max_age: Only failures at most this many seconds old count
+
+        Returns:
+            Set of content hashes that shouldn't be retried yet
+        """
+        cutoff = time.time() - max_age
+        failed = set()
+        with closing(self._connect()) as conn:
+            for start in range(0, len(content_hashes), 500):
+                batch = content_hashes[start:start + 500]
+                placeholders = ",".join("?" * len(batch))
+                for row in conn.execute(
+                    f"SELECT content_hash FROM description_failures "
+                    f"WHERE content_hash IN ({placeholders}) AND failed_at >= ?",
+                    [*batch, cutoff],
+                ):
+                    failed.add(row["content_hash"])
+        return failed
+
+    def set_description_failed(self, content_hash: str) -> None:
+        """
+        Record that generating a description for a note's content failed.
+
+        Args:
+            content_hash: Content hash of the note
+        """
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO description_failures (content_hash, failed_at) VALUES (?, ?)",
+                (content_hash, time.time()),
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection, creating or migrating the schema as needed."""
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+
+        # Only the notes table is derived from parsing rules; cached descriptions
+        # cost an API call each and survive schema changes.
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            conn.execute("DROP TABLE IF EXISTS notes")
+            conn.execute("DROP TABLE IF EXISTS titles")
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS notes (
+                directory TEXT NOT NULL,
+                name TEXT NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                content_hash TEXT NOT NULL,
+                title TEXT NOT NULL,
+                has_frontmatter INTEGER NOT NULL,
+                heading TEXT,
+                aliases TEXT NOT NULL,
+                properties TEXT NOT NULL,
+                tags TEXT NOT NULL,
+                source_url TEXT,
+                merge_into TEXT,
+                is_new INTEGER,
+                links TEXT NOT NULL,
+                body_excerpt TEXT NOT NULL,
+                is_empty INTEGER NOT NULL,
+                is_blank INTEGER NOT NULL,
+                PRIMARY KEY (directory, name)
+            )
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS titles (
+                directory TEXT NOT NULL,
+                key TEXT NOT NULL,
+                name TEXT NOT NULL,
+                PRIMARY KEY (directory, key, name)
+            )
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS descriptions (
+                content_hash TEXT PRIMARY KEY,
+                description TEXT NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS description_failures (
+                content_hash TEXT PRIMARY KEY,
+                failed_at REAL NOT NULL
+            )
+            """
+        )
+        return conn
+
+    def _store(
+        self, conn: sqlite3.Connection, directory_key: str, name: str, record: NoteRecord
+    ) -> None:
+        """Insert or replace the rows for a parsed note."""
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO notes (
+                directory, name, mtime_ns, size, content_hash, title, has_frontmatter,
+                heading, aliases, properties, tags, source_url, merge_into, is_new, links,
+                body_excerpt, is_empty, is_blank
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                directory_key,
+                name,
+                record.mtime_ns,
+                record.size,
+                record.content_hash,
+                record.title,
+                int(record.has_frontmatter),
+                record.heading,
+                json.dumps(record.aliases),
+                json.dumps(record.properties),
+                json.dumps(record.tags),
+                record.source_url,
+                record.merge_into,
+                None if record.is_new is None else int(record.is_new),
+                json.dumps(record.links),
+                record.body_excerpt,
+                int(record.is_empty),
+                int(record.is_blank),
+            ),
+        )
+        conn.execute(
+            "DELETE FROM titles WHERE directory = ? AND name = ?", (directory_key, name)
+        )
+        conn.executemany(
+            "INSERT OR IGNORE INTO titles (directory, key, name) VALUES (?, ?, ?)",
+            [(directory_key, key, name) for key in title_keys(record)],
+        )
+
+    def _row_to_record(self, filepath: Path, row: sqlite3.Row) -> NoteRecord:
+        """Build a NoteRecord from a database row."""
+        return NoteRecord(
+            filepath=filepath,
+            title=row["title"],
+            mtime_ns=row["mtime_ns"],
+            size=row["size"],
+            content_hash=row["content_hash"],
+            has_frontmatter=bool(row["has_frontmatter"]),
+            heading=row["heading"],
+            aliases=json.loads(row["aliases"]),
+            properties=json.loads(row["properties"]),
+            tags=json.loads(row["tags"]),
+            source_url=row["source_url"],
+            merge_into=row["merge_into"],
+            is_new=None if row["is_new"] is None else bool(row["is_new"]),
+            links=[tuple(link) for link in json.loads(row["links"])],
+            body_excerpt=row["body_excerpt"],
+            is_empty=bool(row["is_empty"]),
+            is_blank=bool(row["is_blank"]),
+        )
+
+
+_catalogs: Dict[str, VaultCatalog] = {}
+
+
+def get_catalog(vault_path: Path) -> VaultCatalog:
+    """
+    Get a process-wide catalog for a vault, so its in-memory title maps are
+    reused across calls.
+
+    Args:
+        vault_path: Path to the vault root directory
+
+    Returns:
+        Shared VaultCatalog instance
+    """
+    key = str(vault_path.resolve())
+    if key not in _catalogs:
+        _catalogs[key] = VaultCatalog(vault_path)
+    return _catalogs[key]
+
+
+def parse_note_file(filepath: Path, mtime_ns: int, size: int) -> Optional[NoteRecord]:
+    """
+    Read and parse a note file into a NoteRecord.
+
+    Args:
+        filepath: Path to the note file
+        mtime_ns: Modification time (ns) observed before reading
+        size: File size observed before reading
+
+    Returns:
+        NoteRecord, or None if the file can't be read
+    """
+    try:
+        content = filepath.read_text()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+    record = NoteRecord(
+        filepath=filepath,
+        title=filepath.stem,
+        mtime_ns=mtime_ns,
+        size=size,
+        content_hash=hashlib.sha256(content.encode("utf-8")).hexdigest(),
+    )
+
+    # Completely empty file
+    if not content.strip():
+        record.is_empty = True
+        record.is_blank = True
+        return record
+
+    body = content
+    frontmatter_match = FRONTMATTER_PATTERN.match(content)
+    if frontmatter_match:
+        record.has_frontmatter = True
+        record.properties = parse_frontmatter(frontmatter_match.group(1))
+        body = content[frontmatter_match.end():]
+
+    properties = record.properties
+
+    # Title: frontmatter first, then first heading, then filename
+    heading_match = HEADING_PATTERN.search(content)
+    if heading_match:
+        record.heading = heading_match.group(1).strip()
+    if properties.get("title"):
+        record.title = str(properties["title"])
+    elif heading_match:
+        record.title = heading_match.group(1).strip()
+
+    record.tags = _as_list(properties.get("tags"))
+    record.aliases = _as_list(properties.get("aliases") or properties.get("alias"))
+
+    source_url = properties.get("source") or properties.get("source_url")
+    if isinstance(source_url, str):
+        record.source_url = source_url.strip("\"'")
+
+    if isinstance(properties.get("merge_into"), str):
+        record.merge_into = properties["merge_into"]
+    if isinstance(properties.get("is_new"), str):
+        record.is_new = properties["is_new"].lower() != "false"
+
+    record.links = [
+        (match.group(1).strip(), (match.group(2) or match.group(1)).strip())
+        for match in WIKILINK_PATTERN.finditer(body)
+    ]
+
+    excerpt = body.lstrip()
+    if excerpt.startswith("# "):
+        excerpt = excerpt.split("\n", 1)[1] if "\n" in excerpt else ""
+    record.body_excerpt = excerpt.strip()[:BODY_EXCERPT_CHARS]
+
+    # A note is empty if, after frontmatter and the title heading, only
+    # whitespace or HTML comments remain. Notes without frontmatter never count.
+    if frontmatter_match:
+        remainder = re.sub(r"^#\s+.+?\n\n", "", body, flags=re.MULTILINE).strip()
+        remainder = re.sub(r"<!--.*?-->", "", remainder, flags=re.DOTALL).strip()
+        record.is_empty = not remainder
+
+    return record
+
+
+def normalize_title(title: str) -> str:
+    """Normalize a note title for lookups (case-insensitive, collapsed whitespace)."""
+    return " ".join(title.strip("\"'").split()).casefold()
+
+
+def title_keys(record: NoteRecord) -> Set[str]:
+    """
+    Get every normalized name a note can be looked up by.
+
+    Args:
+        record: Parsed note
+
+    Returns:
+        Normalized title, first heading, aliases and filename stem
+    """
+    names = [record.title, record.heading or "", record.filepath.stem, *record.aliases]
+    return {normalize_title(name) for name in names if name and name.strip()}
+
+
+def parse_frontmatter(frontmatter_text: str) -> Dict[str, Any]:
+    """
+    Parse simple YAML frontmatter (key: value pairs and indented lists).
+
+    Args:
+        frontmatter_text: Text between the --- delimiters
+
+    Returns:
+        Dict of frontmatter key-value pairs (lists for indented list values)
+    """
+    frontmatter: Dict[str, Any] = {}
+    current_key = None
+    current_list: List[str] = []
+
+    for line in frontmatter_text.split("\n"):
+        # Check if line is a key: value pair
+        if ":" in line and not line.startswith(" "):
+            # Save previous list if any
+            if current_key and current_list:
+                frontmatter[current_key] = current_list
+                current_list = []
+
+            key, value = line.split(":", 1)
+            key = key.strip()
+            value = value.strip()
+
+            if value:
+                # Strip surrounding quotes from value if present
+                if (value.startswith('"') and value.endswith('"')) or (
+                    value.startswith("'") and value.endswith("'")
+                ):
+                    value = value[1:-1]
+                frontmatter[key] = value
+                current_key = None
+            else:
+                # Might be start of a list
+                current_key = key
+                current_list = []
+
+        elif line.startswith("  - ") and current_key:
+            # List item
+            current_list.append(line.strip()[2:].strip())
+
+    # Save any remaining list
+    if current_key and current_list:
+        frontmatter[current_key] = current_list
+
+    return frontmatter
+
+
+def _as_list(value: Any) -> List[str]:
+    """Normalize a frontmatter value like '[a, b]', 'a, b' or a list into a list."""
+    if isinstance(value, list):
+        return [str(v).strip() for v in value if str(v).strip()]
+    if isinstance(value, str):
+        return [v.strip() for v in value.strip("[]").split(",") if v.strip()]
+    return []
@@ -5,6 +5,8 @@ from typing import List, Dict, Optional
 import re
 
 from zettelkasten.core.config import Config
+from zettelkasten.utils.bm25 import BM25Index
+from zettelkasten.utils.vault_catalog import get_catalog
 
 
 def get_existing_concepts(config: Config) -> List[Dict[str, str]]:
@@ -17,33 +19,71 @@ def get_existing_concepts(config: Config) -> List[Dict[str, str]]:
     Returns:
         List of dicts with 'title' and 'filepath' keys
     """
-    permanent_notes_dir = config.get_permanent_notes_path()
-    concepts = []
+    catalog = get_catalog(config.vault_path)
 
-    # Find all markdown files except INDEX
-    note_files = [f for f in permanent_notes_dir.glob("*.md") if f.stem.upper() != "INDEX"]
-
-    for filepath in note_files:
-        # Parse the note to get its title
-        title = _extract_title(filepath)
-        if title:
-            concepts.append({"title": title, "filepath": str(filepath)})
-
-    return concepts
-
-
-def get_existing_concept_titles(config: Config) -> List[str]:
-    """
-    Get a simple list of all existing concept titles.
+    # All markdown files except INDEX, with titles from the catalog
+    return [
+        {"title": record.title, "filepath": str(record.filepath)}
+        for record in catalog.get_notes(config.get_permanent_notes_path())
+        if record.filepath.stem.upper() != "INDEX"
+    ]
 
-    Args:
-        config: Application configuration
 
-    Returns:
-        List of concept titles
-    """
-    concepts = get_existing_concepts(config)
-    return [c["title"] for c in concepts]
+class ConceptIndex:
+    """BM25 index over the existing concept notes (title, aliases and the start of the body)."""
+
+    def __init__(self, titles: List[str], documents: List[str]):
+        """
+        Initialize the index.
+
+        Args:
+            titles: Concept titles
+            documents: Indexed text of each concept, aligned with `titles`
+        """
+        self.titles = titles
+        self.bm25 = BM25Index(documents)
+
+    @classmethod
+    def build(cls, config: Config) -> "ConceptIndex":
+        """
+        Index every existing concept note in the vault.
+
+        Args:
+            config: Application configuration
+
+        Returns:
+            ConceptIndex
+        """
+        catalog = get_catalog(config.vault_path)
+        titles = []
+        documents = []
+        for record in catalog.get_notes(config.get_permanent_notes_path()):
+            if record.filepath.stem.upper() == "INDEX":
+                continue
+            # Titles and aliases are repeated so they outweigh incidental body terms
+            names = " ".join([record.title, *record.aliases])
+            titles.append(record.title)
+            documents.append(f"{names}\n{names}\n{record.body_excerpt}")
+        return cls(titles, documents)
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    def relevant_titles(self, query: str, limit: int) -> List[str]:
+        """
+        Get the titles of the concepts most relevant to a text.
+
+        Args:
+            query: Text to match (e.g. a note's title and content)
+            limit: Maximum number of titles
+
+        Returns:
+            Concept titles, most relevant first (all of them, in vault order,
+            if there are no more than `limit`)
+        """
+        if len(self.titles) <= limit:
+            return list(self.titles)
+        return [self.titles[i] for i in self.bm25.top_k(query, limit)]
 
 
 def find_matching_concept(concept_name: str, config: Config) -> Optional[Dict[str, str]]:
@@ -59,10 +99,17 @@ def find_matching_concept(concept_name: str, config: Config) -> Optional[Dict[st
     Returns:
         Dict with 'title' and 'filepath' if found, None otherwise
     """
-    existing_concepts = get_existing_concepts(config)
-
-    # Normalize the search name for comparison
+    # Exact title/alias match (and simple plural variants) straight from the
+    # catalog's title map, without scanning the directory
+    catalog = get_catalog(config.vault_path)
     search_name = concept_name.lower().strip()
+    for candidate in (search_name, search_name.rstrip('s'), search_name.rstrip('s') + 's'):
+        record = catalog.find_by_title(config.get_permanent_notes_path(), candidate)
+        if record is not None and record.filepath.stem.upper() != "INDEX":
+            return {"title": record.title, "filepath": str(record.filepath)}
+
+    # Fall back to fuzzy comparison against every concept
+    existing_concepts = get_existing_concepts(config)
 
     for concept in existing_concepts:
         existing_name = concept["title"].lower().strip()
@@ -86,39 +133,6 @@ def find_matching_concept(concept_name: str, config: Config) -> Optional[Dict[st
     return None
 
 
-def _extract_title(filepath: Path) -> Optional[str]:
-    """
-    Extract title from a markdown file's frontmatter or first heading.
-
-    Args:
-        filepath: Path to markdown file
-
-    Returns:
-        Title string or None
-    """
-    try:
-        content = filepath.read_text()
-
-        # Try to extract from YAML frontmatter
-        frontmatter_match = re.match(r"^---\s*\n(.*?)\n---\s*\n", content, re.DOTALL)
-        if frontmatter_match:
-            frontmatter_text = frontmatter_match.group(1)
-            for line in frontmatter_text.split("\n"):
-                if line.startswith("title:"):
-                    return line.split(":", 1)[1].strip()
-
-        # Fallback: extract from first # heading
-        heading_match = re.search(r"^#\s+(.+)$", content, re.MULTILINE)
-        if heading_match:
-            return heading_match.group(1).strip()
-
-        # Last resort: use filename
-        return filepath.stem
-
-    except Exception:
-        return None
-
-
 def parse_markdown_note(filepath: Path) -> Dict[str, str]:
     """
     Parse a markdown note, extracting title, content, and any existing frontmatter.
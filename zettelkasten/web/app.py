@@ -1,19 +1,44 @@
 """FastAPI web application for Zettelkasten UI."""
 
+import asyncio
+import hashlib
+import html
+import json
+import os
+import threading
+import time
+from email.utils import formatdate, parsedate_to_datetime
 from pathlib import Path
 from typing import List, Optional
+import anyio
 import markdown
 from fastapi import FastAPI, Request, HTTPException, Form, BackgroundTasks
-from fastapi.responses import HTMLResponse, RedirectResponse, FileResponse
+from fastapi.responses import (
+    Response,
+    HTMLResponse,
+    RedirectResponse,
+    JSONResponse,
+    StreamingResponse,
+)
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+from starlette.concurrency import run_in_threadpool
 from starlette.middleware.sessions import SessionMiddleware
 
 from zettelkasten.core.config import Config
 from zettelkasten.core.models import ContentType
-from zettelkasten.core.workflow import AddWorkflow
+from zettelkasten.utils.search_index import MATCH_END, MATCH_START, get_search_index
+from zettelkasten.utils.vault_catalog import get_catalog
+from zettelkasten.web.job_queue import AddJobQueue
+from zettelkasten.web.media import media_response
+from zettelkasten.web.render_cache import RenderCache
 
 # Initialize FastAPI app
+#
+# Route handlers that read the vault, render markdown, query SQLite or call
+# Claude are plain `def` functions on purpose: FastAPI runs those in a worker
+# thread pool (sized by WEB_HANDLER_THREADS), so one slow page never stalls
+# the event loop. Only handlers that do no blocking work are `async def`.
 app = FastAPI(title="Zettelkasten Web UI", version="0.1.0")
 
 # Add session middleware for flash messages
@@ -29,6 +54,27 @@ app.mount("/static", StaticFiles(directory=str(static_path)), name="static")
 # Load config first (needed for episodes path)
 config = Config.from_env()
 
+# Shared note metadata catalog (keeps its title -> file map in memory between requests)
+catalog = get_catalog(config.vault_path)
+
+# Rendered note pages, reused until the note file changes
+render_cache = RenderCache(max_bytes=config.web_render_cache_mb * 1024 * 1024)
+
+# Background queue for /add-url (processing a URL takes minutes)
+add_queue = AddJobQueue(config, workers=config.web_add_workers)
+
+# Full-text search index (notes saved through the app update it directly; a
+# background refresh catches up with edits made elsewhere)
+search_index = get_search_index(config.vault_path)
+SEARCH_PAGE_SIZE = 20
+
+# Local embedding index behind the "similar notes" panel (SEMANTIC_INDEX=true)
+semantic_index = None
+if config.semantic_index_enabled:
+    from zettelkasten.utils.semantic_index import get_semantic_index
+    semantic_index = get_semantic_index(config)
+SIMILAR_NOTES = 5
+
 # Note: Episodes are served via custom routes (/episodes for management, /episode-media for files)
 # We don't mount /episodes as static files because that would prevent the /episodes routes from working
 
@@ -36,6 +82,37 @@ config = Config.from_env()
 templates_path = Path(__file__).parent / "templates"
 templates = Jinja2Templates(directory=str(templates_path))
 
+# Part of every page ETag, so pages are re-sent after the templates change
+TEMPLATES_VERSION = str(max((p.stat().st_mtime_ns for p in templates_path.glob("*.html")), default=0))
+
+
+@app.on_event("startup")
+async def size_handler_thread_pool():
+    """Bound the thread pool that runs the sync route handlers."""
+    anyio.to_thread.current_default_thread_limiter().total_tokens = max(1, config.web_handler_threads)
+
+
+@app.on_event("startup")
+def warm_transcription_workers():
+    """Start the Whisper worker pool so /add-url requests never wait for model loading."""
+    if config.transcription_workers > 0:
+        from zettelkasten.processors.transcription import get_transcription_pool
+        get_transcription_pool(config.whisper_model_size, config.transcription_workers).warm_up()
+
+
+@app.on_event("startup")
+def start_add_queue():
+    """Start the /add-url workers (and pick up jobs interrupted by the last shutdown)."""
+    add_queue.start()
+
+
+@app.on_event("startup")
+def refresh_search_index():
+    """Bring the search index up to date in the background (the first build can take a while)."""
+    threading.Thread(target=search_index.refresh, name="search-refresh", daemon=True).start()
+    if semantic_index is not None:
+        threading.Thread(target=refresh_semantic_index_task, name="semantic-refresh", daemon=True).start()
+
 
 # Flash message helpers
 def set_flash(request: Request, message: str, category: str = "info"):
@@ -51,6 +128,82 @@ def get_flashed_messages(request: Request) -> List[dict]:
     return messages
 
 
+# Conditional request helpers (ETag / Last-Modified)
+def page_etag(page: dict, variant: str = "") -> str:
+    """Weak ETag for a page rendered from a file (content hash + request path + templates)."""
+    digest = hashlib.sha256(f"{page['hash']}|{variant}|{TEMPLATES_VERSION}".encode("utf-8"))
+    return f'W/"{digest.hexdigest()[:20]}"'
+
+
+def not_modified(request: Request, etag: str, mtime: float) -> Optional[Response]:
+    """
+    Answer a conditional GET with 304 if the client's copy is still current.
+
+    If-None-Match takes precedence over If-Modified-Since. Pages with pending
+    flash messages are never answered with 304 (the flash must be shown).
+
+    Args:
+        request: Incoming request
+        etag: Current ETag of the page
+        mtime: Modification time of the file the page is rendered from
+
+    Returns:
+        304 response, or None if the page must be rendered
+    """
+    if request.session.get("flash_messages"):
+        return None
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # Weak comparison: ignore W/ prefixes
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if "*" not in tags and etag.removeprefix("W/") not in tags:
+            return None
+    else:
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since is None:
+            return None
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return None
+        # HTTP dates have one-second resolution
+        if int(mtime) > since:
+            return None
+
+    return Response(status_code=304, headers=validator_headers(etag, mtime))
+
+
+def validator_headers(etag: str, mtime: float) -> dict:
+    """ETag, Last-Modified and Cache-Control headers (clients must revalidate before reuse)."""
+    return {
+        "ETag": etag,
+        "Last-Modified": formatdate(mtime, usegmt=True),
+        "Cache-Control": "no-cache",
+    }
+
+
+def add_validators(response: Response, etag: str, mtime: float, cacheable: bool = True) -> Response:
+    """
+    Add validator headers to a rendered page.
+
+    Args:
+        response: Rendered page
+        etag: ETag of the page
+        mtime: Modification time of the file the page is rendered from
+        cacheable: False for one-off variants (e.g. showing flash messages),
+                   which are marked no-store instead
+
+    Returns:
+        The same response
+    """
+    if cacheable:
+        response.headers.update(validator_headers(etag, mtime))
+    else:
+        response.headers["Cache-Control"] = "no-store"
+    return response
+
+
 # Background task for reindexing
 def rebuild_indices_task():
     """Rebuild indices in the background."""
@@ -62,6 +215,49 @@ def rebuild_indices_task():
     except Exception as e:
         print(f"✗ Error rebuilding indices: {e}")
 
+    # Pick up notes moved, merged or created by the request
+    try:
+        search_index.refresh()
+    except Exception as e:
+        print(f"✗ Error updating search index: {e}")
+    refresh_semantic_index_task()
+
+
+def refresh_semantic_index_task(max_age: float = 0.0):
+    """Embed new and changed permanent notes (if the semantic index is enabled)."""
+    if semantic_index is None:
+        return
+    try:
+        semantic_index.refresh(max_age=max_age, wait=False)
+    except Exception as e:
+        print(f"✗ Error updating semantic index: {e}")
+
+
+def similar_notes_for(full_path: Path) -> List[dict]:
+    """
+    Permanent notes closest in meaning to a note, for the note page.
+
+    Only notes already in the index get the panel: embedding any other note
+    would load the model and run it on the request thread.
+
+    Args:
+        full_path: Note file
+
+    Returns:
+        List of dicts with 'title', 'url' and 'score' (empty if the semantic
+        index is disabled or the note isn't in it)
+    """
+    if semantic_index is None or full_path.suffix != ".md":
+        return []
+    try:
+        matches = semantic_index.similar_to_note(full_path, k=SIMILAR_NOTES, embed_missing=False)
+    except Exception:
+        return []
+    return [
+        {"title": match.title, "url": f"/note/{match.path}", "score": round(match.score, 2)}
+        for match in matches
+    ]
+
 
 # Exception handlers
 @app.exception_handler(HTTPException)
@@ -98,7 +294,7 @@ async def general_exception_handler(request: Request, exc: Exception):
 
 
 @app.get("/", response_class=HTMLResponse)
-async def home(request: Request):
+def home(request: Request):
     """Home page showing vault overview."""
     from zettelkasten.utils.episode_manager import EpisodeManager
 
@@ -107,10 +303,10 @@ async def home(request: Request):
     sources_path = config.get_sources_path()
     staging_path = config.get_staging_path()
 
-    # Count notes
-    permanent_notes = list(permanent_notes_path.glob("*.md"))
+    # Count notes (metadata comes from the catalog; only changed files are re-read)
+    permanent_notes = catalog.get_notes(permanent_notes_path)
     # Exclude index files
-    permanent_notes = [n for n in permanent_notes if n.stem.upper() not in ["INDEX", "PEOPLE-INDEX", "PERSON-INDEX"]]
+    permanent_notes = [n for n in permanent_notes if n.filepath.stem.upper() not in ["INDEX", "PEOPLE-INDEX", "PERSON-INDEX"]]
 
     sources = list(sources_path.glob("*.md"))
     sources = [s for s in sources if s.stem.upper() != "INDEX"]
@@ -121,13 +317,8 @@ async def home(request: Request):
     episode_manager = EpisodeManager(config)
     episodes = episode_manager.list_episodes()
 
-    # Count person notes (properly parse tags from frontmatter)
-    person_notes = []
-    for note_file in permanent_notes:
-        content = note_file.read_text()
-        tags = extract_tags_from_frontmatter(content)
-        if "person" in tags or "contact" in tags:
-            person_notes.append(note_file)
+    # Count person notes (tags are parsed from frontmatter by the catalog)
+    person_notes = [n for n in permanent_notes if "person" in n.tags or "contact" in n.tags]
 
     stats = {
         "total_concepts": len(permanent_notes),  # Include all notes (people are a subset)
@@ -161,7 +352,7 @@ async def home(request: Request):
 
 
 @app.get("/indexes/{index_type}", response_class=HTMLResponse)
-async def view_index(request: Request, index_type: str):
+def view_index(request: Request, index_type: str):
     """View an index (concepts, people, or sources)."""
 
     if index_type == "concepts":
@@ -179,34 +370,27 @@ async def view_index(request: Request, index_type: str):
     if not index_path.exists():
         raise HTTPException(status_code=404, detail=f"{title} does not exist. Run 'zk index' to create it.")
 
-    # Read and render markdown
-    content = index_path.read_text()
-
-    # Extract frontmatter properties
-    properties = extract_frontmatter_properties(content)
-
-    # Remove frontmatter from content before rendering
-    content_without_fm = remove_frontmatter(content)
-
-    html_content = markdown.markdown(content_without_fm, extensions=['extra', 'codehilite'])
-
-    # Convert wikilinks to HTML links
-    html_content = convert_wikilinks(html_content, base_path="")
+    page = render_cache.get_or_render(index_path, lambda: render_markdown_file(index_path))
+    etag = page_etag(page, variant=f"index:{index_type}")
+    cached = not_modified(request, etag, page["mtime"])
+    if cached is not None:
+        return cached
 
-    return templates.TemplateResponse(
+    response = templates.TemplateResponse(
         "index.html",
         {
             "request": request,
             "title": title,
-            "content": html_content,
-            "properties": properties,
+            "content": page["html"],
+            "properties": page["properties"],
             "active_section": index_type,
         }
     )
+    return add_validators(response, etag, page["mtime"])
 
 
 @app.get("/note/{note_path:path}", response_class=HTMLResponse)
-async def view_note(request: Request, note_path: str):
+def view_note(request: Request, note_path: str, background_tasks: BackgroundTasks):
     """View a specific note."""
 
     # Construct full path - try direct path first
@@ -261,14 +445,88 @@ async def view_note(request: Request, note_path: str):
                     full_path = potential_path
                     break
 
+            # Links like [[Flow State]] name a note by title or alias, not filename
+            if not full_path.exists():
+                for search_dir in search_dirs:
+                    record = catalog.find_by_title(search_dir, Path(note_path).name)
+                    if record is not None:
+                        full_path = record.filepath
+                        break
+
         if not full_path.exists():
             raise HTTPException(status_code=404, detail="Note not found")
 
+    # Rendering is cached per file until the file changes; the same file can
+    # render differently depending on the path it was requested under
+    page = render_cache.get_or_render(
+        full_path, lambda: render_note(full_path, note_path), variant=note_path
+    )
+    is_text_file = page["is_text_file"]
+
+    # The similar notes panel changes whenever the semantic index does (other
+    # notes added, edited or renamed), so the index version is part of the
+    # validators; the panel itself is only built when the page is sent
+    semantic_version = 0
+    if semantic_index is not None:
+        semantic_version = semantic_index.version()
+        background_tasks.add_task(refresh_semantic_index_task, config.web_search_refresh_seconds)
+    etag = page_etag(page, variant=f"note:{note_path}|{semantic_version}")
+    mtime = max(page["mtime"], semantic_version / 1e9)
+    cached = not_modified(request, etag, mtime)
+    if cached is not None:
+        return cached
+
+    # If this is an episode page, work out which episode
+    is_episode = note_path.startswith("episodes/")
+    episode_name = None
+    is_episode_index = False
+    if is_episode:
+        # Extract episode name from path (e.g., "episodes/Grant Harris/index" -> "Grant Harris")
+        path_parts = note_path.split('/')
+        if len(path_parts) >= 2:
+            episode_name = path_parts[1]
+            # Check if this is the index page (no file after episode name, or explicitly index)
+            is_episode_index = len(path_parts) == 2 or (len(path_parts) == 3 and path_parts[2] == "index")
+
+    flash_messages = get_flashed_messages(request)
+    response = templates.TemplateResponse(
+        "note.html",
+        {
+            "request": request,
+            "title": page["title"],
+            "content": page["html"],
+            "note_path": note_path,
+            "properties": page["properties"],
+            "download_url": page["download_url"],
+            "is_text_file": is_text_file,
+            "flash_messages": flash_messages,
+            "is_episode": is_episode,
+            "episode_name": episode_name,
+            "is_episode_index": is_episode_index,
+            "similar_notes": similar_notes_for(full_path),
+        }
+    )
+    return add_validators(response, etag, mtime, cacheable=not flash_messages)
+
+
+def render_note(full_path: Path, note_path: str) -> dict:
+    """
+    Render a note file for the note page.
+
+    Args:
+        full_path: Resolved path of the note file
+        note_path: Path the note was requested under
+
+    Returns:
+        Dict with 'title', 'properties', 'html', 'download_url', 'is_text_file',
+        'hash' (of the file content) and 'mtime'
+    """
     # Check if this is a text file (not markdown)
     is_text_file = full_path.suffix.lower() == '.txt'
     download_url = None
 
     # Read and render content
+    mtime = full_path.stat().st_mtime
     content = full_path.read_text()
 
     # Extract title from frontmatter or first heading
@@ -282,14 +540,14 @@ async def view_note(request: Request, note_path: str):
 
     if is_text_file:
         # For text files, render as preformatted text with download link
-        # Generate download URL pointing to the static episodes mount
+        # Generate download URL pointing to the episode media route
         if note_path.startswith("episodes/"):
             from urllib.parse import quote
             parts = note_path.split('/')
             if len(parts) >= 3:
                 episode_dir = parts[1]
-                filename = parts[-1]
-                download_url = f"/episodes/{quote(episode_dir)}/{quote(filename)}"
+                filename = '/'.join(parts[2:])
+                download_url = f"/episode-media/{quote(episode_dir)}/{quote(filename)}"
 
         # Wrap content in <pre> tags for plain text display
         html_content = f'<pre style="white-space: pre-wrap; word-wrap: break-word;">{content_without_fm}</pre>'
@@ -307,38 +565,49 @@ async def view_note(request: Request, note_path: str):
     html_content = convert_wikilinks(html_content, base_path=base_path)
 
     # If this is an episode page, fix media file links
-    is_episode = note_path.startswith("episodes/")
-    episode_name = None
-    is_episode_index = False
-    if is_episode:
+    if note_path.startswith("episodes/"):
         html_content = fix_episode_media_links(html_content, note_path)
-        # Extract episode name from path (e.g., "episodes/Grant Harris/index" -> "Grant Harris")
-        path_parts = note_path.split('/')
-        if len(path_parts) >= 2:
-            episode_name = path_parts[1]
-            # Check if this is the index page (no file after episode name, or explicitly index)
-            is_episode_index = len(path_parts) == 2 or (len(path_parts) == 3 and path_parts[2] == "index")
 
-    return templates.TemplateResponse(
-        "note.html",
-        {
-            "request": request,
-            "title": title,
-            "content": html_content,
-            "note_path": note_path,
-            "properties": properties,
-            "download_url": download_url,
-            "is_text_file": is_text_file,
-            "flash_messages": get_flashed_messages(request),
-            "is_episode": is_episode,
-            "episode_name": episode_name,
-            "is_episode_index": is_episode_index,
-        }
-    )
+    return {
+        "title": title,
+        "properties": properties,
+        "html": html_content,
+        "download_url": download_url,
+        "is_text_file": is_text_file,
+        "hash": hashlib.sha256(content.encode("utf-8")).hexdigest(),
+        "mtime": mtime,
+    }
+
+
+def render_markdown_file(full_path: Path) -> dict:
+    """
+    Render a markdown file (index or staging note) without note-page link fixing.
+
+    Args:
+        full_path: Path of the markdown file
+
+    Returns:
+        Dict with 'title', 'properties', 'html', 'hash' and 'mtime'
+    """
+    mtime = full_path.stat().st_mtime
+    content = full_path.read_text()
+
+    # Remove frontmatter and convert to HTML
+    content_without_fm = remove_frontmatter(content)
+    html_content = markdown.markdown(content_without_fm, extensions=['extra', 'codehilite'])
+    html_content = convert_wikilinks(html_content, base_path="")
+
+    return {
+        "title": extract_title(content),
+        "properties": extract_frontmatter_properties(content),
+        "html": html_content,
+        "hash": hashlib.sha256(content.encode("utf-8")).hexdigest(),
+        "mtime": mtime,
+    }
 
 
 @app.post("/episode/{episode_name}/rss-link", response_class=HTMLResponse)
-async def rss_link_episode(request: Request, episode_name: str):
+def rss_link_episode(request: Request, episode_name: str):
     """Link an episode to RSS feed data."""
     try:
         from zettelkasten.utils.rss_manager import RSSManager
@@ -393,7 +662,7 @@ async def rss_link_episode(request: Request, episode_name: str):
 
 
 @app.post("/episode/{episode_name}/refresh", response_class=HTMLResponse)
-async def refresh_episode(request: Request, episode_name: str, background_tasks: BackgroundTasks):
+def refresh_episode(request: Request, episode_name: str, background_tasks: BackgroundTasks):
     """Full refresh of an episode (remove and re-import)."""
     try:
         from zettelkasten.utils.episode_manager import EpisodeManager
@@ -441,7 +710,7 @@ async def refresh_episode(request: Request, episode_name: str, background_tasks:
 
 
 @app.post("/episode/{episode_name}/remove", response_class=HTMLResponse)
-async def remove_episode(request: Request, episode_name: str, background_tasks: BackgroundTasks):
+def remove_episode(request: Request, episode_name: str, background_tasks: BackgroundTasks):
     """Remove episode from index (keeps files intact)."""
     try:
         # Find episode directory
@@ -496,7 +765,7 @@ async def workflow_interview_questions(request: Request):
 
 
 @app.post("/workflows/interview-questions", response_class=HTMLResponse)
-async def generate_interview_questions_workflow(
+def generate_interview_questions_workflow(
     request: Request,
     guest_name: str = Form(...),
 ):
@@ -598,88 +867,210 @@ async def add_url_form(request: Request, error: Optional[str] = None):
 
 
 @app.post("/add-url", response_class=HTMLResponse)
-async def add_url_submit(request: Request, url: str = Form(...), force: Optional[str] = Form(None)):
-    """Process URL submission."""
+def add_url_submit(request: Request, url: str = Form(...), force: Optional[str] = Form(None)):
+    """Queue a URL for processing and redirect to its job page."""
     force_bool = force == "true"
 
-    try:
-        # Validate API key
-        if not config.anthropic_api_key or config.anthropic_api_key == "your_anthropic_api_key_here":
-            error = "ANTHROPIC_API_KEY not configured. Please add your Anthropic API key to the .env file."
-            return templates.TemplateResponse(
-                "add_url.html",
-                {
-                    "request": request,
-                    "vault_name": config.vault_name,
-                    "error": error,
-                    "active_section": "add-url",
-                }
-            )
-
-        # Create workflow and process URL
-        workflow = AddWorkflow(config)
-        saved_paths = workflow.process_url(url, force=force_bool)
-
-        # Extract relative paths for display
-        file_paths = [str(path.relative_to(config.vault_path)) for path in saved_paths]
-
-        # Try to extract title from first file
-        title = None
-        if saved_paths:
-            try:
-                first_file_content = saved_paths[0].read_text()
-                # Look for title in frontmatter or first heading
-                lines = first_file_content.split('\n')
-                for line in lines:
-                    if line.startswith('title:'):
-                        title = line.split(':', 1)[1].strip()
-                        break
-                    elif line.startswith('# '):
-                        title = line[2:].strip()
-                        break
-            except Exception:
-                pass
-
+    # Validate API key
+    if not config.anthropic_api_key or config.anthropic_api_key == "your_anthropic_api_key_here":
+        error = "ANTHROPIC_API_KEY not configured. Please add your Anthropic API key to the .env file."
         return templates.TemplateResponse(
-            "add_url_result.html",
+            "add_url.html",
             {
                 "request": request,
                 "vault_name": config.vault_name,
-                "url": url,
-                "title": title,
-                "file_count": len(saved_paths),
-                "file_paths": file_paths,
+                "error": error,
                 "active_section": "add-url",
             }
         )
 
-    except ValueError as e:
-        # Show error on the form page
-        return templates.TemplateResponse(
-            "add_url.html",
-            {
-                "request": request,
-                "vault_name": config.vault_name,
-                "error": str(e),
-                "active_section": "add-url",
-            }
+    job_id = add_queue.submit(url.strip(), force=force_bool)
+
+    if "application/json" in request.headers.get("accept", ""):
+        return JSONResponse(
+            {"job_id": job_id, "status_url": f"/jobs/{job_id}/status"}, status_code=202
         )
-    except Exception as e:
-        # Show unexpected errors
-        error = f"Unexpected error: {str(e)}"
+    return RedirectResponse(url=f"/jobs/{job_id}", status_code=303)
+
+
+@app.get("/jobs", response_class=HTMLResponse)
+def view_jobs(request: Request):
+    """List recent /add-url jobs."""
+    jobs = add_queue.list_jobs()
+    return templates.TemplateResponse(
+        "jobs.html",
+        {
+            "request": request,
+            "vault_name": config.vault_name,
+            "jobs": jobs,
+            "active": any(job["status"] in ("queued", "running") for job in jobs),
+            "active_section": "jobs",
+        }
+    )
+
+
+@app.get("/jobs/{job_id}", response_class=HTMLResponse)
+def view_job(request: Request, job_id: str):
+    """Show the status of one job, or its generated notes once it has succeeded."""
+    job = add_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+
+    if job["status"] == "succeeded":
         return templates.TemplateResponse(
-            "add_url.html",
+            "add_url_result.html",
             {
                 "request": request,
                 "vault_name": config.vault_name,
-                "error": error,
+                "url": job["url"],
+                "title": job["title"],
+                "file_count": len(job["files"]),
+                "file_paths": job["files"],
                 "active_section": "add-url",
             }
         )
 
+    return templates.TemplateResponse(
+        "job.html",
+        {
+            "request": request,
+            "vault_name": config.vault_name,
+            "job": job,
+            "active_section": "jobs",
+        }
+    )
+
+
+@app.get("/jobs/{job_id}/status")
+def job_status(job_id: str):
+    """Job status as JSON."""
+    job = add_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+    _, job["progress"] = add_queue.progress(job_id)
+    return job
+
+
+@app.get("/jobs/{job_id}/events")
+async def job_events(request: Request, job_id: str):
+    """
+    Stream a job's progress as Server-Sent Events.
+
+    Starts with a 'snapshot' event (job status and progress so far), then
+    sends 'stage', 'download', 'transcription' and 'llm_call' events as they
+    happen, and a final 'done' event when the job has finished.
+
+    Unlike the other job routes this is async: the stream waits with
+    asyncio.sleep instead of holding a handler thread while the job runs.
+    """
+    job = await run_in_threadpool(add_queue.get, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+
+    def sse(event: str, data: dict, event_id: Optional[int] = None) -> str:
+        lines = [f"event: {event}", f"data: {json.dumps(data, default=str)}"]
+        if event_id is not None:
+            lines.insert(0, f"id: {event_id}")
+        return "\n".join(lines) + "\n\n"
+
+    async def stream():
+        seq, progress = add_queue.progress(job_id)
+        current = await run_in_threadpool(add_queue.get, job_id)
+        yield sse("snapshot", {**current, "progress": progress}, seq)
+        if current["status"] in ("succeeded", "failed"):
+            yield sse("done", {"status": current["status"], "error": current["error"]})
+            return
+
+        idle = 0.0
+        while not await request.is_disconnected():
+            events = add_queue.events_since(job_id, seq)
+            for seq, event, data in events:
+                yield sse(event, data, seq)
+                if event == "done":
+                    return
+
+            if events:
+                idle = 0.0
+            elif idle >= 15:
+                # The job may have finished without us seeing its 'done' event
+                # (e.g. its progress was dropped from memory)
+                current = await run_in_threadpool(add_queue.get, job_id)
+                if current["status"] in ("succeeded", "failed"):
+                    yield sse("done", {"status": current["status"], "error": current["error"]})
+                    return
+                # Comment line keeps proxies from closing an idle connection
+                yield ": keep-alive\n\n"
+                idle = 0.0
+            await asyncio.sleep(0.5)
+            idle += 0.5
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.get("/search", response_class=HTMLResponse)
+def search_notes(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    q: str = "",
+    folder: str = "",
+    page: int = 1,
+):
+    """Full-text search over the vault."""
+    page = max(1, page)
+    started = time.perf_counter()
+    results = []
+    if q.strip():
+        # One extra result tells whether there is a next page
+        results = search_index.search(
+            q,
+            limit=SEARCH_PAGE_SIZE + 1,
+            offset=(page - 1) * SEARCH_PAGE_SIZE,
+            folder=folder or None,
+        )
+    elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+
+    # Catch up with edits made outside the app (at most every
+    # WEB_SEARCH_REFRESH_SECONDS, and never while this request waits)
+    background_tasks.add_task(search_index.refresh, config.web_search_refresh_seconds, False)
+
+    folders = sorted(
+        entry.name for entry in config.vault_path.iterdir()
+        if entry.is_dir() and not entry.name.startswith(".")
+    )
+
+    return templates.TemplateResponse(
+        "search.html",
+        {
+            "request": request,
+            "vault_name": config.vault_name,
+            "query": q,
+            "folder": folder,
+            "folders": folders,
+            "page": page,
+            "has_next": len(results) > SEARCH_PAGE_SIZE,
+            "elapsed_ms": elapsed_ms,
+            "results": [
+                {
+                    "title": result.title,
+                    "path": result.path,
+                    "url": f"/note/{result.path}",
+                    "snippet": html.escape(" ".join(result.snippet.split()))
+                    .replace(MATCH_START, "<mark>")
+                    .replace(MATCH_END, "</mark>"),
+                }
+                for result in results[:SEARCH_PAGE_SIZE]
+            ],
+            "active_section": "search",
+        }
+    )
+
 
 @app.get("/episodes", response_class=HTMLResponse)
-async def view_episodes(request: Request):
+def view_episodes(request: Request):
     """View episodes landing page."""
     from zettelkasten.utils.episode_manager import EpisodeManager
 
@@ -739,7 +1130,7 @@ async def view_episodes(request: Request):
 
 
 @app.post("/episodes/import", response_class=HTMLResponse)
-async def import_episode(
+def import_episode(
     request: Request,
     background_tasks: BackgroundTasks,
     episode_dir: str = Form(...),
@@ -794,7 +1185,7 @@ async def import_episode(
 
 
 @app.get("/staging", response_class=HTMLResponse)
-async def view_staging(request: Request):
+def view_staging(request: Request):
     """View files in staging area."""
 
     staging_path = config.get_staging_path()
@@ -827,7 +1218,7 @@ async def view_staging(request: Request):
 
 
 @app.get("/staging/view/{file_path:path}", response_class=HTMLResponse)
-async def view_staging_file(request: Request, file_path: str):
+def view_staging_file(request: Request, file_path: str):
     """View a specific file in staging area."""
     staging_path = config.get_staging_path()
     full_path = staging_path / file_path
@@ -835,33 +1226,28 @@ async def view_staging_file(request: Request, file_path: str):
     if not full_path.exists() or not full_path.is_file():
         raise HTTPException(status_code=404, detail="File not found in staging")
 
-    # Read file content
-    content = full_path.read_text()
-    title = extract_title(content)
+    page = render_cache.get_or_render(full_path, lambda: render_markdown_file(full_path))
+    etag = page_etag(page, variant=f"staging:{file_path}")
+    cached = not_modified(request, etag, page["mtime"])
+    if cached is not None:
+        return cached
 
-    # Extract properties
-    properties = extract_frontmatter_properties(content)
-
-    # Remove frontmatter and convert to HTML
-    content_without_fm = remove_frontmatter(content)
-    html_content = markdown.markdown(content_without_fm, extensions=['extra', 'codehilite'])
-    html_content = convert_wikilinks(html_content, base_path="")
-
-    return templates.TemplateResponse(
+    response = templates.TemplateResponse(
         "staging_file.html",
         {
             "request": request,
-            "title": title,
+            "title": page["title"],
             "file_path": file_path,
-            "content": html_content,
-            "properties": properties,
+            "content": page["html"],
+            "properties": page["properties"],
             "active_section": "staging",
         }
     )
+    return add_validators(response, etag, page["mtime"])
 
 
 @app.get("/staging/edit/{file_path:path}", response_class=HTMLResponse)
-async def edit_staging_file_form(request: Request, file_path: str):
+def edit_staging_file_form(request: Request, file_path: str):
     """Show edit form for staging file."""
     staging_path = config.get_staging_path()
     full_path = staging_path / file_path
@@ -886,7 +1272,7 @@ async def edit_staging_file_form(request: Request, file_path: str):
 
 
 @app.post("/staging/edit/{file_path:path}", response_class=HTMLResponse)
-async def edit_staging_file_save(request: Request, file_path: str, content: str = Form(...)):
+def edit_staging_file_save(request: Request, file_path: str, content: str = Form(...)):
     """Save edited staging file."""
     staging_path = config.get_staging_path()
     full_path = staging_path / file_path
@@ -897,6 +1283,10 @@ async def edit_staging_file_save(request: Request, file_path: str, content: str
     try:
         # Write the updated content
         full_path.write_text(content)
+        try:
+            search_index.update_files([full_path])
+        except Exception:
+            pass  # The next refresh catches up
 
         # Redirect back to view
         return RedirectResponse(url=f"/staging/view/{file_path}", status_code=303)
@@ -917,7 +1307,7 @@ async def edit_staging_file_save(request: Request, file_path: str, content: str
 
 
 @app.post("/staging/approve/{file_path:path}")
-async def approve_staging_file(request: Request, file_path: str, background_tasks: BackgroundTasks):
+def approve_staging_file(request: Request, file_path: str, background_tasks: BackgroundTasks):
     """Approve and move a single staging file to vault."""
     import shutil
 
@@ -996,7 +1386,7 @@ async def approve_staging_file(request: Request, file_path: str, background_task
 
 
 @app.post("/staging/delete/{file_path:path}")
-async def delete_staging_file(file_path: str):
+def delete_staging_file(file_path: str):
     """Delete a staging file."""
     staging_path = config.get_staging_path()
     full_path = staging_path / file_path
@@ -1026,7 +1416,7 @@ async def create_note_form(request: Request, error: Optional[str] = None):
 
 
 @app.post("/create-note", response_class=HTMLResponse)
-async def create_note_submit(
+def create_note_submit(
     request: Request,
     background_tasks: BackgroundTasks,
     title: str = Form(...),
@@ -1270,46 +1660,6 @@ def remove_frontmatter(content: str) -> str:
     return content
 
 
-def extract_tags_from_frontmatter(content: str) -> List[str]:
-    """Extract tags from YAML frontmatter."""
-    import re
-
-    # Match YAML frontmatter between --- delimiters
-    match = re.match(r'^---\s*\n(.*?)\n---', content, re.DOTALL)
-    if not match:
-        return []
-
-    frontmatter_text = match.group(1)
-    tags = []
-
-    # Parse YAML - handle both simple key: value and list formats
-    lines = frontmatter_text.split('\n')
-    in_tags = False
-
-    for line in lines:
-        # Check if this is the tags key
-        if line.startswith('tags:'):
-            value = line.split(':', 1)[1].strip()
-            if value:
-                # Inline format: tags: [tag1, tag2] or tags: tag1, tag2
-                value_clean = value.strip('[]')
-                tags = [t.strip() for t in value_clean.split(',') if t.strip()]
-                return tags
-            else:
-                # List format starts on next lines
-                in_tags = True
-        elif in_tags:
-            if line.startswith('  - '):
-                # List item
-                tag = line.strip()[2:].strip()
-                tags.append(tag)
-            elif line and not line.startswith(' '):
-                # End of tags list
-                break
-
-    return tags
-
-
 def extract_title(content: str) -> str:
     """Extract title from markdown content."""
     import re
@@ -1363,10 +1713,13 @@ def convert_wikilinks(html: str, base_path: str = "") -> str:
     return re.sub(pattern, replace_wikilink, html)
 
 
-@app.get("/episode-media/{episode_name}/{file_path:path}")
-async def serve_episode_media(episode_name: str, file_path: str):
+@app.api_route("/episode-media/{episode_name}/{file_path:path}", methods=["GET", "HEAD"])
+def serve_episode_media(request: Request, episode_name: str, file_path: str):
     """
     Serve media files from episode directories, searching all configured episode paths.
+
+    Files are streamed from disk and byte-range requests are supported, so
+    players can seek in long recordings without downloading them.
     """
     # Search for the episode in all configured directories
     episode_path = config.find_episode_path(episode_name)
@@ -1374,14 +1727,16 @@ async def serve_episode_media(episode_name: str, file_path: str):
     if episode_path is None:
         raise HTTPException(status_code=404, detail=f"Episode directory not found: {episode_name}")
 
-    # Construct full file path
-    full_file_path = episode_path / file_path
+    # Construct full file path (and refuse paths escaping the episode directory)
+    full_file_path = Path(os.path.normpath(episode_path / file_path))
+    if not full_file_path.is_relative_to(os.path.normpath(episode_path)):
+        raise HTTPException(status_code=404, detail=f"File not found: {file_path}")
 
     if not full_file_path.exists() or not full_file_path.is_file():
         raise HTTPException(status_code=404, detail=f"File not found: {file_path}")
 
-    # Serve the file
-    return FileResponse(full_file_path)
+    # Stream the file (with Range support)
+    return media_response(request, full_file_path)
 
 
 def fix_episode_media_links(html: str, note_path: str) -> str:
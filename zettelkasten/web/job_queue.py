@@ -0,0 +1,305 @@
+"""Background processing of URLs submitted through the web UI.
+
+Adding a URL takes minutes (download, Whisper, several Claude calls), so
+request handlers only record a job and return its id. A small pool of worker
+threads runs the jobs through AddWorkflow, and their status is kept in a
+SQLite table so the /jobs page survives restarts. Jobs that were queued or
+running when the server stopped are picked up again on the next start (and,
+thanks to the add checkpoints, resume after their last completed stage).
+
+While a job runs, progress events from the workflow (download bytes, audio
+transcribed, Claude calls) are kept in memory for /jobs/<id>/events to stream.
+"""
+
+import json
+import queue
+import sqlite3
+import threading
+import time
+import uuid
+from collections import deque
+from contextlib import closing
+from typing import Any, Dict, List, Optional, Tuple
+
+from zettelkasten.core.config import Config
+from zettelkasten.core.progress import reporting
+
+
+# Job statuses
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+# Frequent events (download, transcription) are recorded at most this often (seconds)
+PROGRESS_INTERVAL = 0.5
+# Recent events kept per job for streaming; late subscribers get a snapshot instead
+MAX_EVENTS = 200
+# Jobs whose progress is kept in memory
+MAX_TRACKED_JOBS = 50
+
+
+class AddJobQueue:
+    """Persisted queue of /add-url jobs processed by a pool of worker threads."""
+
+    def __init__(self, config: Config, workers: int = 1):
+        """
+        Initialize the queue (call start() to begin processing).
+
+        Args:
+            config: Application configuration
+            workers: Number of URLs processed at once
+        """
+        self.config = config
+        self.workers = max(1, workers)
+        self.db_path = config.get_cache_path() / "web_jobs.sqlite3"
+        self._queue: "queue.Queue[str]" = queue.Queue()
+        self._threads: List[threading.Thread] = []
+        self._start_lock = threading.Lock()
+        # job id -> {"seq", "events", "state", "last"} for jobs run by this process
+        self._progress: Dict[str, Dict[str, Any]] = {}
+        self._progress_lock = threading.Lock()
+
+    def start(self) -> None:
+        """Start the worker threads and re-queue jobs left over from a previous run."""
+        with self._start_lock:
+            if self._threads:
+                return
+
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "UPDATE jobs SET status = ? WHERE status = ?",
+                    (QUEUED, RUNNING),
+                )
+                leftover = [
+                    row["id"]
+                    for row in conn.execute(
+                        "SELECT id FROM jobs WHERE status = ? ORDER BY created_at", (QUEUED,)
+                    )
+                ]
+            for job_id in leftover:
+                self._queue.put(job_id)
+
+            for i in range(self.workers):
+                thread = threading.Thread(target=self._worker, name=f"add-job-{i}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def submit(self, url: str, force: bool = False) -> str:
+        """
+        Queue a URL for processing.
+
+        Submitting a URL that is already queued or running returns the
+        existing job instead of processing it twice.
+
+        Args:
+            url: URL to add
+            force: Force reprocessing even if already exists
+
+        Returns:
+            Job id
+        """
+        with closing(self._connect()) as conn, conn:
+            row = conn.execute(
+                "SELECT id FROM jobs WHERE url = ? AND status IN (?, ?)", (url, QUEUED, RUNNING)
+            ).fetchone()
+            if row is not None:
+                return row["id"]
+
+            job_id = uuid.uuid4().hex[:12]
+            conn.execute(
+                "INSERT INTO jobs (id, url, force, status, created_at) VALUES (?, ?, ?, ?, ?)",
+                (job_id, url, int(force), QUEUED, time.time()),
+            )
+
+        self._queue.put(job_id)
+        return job_id
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a job.
+
+        Args:
+            job_id: Job id from submit
+
+        Returns:
+            Job dict (see _to_dict), or None if there is no such job
+        """
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._to_dict(row) if row else None
+
+    def list_jobs(self, limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        List the most recent jobs, newest first.
+
+        Args:
+            limit: Maximum number of jobs
+
+        Returns:
+            List of job dicts
+        """
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT * FROM jobs ORDER BY created_at DESC LIMIT ?", (limit,)
+            ).fetchall()
+        return [self._to_dict(row) for row in rows]
+
+    def progress(self, job_id: str) -> Tuple[int, Dict[str, Any]]:
+        """
+        Get the current progress of a job.
+
+        Args:
+            job_id: Job id
+
+        Returns:
+            Tuple of (sequence number of the latest event, progress state); the
+            state has 'stage', 'download', 'transcription' and 'llm_calls' keys
+            once the corresponding events have been seen
+        """
+        with self._progress_lock:
+            progress = self._progress.get(job_id)
+            if progress is None:
+                return 0, {}
+            return progress["seq"], json.loads(json.dumps(progress["state"]))
+
+    def events_since(self, job_id: str, after: int) -> List[Tuple[int, str, Dict[str, Any]]]:
+        """
+        Get the progress events of a job newer than a sequence number.
+
+        Args:
+            job_id: Job id
+            after: Sequence number of the last event already seen
+
+        Returns:
+            List of (sequence number, event name, data), oldest first
+        """
+        with self._progress_lock:
+            progress = self._progress.get(job_id)
+            if progress is None:
+                return []
+            return [event for event in progress["events"] if event[0] > after]
+
+    def _emit(self, job_id: str, event: str, data: Dict[str, Any]) -> None:
+        """Record a progress event for a job (rate-limiting frequent ones)."""
+        now = time.monotonic()
+        with self._progress_lock:
+            progress = self._progress.get(job_id)
+            if progress is None:
+                if len(self._progress) >= MAX_TRACKED_JOBS:
+                    # Forget the job that started longest ago
+                    self._progress.pop(next(iter(self._progress)))
+                progress = self._progress[job_id] = {
+                    "seq": 0, "events": deque(maxlen=MAX_EVENTS), "state": {}, "last": {}
+                }
+            state = progress["state"]
+
+            if event == "llm_call":
+                state["llm_calls"] = state.get("llm_calls", 0) + 1
+                state["llm_cached"] = state.get("llm_cached", 0) + int(data.get("cached", False))
+                data = {"calls": state["llm_calls"], "cached": state["llm_cached"]}
+            else:
+                state[event] = data
+                if event in ("download", "transcription"):
+                    if event == "download":
+                        final = data.get("finished", False)
+                    else:
+                        final = data.get("done") == data.get("total")
+                    if not final and now - progress["last"].get(event, 0.0) < PROGRESS_INTERVAL:
+                        return
+                    progress["last"][event] = now
+
+            progress["seq"] += 1
+            progress["events"].append((progress["seq"], event, data))
+
+    def _set_stage(self, job_id: str, stage: str, **fields: Any) -> None:
+        """Record the stage a running job has reached."""
+        self._update(job_id, stage=stage, **fields)
+        self._emit(job_id, "stage", {"stage": stage})
+
+    def _worker(self) -> None:
+        """Process queued jobs until the process exits."""
+        from zettelkasten.core.workflow import AddWorkflow
+
+        workflow = None
+        while True:
+            job_id = self._queue.get()
+            job = self.get(job_id)
+            if job is None or job["status"] != QUEUED:
+                continue
+
+            # A job interrupted by a restart resumes from its checkpoints even if forced
+            restart = job["force"] and job["started_at"] is None
+            self._update(job_id, status=RUNNING, started_at=time.time())
+            try:
+                with reporting(lambda event, data: self._emit(job_id, event, data)):
+                    if workflow is None:
+                        workflow = AddWorkflow(self.config)
+                    # The stage methods rather than process_url: its console progress
+                    # display can't run in several threads at once
+                    self._set_stage(job_id, "Downloading/extracting content")
+                    content = workflow.fetch_content(job["url"], force=job["force"], restart=restart)
+                    self._set_stage(job_id, "Getting text content", title=content.title)
+                    text_content = workflow.get_text(content)
+                    self._set_stage(job_id, "Extracting concepts and creating notes")
+                    saved_paths = workflow.create_notes(content, text_content, job["url"])
+            except Exception as e:
+                self._update(job_id, status=FAILED, error=str(e), finished_at=time.time())
+                self._emit(job_id, "done", {"status": FAILED, "error": str(e)})
+                continue
+
+            files = [str(path.relative_to(self.config.vault_path)) for path in saved_paths]
+            self._update(
+                job_id,
+                status=SUCCEEDED,
+                stage=None,
+                files=json.dumps(files),
+                finished_at=time.time(),
+            )
+            self._emit(job_id, "done", {"status": SUCCEEDED, "files": files})
+
+    def _update(self, job_id: str, **fields: Any) -> None:
+        """Update columns of a job."""
+        assignments = ", ".join(f"{name} = ?" for name in fields)
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                f"UPDATE jobs SET {assignments} WHERE id = ?", (*fields.values(), job_id)
+            )
+
+    @staticmethod
+    def _to_dict(row: sqlite3.Row) -> Dict[str, Any]:
+        """Convert a job row to a dict (with 'force' as bool, 'files' as a list and 'elapsed')."""
+        job = dict(row)
+        job["force"] = bool(job["force"])
+        job["files"] = json.loads(job["files"]) if job["files"] else []
+        if job["started_at"]:
+            job["elapsed"] = (job["finished_at"] or time.time()) - job["started_at"]
+        else:
+            job["elapsed"] = None
+        return job
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection, creating the schema if needed."""
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                force INTEGER NOT NULL DEFAULT 0,
+                status TEXT NOT NULL,
+                stage TEXT,
+                title TEXT,
+                files TEXT,
+                error TEXT,
+                created_at REAL NOT NULL,
+                started_at REAL,
+                finished_at REAL
+            )
+            """
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS jobs_created ON jobs (created_at)")
+        return conn
+
@@ -0,0 +1,141 @@
+"""Streaming file responses with HTTP Range support for episode media.
+
+Episode audio and video can be gigabytes. Files are streamed from disk in
+fixed-size chunks (memory per response stays flat), and single byte-range
+requests are answered with 206 Partial Content so the browser's player can
+seek without downloading the whole file.
+"""
+
+import mimetypes
+import os
+import re
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+from typing import Iterator, Optional, Tuple
+
+from fastapi import Request
+from fastapi.responses import Response, StreamingResponse
+
+
+# Bytes read from disk per chunk
+CHUNK_SIZE = 256 * 1024
+
+_RANGE_PATTERN = re.compile(r"^\s*bytes\s*=\s*(\d*)\s*-\s*(\d*)\s*$", re.IGNORECASE)
+
+
+def media_response(request: Request, path: Path) -> Response:
+    """
+    Serve a file, honoring a Range header.
+
+    Args:
+        request: Incoming request (GET or HEAD)
+        path: File to serve
+
+    Returns:
+        200 with the whole file, 206 with the requested range, or 416 if the
+        range can't be satisfied
+    """
+    stat = path.stat()
+    size = stat.st_size
+    etag = f'"{stat.st_mtime_ns:x}-{size:x}"'
+    last_modified = formatdate(stat.st_mtime, usegmt=True)
+    media_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+
+    headers = {
+        "Accept-Ranges": "bytes",
+        "ETag": etag,
+        "Last-Modified": last_modified,
+    }
+
+    byte_range = None
+    range_header = request.headers.get("range")
+    if range_header and _if_range_matches(request.headers.get("if-range"), etag, stat.st_mtime):
+        try:
+            byte_range = parse_range(range_header, size)
+        except ValueError:
+            return Response(
+                status_code=416, headers={**headers, "Content-Range": f"bytes */{size}"}
+            )
+
+    if byte_range is None:
+        start, end, status_code = 0, size - 1, 200
+    else:
+        (start, end), status_code = byte_range, 206
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    headers["Content-Length"] = str(max(0, end - start + 1))
+
+    if request.method == "HEAD":
+        return Response(status_code=status_code, headers=headers, media_type=media_type)
+
+    return StreamingResponse(
+        _read_range(path, start, end),
+        status_code=status_code,
+        headers=headers,
+        media_type=media_type,
+    )
+
+
+def parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a Range header into an inclusive (start, end) byte range.
+
+    Args:
+        header: Range header value, e.g. "bytes=0-1023", "bytes=1024-" or "bytes=-500"
+        size: File size
+
+    Returns:
+        (start, end), or None to ignore the header and send the whole file
+        (multiple ranges, an unsupported unit or an invalid range such as
+        "bytes=5-3", which RFC 7233 says to ignore)
+
+    Raises:
+        ValueError: If the range can't be satisfied
+    """
+    if "," in header or not header.strip().lower().startswith("bytes"):
+        return None
+
+    match = _RANGE_PATTERN.match(header)
+    if not match:
+        return None
+    first, last = match.groups()
+
+    if not first:
+        # Suffix range: the last N bytes (none exist in an empty file)
+        if not last or int(last) == 0 or size == 0:
+            raise ValueError("Empty suffix range")
+        return max(0, size - int(last)), size - 1
+
+    start = int(first)
+    if last and int(last) < start:
+        # Syntactically invalid byte-range-spec: ignored, not unsatisfiable
+        return None
+    if start >= size:
+        raise ValueError("Range not satisfiable")
+    end = min(int(last), size - 1) if last else size - 1
+    return start, end
+
+
+def _if_range_matches(if_range: Optional[str], etag: str, mtime: float) -> bool:
+    """Whether a Range request applies (no If-Range, or If-Range matches the current file)."""
+    if not if_range:
+        return True
+    if_range = if_range.strip()
+    if if_range.startswith(('"', "W/")):
+        return if_range == etag
+    try:
+        return int(mtime) <= parsedate_to_datetime(if_range).timestamp()
+    except (TypeError, ValueError):
+        return False
+
+
+def _read_range(path: Path, start: int, end: int) -> Iterator[bytes]:
+    """Yield bytes start..end (inclusive) of a file in CHUNK_SIZE pieces."""
+    remaining = end - start + 1
+    with open(path, "rb") as f:
+        f.seek(start, os.SEEK_SET)
+        while remaining > 0:
+            chunk = f.read(min(CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
@@ -0,0 +1,105 @@
+"""In-memory LRU cache of rendered note pages.
+
+Rendering a note (frontmatter parsing, markdown with codehilite, wikilink
+and media link rewriting) is the expensive part of a page view, and for
+long notes and transcripts it dominates. Rendered results are cached per
+file and reused as long as the file's mtime and size are unchanged, so a
+repeat view costs a stat call. The least recently viewed entries are
+evicted once the cache exceeds its memory budget.
+"""
+
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class RenderCache:
+    """Thread-safe LRU cache of rendered pages keyed by file and validated by (mtime, size)."""
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes: Approximate memory budget for cached pages (0 disables caching)
+        """
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, Tuple[Tuple[int, int], Dict[str, Any], int]]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_render(
+        self,
+        path: Path,
+        render: Callable[[], Dict[str, Any]],
+        variant: Hashable = None,
+    ) -> Dict[str, Any]:
+        """
+        Get the rendered page for a file, rendering it if missing or stale.
+
+        Args:
+            path: File the page is rendered from
+            render: Renders the page; returns a dict of strings/simple values
+            variant: Extra key part when the same file renders differently
+                     (e.g. depending on the URL it was requested under)
+
+        Returns:
+            The rendered page dict (shared; don't modify it)
+        """
+        stat = path.stat()
+        validator = (stat.st_mtime_ns, stat.st_size)
+        key = (str(path), variant)
+
+        cached = self._lookup(key, validator)
+        if cached is not None:
+            return cached
+
+        page = render()
+        self._store(key, validator, page)
+        return page
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _lookup(self, key: Hashable, validator: Tuple[int, int]) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != validator:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def _store(self, key: Hashable, validator: Tuple[int, int], page: Dict[str, Any]) -> None:
+        size = _estimate_size(page)
+        if not self.max_bytes or size > self.max_bytes:
+            return
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= old[2]
+            self._entries[key] = (validator, page, size)
+            self._size += size
+
+            while self._size > self.max_bytes:
+                _, (_, _, evicted_size) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+
+
+def _estimate_size(value: Any) -> int:
+    """Rough memory footprint of a rendered page (string lengths dominate)."""
+    if isinstance(value, str):
+        return len(value) + 50
+    if isinstance(value, dict):
+        return sum(_estimate_size(k) + _estimate_size(v) for k, v in value.items()) + 100
+    if isinstance(value, (list, tuple)):
+        return sum(_estimate_size(v) for v in value) + 50
+    return 50